@@ -1,29 +1,37 @@
+import sys
 import textwrap
 from abc import ABC, abstractclassmethod, abstractproperty
-from datetime import datetime
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from itertools import count, islice
+
+TAMANHO_PAGINA = 10
 
 
 class ContasIterador:
-    def __init__(self, contas):
-        self.contas = contas
-        self._index = 0
+    """Visão ordenável e paginada das contas, iterando pelas linhas já renderizadas.
+
+    Aceita índice e fatia (``contas[1000:2000]``); ``paginas`` junta as linhas
+    de cada página em um único texto, pronto para uma só escrita no terminal.
+    """
+
+    def __init__(self, contas, chave=None, reverso=False):
+        self.contas = contas if chave is None else sorted(contas, key=chave, reverse=reverso)
+
+    def __len__(self):
+        return len(self.contas)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return ContasIterador(self.contas[indice])
+        return self.contas[indice].linha_listagem()
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        try:
-            conta = self.contas[self._index]
-            return f"""\
-            Agência:\t{conta.agencia}
-            Número:\t\t{conta.numero}
-            Titular:\t{conta.cliente.nome}
-            Saldo:\t\tR$ {conta.saldo:.2f}
-        """
-        except IndexError:
-            raise StopIteration
-        finally:
-            self._index += 1
+        return (conta.linha_listagem() for conta in self.contas)
+
+    def paginas(self, tamanho=TAMANHO_PAGINA):
+        for inicio in range(0, len(self.contas), tamanho):
+            yield "".join(self[inicio : inicio + tamanho])
 
 
 class Cliente:
@@ -31,9 +39,10 @@ class Cliente:
         self.endereco = endereco
         self.contas = []
         self.indice_conta = 0
+        self._contas_por_chave = {}  # (agencia, numero) -> conta
 
     def realizar_transacao(self, conta, transacao):
-        if len(conta.historico.transacoes_do_dia()) >= 2:
+        if conta.historico.quantidade_transacoes_do_dia() >= 2:
             print("\n@@@ Você excedeu o número de transações permitidas para hoje! @@@")
             return
 
@@ -41,6 +50,10 @@ class Cliente:
 
     def adicionar_conta(self, conta):
         self.contas.append(conta)
+        self._contas_por_chave[(conta.agencia, conta.numero)] = conta
+
+    def buscar_conta(self, numero, agencia="0001"):
+        return self._contas_por_chave.get((agencia, numero))
 
 
 class PessoaFisica(Cliente):
@@ -58,6 +71,7 @@ class Conta:
         self._agencia = "0001"
         self._cliente = cliente
         self._historico = Historico()
+        self._linha = None
 
     @classmethod
     def nova_conta(cls, cliente, numero):
@@ -83,6 +97,16 @@ class Conta:
     def historico(self):
         return self._historico
 
+    def linha_listagem(self):
+        # Texto da listagem em cache, refeito só quando o saldo muda
+        if self._linha is None or self._linha[0] != self._saldo:
+            self._linha = (
+                self._saldo,
+                f"{'=' * 100}\nAgência:\t{self.agencia}\nNúmero:\t\t{self.numero}\n"
+                f"Titular:\t{self.cliente.nome}\nSaldo:\t\tR$ {self._saldo:.2f}\n\n",
+            )
+        return self._linha[1]
+
     def sacar(self, valor):
         saldo = self.saldo
         excedeu_saldo = valor > saldo
@@ -122,9 +146,7 @@ class ContaCorrente(Conta):
         return cls(numero, cliente, limite, limite_saques)
 
     def sacar(self, valor):
-        numero_saques = len(
-            [transacao for transacao in self.historico.transacoes if transacao["tipo"] == Saque.__name__]
-        )
+        numero_saques = self.historico.quantidade_transacoes_do_dia(Saque.__name__)
 
         excedeu_limite = valor > self._limite
         excedeu_saques = numero_saques >= self._limite_saques
@@ -151,33 +173,85 @@ class ContaCorrente(Conta):
 class Historico:
     def __init__(self):
         self._transacoes = []
+        self._datas = []
+        self._data_contagem = None
+        self._contagem_do_dia = {}
 
     @property
     def transacoes(self):
         return self._transacoes
 
     def adicionar_transacao(self, transacao):
+        agora = datetime.now()
+        if self._datas and agora < self._datas[-1]:
+            # Mantém o índice de datas ordenado mesmo se o relógio voltar
+            agora = self._datas[-1]
+
+        tipo = transacao.__class__.__name__
         self._transacoes.append(
             {
-                "tipo": transacao.__class__.__name__,
+                "tipo": tipo,
                 "valor": transacao.valor,
-                "data": datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
+                "data": agora,
             }
         )
+        self._datas.append(agora)
+
+        contagem = self._contagem_atual(agora.date())
+        contagem[tipo] = contagem.get(tipo, 0) + 1
+
+    def _contagem_atual(self, data):
+        # Contadores do dia corrente; zerados na primeira consulta do dia seguinte
+        if data != self._data_contagem:
+            self._data_contagem = data
+            self._contagem_do_dia = {}
+        return self._contagem_do_dia
+
+    def quantidade_transacoes_do_dia(self, tipo_transacao=None):
+        contagem = self._contagem_atual(datetime.now().date())
+        if tipo_transacao is None:
+            return sum(contagem.values())
+        return contagem.get(tipo_transacao, 0)
+
+    def gerar_relatorio(self, tipo_transacao=None, inicio=None, fim=None, pagina=1, tamanho=TAMANHO_PAGINA):
+        """Gera páginas de até ``tamanho`` transações, começando em ``pagina``.
+
+        O período [inicio, fim) é localizado por busca binária no índice de datas
+        e as transações só são lidas conforme as páginas são consumidas.
+        ``pagina`` e ``tamanho`` menores que 1 lançam ValueError.
+        """
+        if pagina < 1 or tamanho < 1:
+            raise ValueError(f"página e tamanho devem ser positivos: pagina={pagina}, tamanho={tamanho}")
+        i = 0 if inicio is None else bisect_left(self._datas, inicio)
+        j = len(self._datas) if fim is None else bisect_left(self._datas, fim)
+        pular = (pagina - 1) * tamanho
+        if tipo_transacao is None:
+            transacoes = (self._transacoes[k] for k in range(min(i + pular, j), j))
+        else:
+            tipo_transacao = tipo_transacao.lower()
+            transacoes = (
+                self._transacoes[k]
+                for k in range(i, j)
+                if self._transacoes[k]["tipo"].lower() == tipo_transacao
+            )
+            transacoes = islice(transacoes, pular, None)
+
+        while pagina_atual := list(islice(transacoes, tamanho)):
+            yield pagina_atual
+
+    def transacoes_entre(self, inicio=None, fim=None):
+        # Busca binária no índice de datas: O(log n) para localizar o período
+        i = 0 if inicio is None else bisect_left(self._datas, inicio)
+        j = len(self._datas) if fim is None else bisect_left(self._datas, fim)
+        return self._transacoes[i:j]
 
-    def gerar_relatorio(self, tipo_transacao=None):
-        for transacao in self._transacoes:
-            if tipo_transacao is None or transacao["tipo"].lower() == tipo_transacao.lower():
-                yield transacao
+    def transacoes_desde(self, inicio):
+        return self.transacoes_entre(inicio=inicio)
 
-    def transacoes_do_dia(self):
-        data_atual = datetime.utcnow().date()
-        transacoes = []
-        for transacao in self._transacoes:
-            data_transacao = datetime.strptime(transacao["data"], "%d-%m-%Y %H:%M:%S").date()
-            if data_atual == data_transacao:
-                transacoes.append(transacao)
-        return transacoes
+    def transacoes_do_dia(self, data=None):
+        data = data or datetime.now().date()
+        inicio = datetime.combine(data, datetime.min.time())
+        return self.transacoes_entre(inicio, inicio + timedelta(days=1))
 
 
 class Transacao(ABC):
@@ -255,8 +329,14 @@ def recuperar_conta_cliente(cliente):
         print("\n@@@ Cliente não possui conta! @@@")
         return
 
-    # FIXME: não permite cliente escolher a conta
-    return cliente.contas[0]
+    if len(cliente.contas) == 1:
+        return cliente.contas[0]
+
+    numero = input("Informe o número da conta: ").strip()
+    conta = cliente.buscar_conta(int(numero)) if numero.isdecimal() else None
+    if not conta:
+        print("\n@@@ Conta não encontrada! @@@")
+    return conta
 
 
 @log_transacao
@@ -311,16 +391,16 @@ def exibir_extrato(clientes):
         return
 
     print("\n================ EXTRATO ================")
-    extrato = ""
-    tem_transacao = False
-    for transacao in conta.historico.gerar_relatorio():
-        tem_transacao = True
-        extrato += f'\n{transacao["tipo"]}:\n\tR$ {transacao["valor"]:.2f}'
-
-    if not tem_transacao:
-        extrato = "Não foram realizadas movimentações"
-
-    print(extrato)
+    paginas = conta.historico.gerar_relatorio()
+    pagina = next(paginas, None)
+    if pagina is None:
+        print("Não foram realizadas movimentações")
+
+    while pagina is not None:
+        print("".join(f'\n{t["tipo"]}:\n\tR$ {t["valor"]:.2f}' for t in pagina))
+        pagina = next(paginas, None)
+        if pagina is not None and input("\n[Enter] próxima página | [q] encerrar: ").strip().lower() == "q":
+            break
     print(f"\nSaldo:\n\tR$ {conta.saldo:.2f}")
     print("==========================================")
 
@@ -346,7 +426,7 @@ def criar_cliente(clientes):
 
 
 @log_transacao
-def criar_conta(numero_conta, clientes, contas):
+def criar_conta(numeros_conta, clientes, contas):
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
 
@@ -355,22 +435,37 @@ def criar_conta(numero_conta, clientes, contas):
         return
 
     # NOTE: O valor padrão de limite de saques foi alterado para 50 saques
-    conta = ContaCorrente.nova_conta(cliente=cliente, numero=numero_conta, limite=500, limite_saques=50)
-    contas.append(conta)
-    cliente.contas.append(conta)
+    conta = ContaCorrente.nova_conta(cliente=cliente, numero=next(numeros_conta), limite=500, limite_saques=50)
+    contas[(conta.agencia, conta.numero)] = conta
+    cliente.adicionar_conta(conta)
 
     print("\n=== Conta criada com sucesso! ===")
 
 
+ORDENACOES_CONTAS = {
+    "n": None,
+    "s": lambda conta: conta.saldo,
+    "t": lambda conta: conta.cliente.nome,
+}
+
+
 def listar_contas(contas):
-    for conta in ContasIterador(contas):
-        print("=" * 100)
-        print(textwrap.dedent(str(conta)))
+    ordem = input("Ordenar por [n]úmero, [s]aldo ou [t]itular (padrão: número): ").strip().lower()
+    paginas = ContasIterador(list(contas.values()), chave=ORDENACOES_CONTAS.get(ordem)).paginas()
+
+    pagina = next(paginas, None)
+    while pagina is not None:
+        sys.stdout.write(pagina)
+        sys.stdout.flush()
+        pagina = next(paginas, None)
+        if pagina is not None and input("[Enter] próxima página | [q] encerrar: ").strip().lower() == "q":
+            break
 
 
 def main():
     clientes = []
-    contas = []
+    contas = {}  # (agencia, numero) -> conta
+    numeros_conta = count(1)
 
     while True:
         opcao = menu()
@@ -388,8 +483,7 @@ def main():
             criar_cliente(clientes)
 
         elif opcao == "nc":
-            numero_conta = len(contas) + 1
-            criar_conta(numero_conta, clientes, contas)
+            criar_conta(numeros_conta, clientes, contas)
 
         elif opcao == "lc":
             listar_contas(contas)
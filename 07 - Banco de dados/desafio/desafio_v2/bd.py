@@ -1,7 +1,25 @@
+import queue
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from sqlite3 import Connection, Cursor
 
+ROOT_PATH = Path(__file__).parent
+
+
+@dataclass(frozen=True)
+class ConfiguracaoConexao:
+    caminho: Path = ROOT_PATH / "db.sqlite"
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024  # bytes lidos via mmap em vez de read()
+    cache_kib: int = 64 * 1024  # cache de páginas por conexão
+    busy_timeout_ms: int = 5_000
+    tamanho_pool: int = 4
+
 
 def criar_bd(cursor: Cursor) -> None:
     cursor.executescript(
@@ -29,10 +47,89 @@ def criar_bd(cursor: Cursor) -> None:
             faturamento_anual REAL NOT NULL,
             FOREIGN KEY (cliente_id) REFERENCES cliente(id)
         );
+
+        -- Filtro por status (e criado_em) já na ordem de id: a listagem por keyset não ordena nada
+        CREATE INDEX IF NOT EXISTS idx_cliente_status_id ON cliente (status, id, criado_em);
+
+        -- PF e PJ em uma única consulta; cada ramo segue cliente.id (PK ou idx_cliente_status_id)
+        -- e busca o subtipo pela PK, então ORDER BY id vira um merge dos dois ramos, sem ordenação
+        CREATE VIEW IF NOT EXISTS vw_cliente AS
+        SELECT c.id, c.email, c.telefone, c.status, c.criado_em,
+               'PF' AS tipo, pf.nome AS nome, pf.cpf AS documento, pf.renda_mensal AS valor
+        FROM pessoa_fisica pf INNER JOIN cliente c ON c.id = pf.cliente_id
+        UNION ALL
+        SELECT c.id, c.email, c.telefone, c.status, c.criado_em,
+               'PJ', pj.nome_fantasia, pj.cnpj, pj.faturamento_anual
+        FROM pessoa_juridica pj INNER JOIN cliente c ON c.id = pj.cliente_id;
                    """
     )
 
 
-def criar_conexao() -> Connection:
-    ROOT_PATH = Path(__file__).parent
-    return sqlite3.connect(ROOT_PATH / "db.sqlite")
+def criar_conexao(config: ConfiguracaoConexao = ConfiguracaoConexao(), **opcoes) -> Connection:
+    """Abre uma conexão já ajustada (WAL, synchronous, mmap, cache e busy_timeout)."""
+    conexao = sqlite3.connect(config.caminho, **opcoes)
+    conexao.execute(f"PRAGMA journal_mode = {config.journal_mode};")
+    conexao.execute(f"PRAGMA synchronous = {config.synchronous};")
+    conexao.execute(f"PRAGMA mmap_size = {int(config.mmap_size)};")
+    conexao.execute(f"PRAGMA cache_size = {-int(config.cache_kib)};")
+    conexao.execute(f"PRAGMA busy_timeout = {int(config.busy_timeout_ms)};")
+    return conexao
+
+
+def fechar_conexao(conexao: Connection) -> None:
+    """Atualiza as estatísticas do planejador que estiverem defasadas e fecha a conexão."""
+    conexao.execute("PRAGMA optimize;")
+    conexao.close()
+
+
+class PoolConexoes:
+    """Pool pequeno de conexões ajustadas, emprestadas a uma thread por vez.
+
+    ``conexao()`` empresta uma conexão livre (ou abre uma nova, até
+    ``tamanho_pool``; acima disso espera uma ser devolvida) e a devolve ao
+    sair do bloco. Dentro do bloco, novas chamadas na mesma thread recebem
+    a mesma conexão.
+    """
+
+    def __init__(self, config: ConfiguracaoConexao = ConfiguracaoConexao()) -> None:
+        self.config = config
+        self._livres = queue.LifoQueue()
+        self._criadas = 0
+        self._trava = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def conexao(self) -> Iterator[Connection]:
+        emprestada = getattr(self._local, "conexao", None)
+        if emprestada is not None:
+            yield emprestada
+            return
+
+        conexao = self._obter()
+        self._local.conexao = conexao
+        try:
+            yield conexao
+        finally:
+            self._local.conexao = None
+            self._livres.put(conexao)
+
+    def _obter(self) -> Connection:
+        try:
+            return self._livres.get_nowait()
+        except queue.Empty:
+            pass
+        with self._trava:
+            if self._criadas < self.config.tamanho_pool:
+                self._criadas += 1
+                # Cada conexão passa por várias threads, mas só uma a usa por vez
+                return criar_conexao(self.config, check_same_thread=False)
+        return self._livres.get()
+
+    def fechar(self) -> None:
+        while True:
+            try:
+                conexao = self._livres.get_nowait()
+            except queue.Empty:
+                break
+            fechar_conexao(conexao)
+            self._criadas -= 1
@@ -0,0 +1,123 @@
+"""Benchmark da conexão: sqlite3.connect sem ajustes x criar_conexao (PRAGMAs).
+
+Em cópias do mesmo banco com N clientes PF mede:
+- cadastro como o menu faz (INSERT cliente + INSERT pessoa_fisica + commit
+  por cliente);
+- consultas por CPF, em uma thread e em várias threads pelo PoolConexoes.
+
+Uso: python benchmarks/bench_conexao.py [clientes] [cadastros] [consultas]
+"""
+
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from bd import ConfiguracaoConexao, PoolConexoes, criar_bd, criar_conexao, fechar_conexao  # noqa: E402
+
+CLIENTES = 1_000_000
+CADASTROS = 2_000
+CONSULTAS = 200_000
+THREADS = 4
+TAMANHO_LOTE = 100_000
+
+
+def popular(caminho, quantidade):
+    conexao = sqlite3.connect(caminho)
+    criar_bd(conexao.cursor())
+    for inicio in range(1, quantidade + 1, TAMANHO_LOTE):
+        ids = range(inicio, min(inicio + TAMANHO_LOTE, quantidade + 1))
+        conexao.executemany(
+            "INSERT INTO cliente (id, email, telefone, status) VALUES (?, ?, ?, 'ativo')",
+            ((i, f"cliente{i}@email.com", f"1199{i:07d}") for i in ids),
+        )
+        conexao.executemany(
+            "INSERT INTO pessoa_fisica (cliente_id, nome, cpf, renda_mensal) VALUES (?, ?, ?, 3500.0)",
+            ((i, f"Cliente {i}", f"{i:011d}") for i in ids),
+        )
+        conexao.commit()
+    conexao.close()
+
+
+def cadastrar(conexao, inicio, quantidade):
+    cursor = conexao.cursor()
+    for i in range(inicio, inicio + quantidade):
+        cursor.execute(
+            "INSERT INTO cliente (email, telefone, status) VALUES (?,?,?);",
+            (f"novo{i}@email.com", "11999999999", "ativo"),
+        )
+        cursor.execute(
+            "INSERT INTO pessoa_fisica (cliente_id, nome, cpf, renda_mensal) VALUES (?,?,?,?)",
+            (cursor.lastrowid, f"Novo {i}", f"{i:011d}", 3500.0),
+        )
+        conexao.commit()
+
+
+def consultar(conexao, cpfs):
+    cursor = conexao.cursor()
+    for cpf in cpfs:
+        cursor.execute("SELECT cliente_id FROM pessoa_fisica WHERE cpf = ?;", (cpf,)).fetchone()
+
+
+def consultar_pool(pool, cpfs, threads):
+    def trabalhar(parte):
+        with pool.conexao() as conexao:
+            consultar(conexao, parte)
+
+    trabalhadores = [threading.Thread(target=trabalhar, args=(cpfs[i::threads],)) for i in range(threads)]
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    for trabalhador in trabalhadores:
+        trabalhador.join()
+
+
+def medir(funcao, *argumentos):
+    inicio = perf_counter()
+    funcao(*argumentos)
+    return perf_counter() - inicio
+
+
+def main():
+    clientes = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTES
+    cadastros = int(sys.argv[2]) if len(sys.argv) > 2 else CADASTROS
+    consultas = int(sys.argv[3]) if len(sys.argv) > 3 else CONSULTAS
+    aleatorio = random.Random(0)
+    cpfs = [f"{aleatorio.randint(1, clientes):011d}" for _ in range(consultas)]
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        modelo = Path(diretorio) / "modelo.sqlite"
+        popular(modelo, clientes)
+        print(f"{clientes:,} clientes; {cadastros:,} cadastros com commit; {consultas:,} consultas por CPF")
+        print(f"{'conexão':<34}{'cadastros/s':>14}{'consultas/s':>14}")
+
+        caminho = Path(diretorio) / "padrao.sqlite"
+        shutil.copy(modelo, caminho)
+        conexao = sqlite3.connect(caminho)
+        cadastro = medir(cadastrar, conexao, clientes + 1, cadastros)
+        consulta = medir(consultar, conexao, cpfs)
+        conexao.close()
+        print(f"{'sqlite3.connect (padrão)':<34}{cadastros / cadastro:>14,.0f}{consultas / consulta:>14,.0f}")
+
+        config = ConfiguracaoConexao(caminho=Path(diretorio) / "ajustado.sqlite", tamanho_pool=THREADS)
+        shutil.copy(modelo, config.caminho)
+        conexao = criar_conexao(config)
+        cadastro = medir(cadastrar, conexao, clientes + 1, cadastros)
+        consulta = medir(consultar, conexao, cpfs)
+        fechar_conexao(conexao)
+        print(f"{'criar_conexao (WAL, mmap, cache)':<34}{cadastros / cadastro:>14,.0f}{consultas / consulta:>14,.0f}")
+
+        pool = PoolConexoes(config)
+        consulta = medir(consultar_pool, pool, cpfs, THREADS)
+        pool.fechar()
+        print(f"{f'PoolConexoes, {THREADS} threads':<34}{'':>14}{consultas / consulta:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
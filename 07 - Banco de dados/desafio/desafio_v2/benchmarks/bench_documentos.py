@@ -0,0 +1,108 @@
+"""Benchmark da verificação de documento no cadastro (ClienteServico.filtrar_cliente).
+
+Num banco com N clientes simula uma rajada de cadastros (90% de
+documentos novos, 10% já existentes, alguns repetidos na própria
+rajada) e compara:
+- COUNT(*) por CPF/CNPJ (forma antiga);
+- EXISTS no índice UNIQUE (``filtrar_cliente`` sem cache);
+- EXISTS atrás do CacheDocumentos (LRU + filtro de Bloom), com os
+  contadores de acerto e o tempo de carga do filtro.
+
+Uso: python benchmarks/bench_documentos.py [clientes] [consultas]
+"""
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from bd import ConfiguracaoConexao, criar_bd, criar_conexao  # noqa: E402
+from cache_documentos import CacheDocumentos  # noqa: E402
+from dominio import PessoaFisica, PessoaJuridica  # noqa: E402
+from servico import ClienteServico  # noqa: E402
+
+CLIENTES = 1_000_000
+CONSULTAS = 200_000
+FRACAO_EXISTENTES = 0.1
+
+
+def gerar_clientes(quantidade):
+    for i in range(quantidade):
+        if i % 3:
+            yield PessoaFisica(
+                email="pf@email.com", telefone="1199", status="ativo", nome="Cliente", cpf=f"{2 * i:011d}",
+                renda_mensal=3500.0,
+            )
+        else:
+            yield PessoaJuridica(
+                email="pj@email.com", telefone="1133", status="ativo", nome_fantasia="Empresa", cnpj=f"{2 * i:014d}",
+                faturamento_anual=1e6,
+            )
+
+
+def gerar_consultas(clientes, quantidade):
+    """Documentos pares já existem; ímpares são novos. Um quinto das consultas repete uma anterior."""
+    aleatorio = random.Random(0)
+    consultas = []
+    for _ in range(quantidade):
+        if consultas and aleatorio.random() < 0.2:
+            consultas.append(aleatorio.choice(consultas))
+            continue
+        i = aleatorio.randrange(clientes)
+        numero = 2 * i if aleatorio.random() < FRACAO_EXISTENTES else 2 * i + 1
+        consultas.append(f"{numero:011d}" if i % 3 else f"{numero:014d}")
+    return consultas
+
+
+def contar_antigo(cursor, documento):
+    if len(documento) == 11:
+        cursor.execute("SELECT COUNT(*) AS total FROM pessoa_fisica WHERE cpf=?;", (documento,))
+    else:
+        cursor.execute("SELECT COUNT(*) AS total FROM pessoa_juridica WHERE cnpj=?;", (documento,))
+    return cursor.fetchone()[0]
+
+
+def medir(rotulo, consultar, consultas):
+    inicio = perf_counter()
+    existentes = sum(1 for documento in consultas if consultar(documento))
+    segundos = perf_counter() - inicio
+    print(f"{rotulo:<28}{existentes:>12,}{segundos:>10.3f}s{len(consultas) / segundos:>14,.0f}")
+    return existentes
+
+
+def main():
+    clientes = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTES
+    quantidade = int(sys.argv[2]) if len(sys.argv) > 2 else CONSULTAS
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        conexao = criar_conexao(ConfiguracaoConexao(caminho=Path(diretorio) / "bench.sqlite"))
+        criar_bd(conexao.cursor())
+        ClienteServico(conexao.cursor()).importar_clientes(gerar_clientes(clientes))
+        consultas = gerar_consultas(clientes, quantidade)
+
+        inicio = perf_counter()
+        documentos = CacheDocumentos.do_banco(conexao.cursor())
+        carga = perf_counter() - inicio
+
+        print(f"{clientes:,} clientes, {quantidade:,} consultas")
+        print(f"{'modo':<28}{'existentes':>12}{'tempo':>11}{'consultas/s':>14}")
+        cursor = conexao.cursor()
+        medir("COUNT(*)", lambda documento: contar_antigo(cursor, documento), consultas)
+        medir("EXISTS", ClienteServico(conexao.cursor()).filtrar_cliente, consultas)
+        medir("EXISTS + LRU + Bloom", ClienteServico(conexao.cursor(), documentos).filtrar_cliente, consultas)
+        conexao.close()
+
+    contadores = documentos.contadores
+    print(f"\ncarga do filtro: {carga:.3f}s")
+    print(
+        f"acertos LRU {contadores.acertos_lru:,} | descartes Bloom {contadores.descartes_bloom:,} | "
+        f"consultas ao banco {contadores.consultas_bd:,} | taxa de acerto {contadores.taxa_acerto:.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark da importação em massa de clientes (ClienteServico.importar_clientes).
+
+Gera um CSV com N clientes (2/3 PF, 1/3 PJ, ~1% de documentos repetidos)
+e compara o cadastro antigo (COUNT(*) + dois INSERTs + commit por
+cliente, em uma amostra) com ``importar_clientes`` em vários tamanhos de
+lote, a partir do CSV e de objetos já em memória.
+
+Uso: python benchmarks/bench_importacao.py [clientes]
+"""
+
+import csv
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from bd import ConfiguracaoConexao, criar_bd, criar_conexao  # noqa: E402
+from servico import COLUNAS_CSV, ClienteServico, ler_clientes_csv  # noqa: E402
+
+CLIENTES = 1_000_000
+AMOSTRA_ANTIGA = 20_000
+LOTES = (1_000, 10_000, 50_000, 200_000)
+
+
+def gerar_csv(caminho, quantidade):
+    with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(COLUNAS_CSV)
+        for i in range(quantidade):
+            repetido = i - 1 if i % 100 == 99 else i
+            if i % 3:
+                escritor.writerow((f"{repetido:011d}", f"Cliente {i}", "3500.0", f"c{i}@email.com", "11999999999", ""))
+            else:
+                escritor.writerow((f"{repetido:014d}", f"Empresa {i}", "1e6", f"e{i}@email.com", "1133333333", ""))
+
+
+def novo_servico(diretorio, nome):
+    conexao = criar_conexao(ConfiguracaoConexao(caminho=Path(diretorio) / f"{nome}.sqlite"))
+    criar_bd(conexao.cursor())
+    return conexao, ClienteServico(conexao.cursor())
+
+
+def cadastrar_antigo(conexao, clientes):
+    cursor = conexao.cursor()
+    for cliente in clientes:
+        documento = getattr(cliente, "cpf", None) or cliente.cnpj
+        if len(documento) == 11:
+            cursor.execute("SELECT COUNT(*) AS total FROM pessoa_fisica WHERE cpf=?;", (documento,))
+        else:
+            cursor.execute("SELECT COUNT(*) AS total FROM pessoa_juridica WHERE cnpj=?;", (documento,))
+        if cursor.fetchone()[0]:
+            continue
+        cursor.execute(
+            "INSERT INTO cliente (email, telefone, status) VALUES (?,?,?);",
+            (cliente.email, cliente.telefone, cliente.status),
+        )
+        if len(documento) == 11:
+            cursor.execute(
+                "INSERT INTO pessoa_fisica (cliente_id, nome, cpf, renda_mensal) VALUES (?,?,?,?)",
+                (cursor.lastrowid, cliente.nome, cliente.cpf, cliente.renda_mensal),
+            )
+        else:
+            cursor.execute(
+                "INSERT INTO pessoa_juridica (cliente_id, nome_fantasia, cnpj, faturamento_anual) VALUES (?,?,?,?)",
+                (cursor.lastrowid, cliente.nome_fantasia, cliente.cnpj, cliente.faturamento_anual),
+            )
+        conexao.commit()
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTES
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_csv = Path(diretorio) / "clientes.csv"
+        gerar_csv(caminho_csv, quantidade)
+        print(f"{quantidade:,} clientes no CSV")
+        print(f"{'modo':<40}{'inseridos':>12}{'repetidos':>12}{'clientes/s':>14}")
+
+        amostra = list(ler_clientes_csv(caminho_csv))[:AMOSTRA_ANTIGA]
+        conexao, _ = novo_servico(diretorio, "antigo")
+        inicio = perf_counter()
+        cadastrar_antigo(conexao, amostra)
+        segundos = perf_counter() - inicio
+        inseridos = conexao.execute("SELECT COUNT(*) FROM cliente").fetchone()[0]
+        conexao.close()
+        rotulo = f"antigo, {len(amostra):,} clientes"
+        print(f"{rotulo:<40}{inseridos:>12,}{len(amostra) - inseridos:>12,}{len(amostra) / segundos:>14,.0f}")
+
+        for tamanho_lote in LOTES:
+            conexao, servico = novo_servico(diretorio, f"lote{tamanho_lote}")
+            resumo = servico.importar_clientes(ler_clientes_csv(caminho_csv), tamanho_lote=tamanho_lote)
+            conexao.close()
+            rotulo = f"CSV, lote {tamanho_lote:,}"
+            repetidos = len(resumo.duplicados)
+            print(f"{rotulo:<40}{resumo.inseridos:>12,}{repetidos:>12,}{resumo.clientes_por_segundo:>14,.0f}")
+
+        clientes = list(ler_clientes_csv(caminho_csv))
+        conexao, servico = novo_servico(diretorio, "objetos")
+        resumo = servico.importar_clientes(clientes)
+        conexao.close()
+        rotulo = "objetos em memória, lote padrão"
+        print(f"{rotulo:<40}{resumo.inseridos:>12,}{len(resumo.duplicados):>12,}{resumo.clientes_por_segundo:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark da listagem de clientes: duas junções com fetchall x keyset na vw_cliente.
+
+Gera N clientes (2/3 PF, 1/3 PJ) em um banco temporário e mede:
+- a listagem antiga (dois ``SELECT *`` com ``fetchall`` + ``dict`` +
+  ``converter_objeto_bd``), limitada a ``LIMITE_ANTIGO`` clientes porque
+  carrega tudo em memória antes de mostrar a primeira linha;
+- a primeira página e uma página do fim com ``paginar_clientes`` (keyset),
+  e a mesma página do fim com OFFSET;
+- a varredura completa página a página, sem e com filtro de status.
+
+Uso: python benchmarks/bench_listagem.py [clientes]
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from bd import criar_bd  # noqa: E402
+from dominio import PessoaFisica, PessoaJuridica  # noqa: E402
+from servico import ClienteServico  # noqa: E402
+
+CLIENTES = 5_000_000
+LIMITE_ANTIGO = 500_000
+TAMANHO_LOTE = 100_000
+TAMANHO_PAGINA = 20
+
+
+def popular(conexao, quantidade):
+    for inicio in range(1, quantidade + 1, TAMANHO_LOTE):
+        ids = range(inicio, min(inicio + TAMANHO_LOTE, quantidade + 1))
+        conexao.executemany(
+            "INSERT INTO cliente (id, email, telefone, status) VALUES (?, ?, ?, ?)",
+            ((i, f"cliente{i}@email.com", f"1199{i:07d}", "inativo" if i % 10 == 0 else "ativo") for i in ids),
+        )
+        conexao.executemany(
+            "INSERT INTO pessoa_fisica (cliente_id, nome, cpf, renda_mensal) VALUES (?, ?, ?, ?)",
+            ((i, f"Cliente {i}", f"{i:011d}", 3500.0) for i in ids if i % 3),
+        )
+        conexao.executemany(
+            "INSERT INTO pessoa_juridica (cliente_id, nome_fantasia, cnpj, faturamento_anual) VALUES (?, ?, ?, ?)",
+            ((i, f"Empresa {i}", f"{i:014d}", 1_000_000.0) for i in ids if not i % 3),
+        )
+        conexao.commit()
+
+
+def listar_antigo(cursor):
+    cursor.execute("SELECT * FROM pessoa_fisica pf INNER JOIN cliente c ON c.id = pf.cliente_id;")
+    clientes = cursor.fetchall()
+    cursor.execute("SELECT * FROM pessoa_juridica pj INNER JOIN cliente c ON c.id = pj.cliente_id;")
+    clientes += cursor.fetchall()
+    objetos = []
+    for cliente in clientes:
+        dados = dict(cliente)
+        classe = PessoaFisica if "cpf" in dados else PessoaJuridica
+        objetos.append(classe.converter_objeto_bd(objeto_db=dados))
+    return objetos
+
+
+def medir(funcao, *argumentos, **nomeados):
+    inicio = perf_counter()
+    resultado = funcao(*argumentos, **nomeados)
+    return resultado, perf_counter() - inicio
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTES
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        conexao = sqlite3.connect(Path(diretorio) / "bench.sqlite")
+        criar_bd(conexao.cursor())
+        _, segundos = medir(popular, conexao, quantidade)
+        conexao.execute("ANALYZE")
+        print(f"{quantidade:,} clientes gerados em {segundos:.1f}s")
+        print(f"{'operação':<46}{'tempo':>12}")
+
+        antigos = min(quantidade, LIMITE_ANTIGO)
+        cursor = conexao.cursor()
+        cursor.row_factory = sqlite3.Row
+        if antigos < quantidade:
+            # A versão antiga só cabe em memória com menos clientes: mede em um banco recortado
+            recorte = sqlite3.connect(Path(diretorio) / "recorte.sqlite")
+            criar_bd(recorte.cursor())
+            popular(recorte, antigos)
+            cursor = recorte.cursor()
+            cursor.row_factory = sqlite3.Row
+        objetos, segundos = medir(listar_antigo, cursor)
+        print(f"{f'antiga, {antigos:,} clientes (1ª linha = tudo)':<46}{segundos:>11.3f}s")
+        del objetos
+
+        servico = ClienteServico(conexao.cursor())
+        _, segundos = medir(next, servico.paginar_clientes(TAMANHO_PAGINA))
+        print(f"{'keyset, 1ª página':<46}{segundos * 1000:>10.3f}ms")
+        _, segundos = medir(next, servico.paginar_clientes(TAMANHO_PAGINA, apos_id=quantidade - TAMANHO_PAGINA))
+        print(f"{'keyset, última página':<46}{segundos * 1000:>10.3f}ms")
+        _, segundos = medir(
+            lambda: conexao.execute(
+                "SELECT * FROM vw_cliente ORDER BY id LIMIT ? OFFSET ?", (TAMANHO_PAGINA, quantidade - TAMANHO_PAGINA)
+            ).fetchall()
+        )
+        print(f"{'OFFSET, última página':<46}{segundos * 1000:>10.3f}ms")
+
+        for status in (None, "inativo"):
+            inicio = perf_counter()
+            linhas = sum(len(p) for p in servico.paginar_clientes(1_000, status=status))
+            segundos = perf_counter() - inicio
+            rotulo = f"keyset, varredura completa (status={status})"
+            print(f"{rotulo:<46}{segundos:>11.3f}s  {linhas / segundos:>12,.0f} clientes/s")
+        conexao.close()
+
+
+if __name__ == "__main__":
+    main()
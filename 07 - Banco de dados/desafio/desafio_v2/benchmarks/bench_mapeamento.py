@@ -0,0 +1,135 @@
+"""Benchmark do mapeamento linha -> objeto de domínio (dominio.py).
+
+Em um banco com N clientes PF lê todas as linhas em blocos e mede:
+- o caminho antigo: ``sqlite3.Row`` -> ``dict`` -> ``converter_objeto_bd``;
+- o da listagem: ``ClienteServico._linha_paginada`` como ``row_factory``
+  sobre a ``vw_cliente`` (o mesmo de ``paginar_clientes``), montando o
+  objeto direto da tupla por posição;
+- a formatação de ``__str__``: laço campo a campo com ``+=`` (como era)
+  x o formatador em cache por classe;
+- a memória de 1M objetos (dataclass com ``__dict__`` x ``slots=True``).
+
+Uso: python benchmarks/bench_mapeamento.py [clientes]
+"""
+
+import gc
+import sqlite3
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, fields
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from bd import criar_bd  # noqa: E402
+from dominio import PessoaFisica  # noqa: E402
+from servico import ClienteServico  # noqa: E402
+
+CLIENTES = 1_000_000
+TAMANHO_LOTE = 100_000
+OBJETOS_MEMORIA = 1_000_000
+AMOSTRA_STR = 100_000
+
+SQL_ANTIGO = "SELECT * FROM pessoa_fisica pf INNER JOIN cliente c ON c.id = pf.cliente_id;"
+SQL_VIEW = "SELECT id, email, telefone, status, criado_em, tipo, nome, documento, valor FROM vw_cliente;"
+
+
+@dataclass
+class PessoaFisicaSemSlots:
+    email: str
+    telefone: str
+    status: str
+    nome: str
+    cpf: str
+    renda_mensal: float
+
+
+def popular(conexao, quantidade):
+    for inicio in range(1, quantidade + 1, TAMANHO_LOTE):
+        ids = range(inicio, min(inicio + TAMANHO_LOTE, quantidade + 1))
+        conexao.executemany(
+            "INSERT INTO cliente (id, email, telefone, status) VALUES (?, ?, ?, ?)",
+            ((i, f"cliente{i}@email.com", f"1199{i:07d}", "ativo") for i in ids),
+        )
+        conexao.executemany(
+            "INSERT INTO pessoa_fisica (cliente_id, nome, cpf, renda_mensal) VALUES (?, ?, ?, ?)",
+            ((i, f"Cliente {i}", f"{i:011d}", 3500.0) for i in ids),
+        )
+    conexao.commit()
+
+
+def mapear_antigo(conexao):
+    cursor = conexao.cursor()
+    cursor.row_factory = sqlite3.Row
+    cursor.execute(SQL_ANTIGO)
+    total = 0
+    while linhas := cursor.fetchmany(TAMANHO_LOTE):
+        objetos = [PessoaFisica.converter_objeto_bd(objeto_db=dict(linha)) for linha in linhas]
+        total += len(objetos)
+    return total
+
+
+def mapear_novo(conexao):
+    cursor = conexao.cursor()
+    cursor.row_factory = ClienteServico._linha_paginada
+    cursor.execute(SQL_VIEW)
+    total = 0
+    while linhas := cursor.fetchmany(TAMANHO_LOTE):
+        objetos = [cliente for _, cliente in linhas]
+        total += len(objetos)
+    return total
+
+
+def formatar_antigo(objeto):
+    texto = ""
+    for campo in fields(objeto):
+        texto += f"{campo.name.replace('_', ' ').capitalize()}: {getattr(objeto, campo.name)}\n"
+    return texto
+
+
+def memoria(classe, quantidade):
+    gc.collect()
+    tracemalloc.start()
+    objetos = [classe("c@email.com", "1199", "ativo", "Cliente", "00000000000", 3500.0) for _ in range(quantidade)]
+    usado = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objetos
+    return usado / quantidade
+
+
+def medir(rotulo, funcao, *argumentos):
+    inicio = perf_counter()
+    itens = funcao(*argumentos)
+    segundos = perf_counter() - inicio
+    print(f"{rotulo:<40}{itens:>12,}{segundos:>10.3f}s{itens / segundos:>14,.0f}")
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTES
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        conexao = sqlite3.connect(Path(diretorio) / "bench.sqlite")
+        criar_bd(conexao.cursor())
+        popular(conexao, quantidade)
+
+        print(f"{'operação':<40}{'itens':>12}{'tempo':>11}{'itens/s':>14}")
+        medir("mapeamento antigo (Row + dict)", mapear_antigo, conexao)
+        medir("mapeamento novo (row_factory)", mapear_novo, conexao)
+
+        pagina = next(ClienteServico(conexao.cursor()).paginar_clientes(tamanho=AMOSTRA_STR))
+        conexao.close()
+
+    medir("__str__ antigo (laço com +=)", lambda: sum(1 for objeto in pagina if formatar_antigo(objeto)))
+    medir("__str__ novo (formatador em cache)", lambda: sum(1 for objeto in pagina if str(objeto)))
+
+    objetos = min(quantidade, OBJETOS_MEMORIA)
+    print(f"\nmemória por objeto ({objetos:,} objetos):")
+    print(f"  dataclass com __dict__: {memoria(PessoaFisicaSemSlots, objetos):,.0f} bytes")
+    print(f"  dataclass slots=True:   {memoria(PessoaFisica, objetos):,.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from sqlite3 import Cursor
+
+CAPACIDADE_LRU = 10_000
+CAPACIDADE_MINIMA_BLOOM = 100_000
+TAXA_FALSO_POSITIVO = 0.01
+TAMANHO_LOTE_CARGA = 50_000
+
+SQL_DOCUMENTOS = "SELECT cpf FROM pessoa_fisica UNION ALL SELECT cnpj FROM pessoa_juridica;"
+
+
+class FiltroBloom:
+    """Conjunto aproximado: ``in`` nunca erra um "não", e erra um "sim" com ~``taxa_falso_positivo``.
+
+    As ``k`` posições saem de ``hash()`` por hash duplo; o ``hash`` de str
+    muda a cada processo, o que basta para um filtro que vive só em memória.
+    """
+
+    __slots__ = ("tamanho_bits", "quantidade_hashes", "itens", "_bits")
+
+    def __init__(self, capacidade: int, taxa_falso_positivo: float = TAXA_FALSO_POSITIVO) -> None:
+        capacidade = max(capacidade, 1)
+        self.tamanho_bits = math.ceil(-capacidade * math.log(taxa_falso_positivo) / math.log(2) ** 2)
+        self.quantidade_hashes = max(1, round(self.tamanho_bits / capacidade * math.log(2)))
+        self.itens = 0
+        self._bits = bytearray((self.tamanho_bits + 7) // 8)
+
+    def _posicoes(self, chave: str) -> Iterable[int]:
+        valor = hash(chave) & 0xFFFF_FFFF_FFFF_FFFF
+        h1, h2 = valor & 0xFFFF_FFFF, (valor >> 32) | 1
+        return ((h1 + i * h2) % self.tamanho_bits for i in range(self.quantidade_hashes))
+
+    def adicionar(self, chave: str) -> None:
+        bits = self._bits
+        for posicao in self._posicoes(chave):
+            bits[posicao >> 3] |= 1 << (posicao & 7)
+        self.itens += 1
+
+    def __contains__(self, chave: str) -> bool:
+        bits = self._bits
+        return all(bits[posicao >> 3] & (1 << (posicao & 7)) for posicao in self._posicoes(chave))
+
+
+@dataclass
+class ContadoresCache:
+    acertos_lru: int = 0
+    descartes_bloom: int = 0  # "não existe" respondido pelo filtro, sem ir ao banco
+    consultas_bd: int = 0
+
+    @property
+    def acertos(self) -> int:
+        return self.acertos_lru + self.descartes_bloom
+
+    @property
+    def falhas(self) -> int:
+        return self.consultas_bd
+
+    @property
+    def taxa_acerto(self) -> float:
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+
+class CacheDocumentos:
+    """Responde "esse CPF/CNPJ já existe?" evitando o banco sempre que possível.
+
+    A ordem é: LRU com os últimos documentos confirmados no banco, depois o
+    filtro de Bloom com todos os documentos conhecidos (um "não" do filtro
+    é definitivo) e só então a consulta ao banco. A LRU guarda apenas
+    respostas "existe": um "não existe" guardado ficaria velho assim que
+    outra thread cadastrasse o documento. O filtro é carregado na partida
+    (``do_banco``) e cada cadastro deve chamar ``registrar``. Compartilhado
+    entre threads: LRU, filtro e contadores só mudam sob uma trava.
+    """
+
+    def __init__(self, capacidade_bloom: int = CAPACIDADE_MINIMA_BLOOM, capacidade_lru: int = CAPACIDADE_LRU) -> None:
+        self.capacidade_lru = capacidade_lru
+        self.contadores = ContadoresCache()
+        self._bloom = FiltroBloom(capacidade_bloom)
+        self._lru: OrderedDict[str, None] = OrderedDict()
+        self._trava = threading.Lock()
+
+    @classmethod
+    def do_banco(cls, cursor: Cursor, capacidade_lru: int = CAPACIDADE_LRU) -> "CacheDocumentos":
+        """Cria o cache com todos os documentos já gravados, com folga para o dobro de clientes."""
+        total = cursor.execute("SELECT COUNT(*) FROM pessoa_fisica;").fetchone()[0]
+        total += cursor.execute("SELECT COUNT(*) FROM pessoa_juridica;").fetchone()[0]
+        cache = cls(capacidade_bloom=max(2 * total, CAPACIDADE_MINIMA_BLOOM), capacidade_lru=capacidade_lru)
+
+        adicionar = cache._bloom.adicionar
+        cursor.execute(SQL_DOCUMENTOS)
+        while linhas := cursor.fetchmany(TAMANHO_LOTE_CARGA):
+            for (documento,) in linhas:
+                adicionar(documento)
+        return cache
+
+    def existe(self, documento: str, consultar: Callable[[str], bool]) -> bool:
+        """Consulta LRU e filtro; só chama ``consultar(documento)`` (o banco) se ambos não souberem."""
+        with self._trava:
+            if documento in self._lru:
+                self._lru.move_to_end(documento)
+                self.contadores.acertos_lru += 1
+                return True
+            if documento not in self._bloom:
+                self.contadores.descartes_bloom += 1
+                return False
+            self.contadores.consultas_bd += 1
+
+        existe = consultar(documento)
+        if existe:
+            self._guardar(documento)
+        return existe
+
+    def registrar(self, documentos: str | Iterable[str]) -> None:
+        """Marca documentos recém-cadastrados como existentes no filtro."""
+        if isinstance(documentos, str):
+            documentos = (documentos,)
+        with self._trava:
+            for documento in documentos:
+                self._bloom.adicionar(documento)
+
+    def _guardar(self, documento: str) -> None:
+        with self._trava:
+            self._lru[documento] = None
+            self._lru.move_to_end(documento)
+            if len(self._lru) > self.capacidade_lru:
+                self._lru.popitem(last=False)
@@ -1,22 +1,30 @@
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, fields
+from functools import cache
+from operator import attrgetter
 from typing import Self
 
 
-@dataclass
+@cache
+def _formatador(cls: type) -> tuple[Callable[..., str], Callable[[object], tuple]]:
+    """Modelo "Campo: {}" de cada classe, montado uma vez, e o getter dos valores na mesma ordem."""
+    nomes = [campo.name for campo in fields(cls)]
+    modelo = "".join(f"{nome.replace('_', ' ').capitalize()}: {{}}\n" for nome in nomes)
+    return modelo.format, attrgetter(*nomes)
+
+
+@dataclass(slots=True)
 class Cliente:
     email: str
     telefone: str
     status: str
 
     def __str__(self) -> str:
-        texto = ""
-        for campo, valor in self.__dict__.items():
-            campo = campo.replace("_", " ").capitalize()
-            texto += f"{campo}: {valor}\n"
-        return texto
+        formatar, valores = _formatador(type(self))
+        return formatar(*valores(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class PessoaFisica(Cliente):
     nome: str
     cpf: str
@@ -34,7 +42,7 @@ class PessoaFisica(Cliente):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PessoaJuridica(Cliente):
     nome_fantasia: str
     cnpj: str
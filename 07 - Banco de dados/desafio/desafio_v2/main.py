@@ -1,8 +1,9 @@
 import sqlite3
 import textwrap
 
-from bd import criar_bd, criar_conexao
-from servico import ClienteServico
+from bd import PoolConexoes, criar_bd
+from cache_documentos import CacheDocumentos
+from servico import ClienteServico, ler_clientes_csv
 
 
 def menu():
@@ -10,33 +11,53 @@ def menu():
     ================ MENU ================
     [1]\tNovo cliente
     [2]\tListar clientes
+    [3]\tImportar clientes (CSV)
     [0]\tSair
     => """
     return input(textwrap.dedent(menu))
 
 
-def main():
-    conexao = criar_conexao()
+def criar_servico(conexao: sqlite3.Connection, documentos: CacheDocumentos) -> ClienteServico:
     cursor = conexao.cursor()
     cursor.row_factory = sqlite3.Row
+    return ClienteServico(cursor=cursor, documentos=documentos)
+
 
-    criar_bd(cursor=cursor)
+def main():
+    pool = PoolConexoes()
 
-    servico = ClienteServico(cursor=cursor)
+    with pool.conexao() as conexao:
+        criar_bd(cursor=conexao.cursor())
+        documentos = CacheDocumentos.do_banco(conexao.cursor())
 
     while True:
         match menu():
             case "1":
-                servico.criar_cliente()
-                conexao.commit()
+                with pool.conexao() as conexao:
+                    criar_servico(conexao, documentos).criar_cliente()
+                    conexao.commit()
             case "2":
-                servico.listar_clientes()
+                with pool.conexao() as conexao:
+                    criar_servico(conexao, documentos).listar_clientes()
+            case "3":
+                caminho = input("Caminho do arquivo CSV: ").strip()
+                with pool.conexao() as conexao:
+                    try:
+                        resumo = criar_servico(conexao, documentos).importar_clientes(ler_clientes_csv(caminho))
+                    except (OSError, ValueError) as exc:
+                        conexao.rollback()  # lotes anteriores já confirmados ficam
+                        print(f"\n@@@ Erro ao importar o arquivo: {exc} @@@")
+                        continue
+                print(
+                    f"\n=== {resumo.inseridos} clientes importados de {resumo.lidos} lidos "
+                    f"({resumo.clientes_por_segundo:,.0f}/s); {len(resumo.duplicados)} documentos repetidos ==="
+                )
             case "0":
                 break
             case _:
                 print("\n@@@ Operação inválida, por favor selecione novamente a operação desejada. @@@")
 
-    conexao.close()
+    pool.fechar()
 
 
 main()
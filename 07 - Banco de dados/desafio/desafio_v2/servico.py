@@ -1,18 +1,116 @@
-from sqlite3 import Cursor
+import csv
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from sqlite3 import Cursor, IntegrityError
+from time import perf_counter
 
+from cache_documentos import CacheDocumentos
 from dominio import Cliente, PessoaFisica, PessoaJuridica
 
+TAMANHO_PAGINA = 20
+TAMANHO_LOTE_IMPORTACAO = 50_000
+COLUNAS_CSV = ("documento", "nome", "valor", "email", "telefone", "status")
+
+SQL_EXISTE_CPF = "SELECT EXISTS (SELECT 1 FROM pessoa_fisica WHERE cpf = ?);"
+SQL_EXISTE_CNPJ = "SELECT EXISTS (SELECT 1 FROM pessoa_juridica WHERE cnpj = ?);"
+SQL_INSERIR_CLIENTE = "INSERT INTO cliente (email, telefone, status) VALUES (?,?,?);"
+SQL_INSERIR_PESSOA_FISICA = """
+    INSERT INTO pessoa_fisica (cliente_id, nome, cpf, renda_mensal) VALUES (?,?,?,?)
+    ON CONFLICT (cpf) DO NOTHING;
+"""
+SQL_INSERIR_PESSOA_JURIDICA = """
+    INSERT INTO pessoa_juridica (cliente_id, nome_fantasia, cnpj, faturamento_anual) VALUES (?,?,?,?)
+    ON CONFLICT (cnpj) DO NOTHING;
+"""
+SQL_CLIENTES_SEM_SUBTIPO = """
+    SELECT c.id FROM cliente c
+    WHERE c.id BETWEEN ? AND ?
+      AND NOT EXISTS (SELECT 1 FROM pessoa_fisica pf WHERE pf.cliente_id = c.id)
+      AND NOT EXISTS (SELECT 1 FROM pessoa_juridica pj WHERE pj.cliente_id = c.id);
+"""
+
+SQL_PAGINA_CLIENTES = """
+    SELECT id, email, telefone, status, criado_em, tipo, nome, documento, valor
+    FROM vw_cliente
+    WHERE id > ?{filtros}
+    ORDER BY id
+    LIMIT ?;
+"""
+
+
+@dataclass
+class ResumoImportacao:
+    lidos: int = 0
+    inseridos: int = 0
+    duplicados: list[str] = field(default_factory=list)
+    segundos: float = 0.0
+
+    @property
+    def clientes_por_segundo(self) -> float:
+        return self.lidos / self.segundos if self.segundos else 0.0
+
+
+def ler_clientes_csv(caminho: str | Path) -> Iterator[Cliente]:
+    """Lê clientes de um CSV com as colunas de ``COLUNAS_CSV`` (CPF com 11 dígitos = PF, senão PJ).
+
+    Linhas em branco são ignoradas; uma linha com colunas faltando ou valor
+    não numérico lança ValueError com o número da linha no arquivo.
+    """
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        leitor = csv.reader(arquivo)
+        cabecalho = next(leitor, None)
+        if cabecalho is None:
+            return
+        posicoes = [cabecalho.index(coluna) if coluna in cabecalho else None for coluna in COLUNAS_CSV]
+        colunas_usadas = max((posicao + 1 for posicao in posicoes if posicao is not None), default=0)
+        for linha in leitor:
+            if not any(campo.strip() for campo in linha):
+                continue
+            if len(linha) < colunas_usadas:
+                raise ValueError(f"linha {leitor.line_num}: {len(linha)} colunas, esperadas {len(cabecalho)}")
+            documento, nome, valor, email, telefone, status = (
+                linha[posicao] if posicao is not None else "" for posicao in posicoes
+            )
+            try:
+                valor = float(valor)
+            except ValueError:
+                raise ValueError(f"linha {leitor.line_num}: valor inválido {valor!r}") from None
+            if len(documento) == 11:
+                yield PessoaFisica(
+                    email=email,
+                    telefone=telefone,
+                    status=status or "ativo",
+                    nome=nome,
+                    cpf=documento,
+                    renda_mensal=valor,
+                )
+            else:
+                yield PessoaJuridica(
+                    email=email,
+                    telefone=telefone,
+                    status=status or "ativo",
+                    nome_fantasia=nome,
+                    cnpj=documento,
+                    faturamento_anual=valor,
+                )
+
 
 class ClienteServico:
-    def __init__(self, cursor: Cursor) -> None:
+    def __init__(self, cursor: Cursor, documentos: CacheDocumentos | None = None) -> None:
         self.cursor = cursor
+        self.documentos = documentos
 
-    def filtrar_cliente(self, documento: str) -> int:
-        if len(documento) == 11:
-            self.cursor.execute("SELECT COUNT(*) AS total FROM pessoa_fisica WHERE cpf=?;", (documento,))
-        else:
-            self.cursor.execute("SELECT COUNT(*) AS total FROM pessoa_juridica WHERE cnpj=?;", (documento,))
-        return self.cursor.fetchone()["total"]
+    def filtrar_cliente(self, documento: str) -> bool:
+        if self.documentos is None:
+            return self._existe_documento(documento)
+        return self.documentos.existe(documento, self._existe_documento)
+
+    def _existe_documento(self, documento: str) -> bool:
+        # EXISTS para no primeiro registro do índice UNIQUE, sem contar nada
+        sql = SQL_EXISTE_CPF if len(documento) == 11 else SQL_EXISTE_CNPJ
+        return bool(self.cursor.execute(sql, (documento,)).fetchone()[0])
 
     def _criar_cliente_pessoa_fisica(self, documento: str) -> PessoaFisica:
         nome = input("Informe o nome completo: ")
@@ -56,34 +154,138 @@ class ClienteServico:
 
         if len(documento) == 11:
             cliente = self._criar_cliente_pessoa_fisica(documento=documento)
-            cliente_id = self._criar_cliente(cliente=cliente)
-            self.cursor.execute(
-                "INSERT INTO pessoa_fisica (cliente_id, nome, cpf, renda_mensal) VALUES (?,?,?,?)",
-                (cliente_id, cliente.nome, cliente.cpf, cliente.renda_mensal),
-            )
         else:
             cliente = self._criar_cliente_pessoa_juridica(documento=documento)
+
+        try:
             cliente_id = self._criar_cliente(cliente=cliente)
-            self.cursor.execute(
-                "INSERT INTO pessoa_juridica (cliente_id, nome_fantasia, cnpj, faturamento_anual) VALUES (?,?,?,?)",
-                (cliente_id, cliente.nome_fantasia, cliente.cnpj, cliente.faturamento_anual),
-            )
+            if len(documento) == 11:
+                self.cursor.execute(
+                    "INSERT INTO pessoa_fisica (cliente_id, nome, cpf, renda_mensal) VALUES (?,?,?,?)",
+                    (cliente_id, cliente.nome, cliente.cpf, cliente.renda_mensal),
+                )
+            else:
+                self.cursor.execute(
+                    "INSERT INTO pessoa_juridica (cliente_id, nome_fantasia, cnpj, faturamento_anual) VALUES (?,?,?,?)",
+                    (cliente_id, cliente.nome_fantasia, cliente.cnpj, cliente.faturamento_anual),
+                )
+        except IntegrityError:
+            # Cadastrado por outra conexão entre a verificação e o INSERT: desfaz o cliente órfão
+            self.cursor.connection.rollback()
+            if self.documentos is not None:
+                self.documentos.registrar(documento)
+            print("\n@@@ Já existe cliente com esse documento (CPF/CNPJ)! @@@")
+            return
 
+        if self.documentos is not None:
+            self.documentos.registrar(documento)
         print("\n=== Cliente criado com sucesso! ===")
 
+    def importar_clientes(
+        self, clientes: Iterable[Cliente], tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO
+    ) -> ResumoImportacao:
+        """Insere clientes em massa, com um commit a cada ``tamanho_lote``.
+
+        As linhas de ``cliente`` de um lote entram em um único ``executemany``;
+        numa mesma transação o AUTOINCREMENT gera ids consecutivos, então o
+        id de cada uma sai de ``last_insert_rowid()`` sem consulta extra.
+        Documentos repetidos (no banco ou no próprio lote) são barrados pelo
+        ``ON CONFLICT`` das colunas UNIQUE; os ``cliente`` que ficaram sem
+        subtipo são removidos e os documentos vão para ``duplicados``.
+        """
+        resumo = ResumoImportacao()
+        inicio = perf_counter()
+        clientes = iter(clientes)
+        while lote := list(islice(clientes, tamanho_lote)):
+            self._importar_lote(lote, resumo)
+            self.cursor.connection.commit()
+            if self.documentos is not None:
+                # Depois do lote todos os documentos estão no banco, novos ou repetidos
+                self.documentos.registrar(c.cpf if isinstance(c, PessoaFisica) else c.cnpj for c in lote)
+            resumo.lidos += len(lote)
+        resumo.segundos = perf_counter() - inicio
+        return resumo
+
+    def _importar_lote(self, lote: list[Cliente], resumo: ResumoImportacao) -> None:
+        fisicas = [cliente for cliente in lote if isinstance(cliente, PessoaFisica)]
+        juridicas = [cliente for cliente in lote if not isinstance(cliente, PessoaFisica)]
+        ordenados = fisicas + juridicas
+
+        conexao = self.cursor.connection
+        self.cursor.executemany(SQL_INSERIR_CLIENTE, [(c.email, c.telefone, c.status) for c in ordenados])
+        ultimo_id = conexao.execute("SELECT last_insert_rowid();").fetchone()[0]
+        primeiro_id = ultimo_id - len(ordenados) + 1
+
+        alteracoes = conexao.total_changes
+        self.cursor.executemany(
+            SQL_INSERIR_PESSOA_FISICA,
+            [(primeiro_id + i, c.nome, c.cpf, c.renda_mensal) for i, c in enumerate(fisicas)],
+        )
+        base_juridicas = primeiro_id + len(fisicas)
+        self.cursor.executemany(
+            SQL_INSERIR_PESSOA_JURIDICA,
+            [(base_juridicas + i, c.nome_fantasia, c.cnpj, c.faturamento_anual) for i, c in enumerate(juridicas)],
+        )
+        inseridos = conexao.total_changes - alteracoes
+        resumo.inseridos += inseridos
+
+        if inseridos < len(ordenados):
+            sem_subtipo = conexao.execute(SQL_CLIENTES_SEM_SUBTIPO, (primeiro_id, ultimo_id)).fetchall()
+            conexao.executemany("DELETE FROM cliente WHERE id = ?;", sem_subtipo)
+            for (cliente_id,) in sem_subtipo:
+                cliente = ordenados[cliente_id - primeiro_id]
+                resumo.duplicados.append(cliente.cpf if isinstance(cliente, PessoaFisica) else cliente.cnpj)
+
+    def paginar_clientes(
+        self,
+        tamanho: int = TAMANHO_PAGINA,
+        status: str | None = None,
+        criado_desde: str | None = None,
+        apos_id: int = 0,
+    ) -> Iterator[list[Cliente]]:
+        """Gera páginas de clientes (PF e PJ) em ordem de id.
+
+        Paginação por keyset: cada página é uma consulta curta à ``vw_cliente``
+        a partir do último id visto (``id > ?``), sem OFFSET, então a página
+        1000 custa o mesmo que a primeira e só uma página fica em memória.
+        """
+        filtros, parametros = "", []
+        if status is not None:
+            filtros += " AND status = ?"
+            parametros.append(status)
+        if criado_desde is not None:
+            filtros += " AND criado_em >= ?"
+            parametros.append(criado_desde)
+        sql = SQL_PAGINA_CLIENTES.format(filtros=filtros)
+
+        # Cursor próprio: o gerador fica suspenso entre páginas e o cursor do serviço segue livre
+        cursor = self.cursor.connection.cursor()
+        cursor.row_factory = self._linha_paginada
+        while True:
+            cursor.execute(sql, (apos_id, *parametros, tamanho))
+            linhas = cursor.fetchmany(tamanho)
+            if not linhas:
+                return
+            yield [cliente for _, cliente in linhas]
+            apos_id = linhas[-1][0]
+
+    @staticmethod
+    def _linha_paginada(cursor: Cursor, linha: tuple) -> tuple[int, Cliente]:
+        """``row_factory`` da ``vw_cliente``: (id, cliente) montado por posição, na ordem dos campos."""
+        cliente_id, email, telefone, status, _, tipo, nome, documento, valor = linha
+        classe = PessoaFisica if tipo == "PF" else PessoaJuridica
+        return cliente_id, classe(email, telefone, status, nome, documento, valor)
+
     def listar_clientes(self) -> None:
-        self.cursor.execute("SELECT * FROM pessoa_fisica pf INNER JOIN cliente c ON c.id = pf.cliente_id;")
-        clientes = self.cursor.fetchall()
-        self.cursor.execute("SELECT * FROM pessoa_juridica pj INNER JOIN cliente c ON c.id = pj.cliente_id;")
-        clientes += self.cursor.fetchall()
+        paginas = self.paginar_clientes()
+        pagina = next(paginas, None)
 
-        if not clientes:
+        if pagina is None:
             print("\n@@@ Não existem clientes cadastrados! @@@")
 
-        for cliente in clientes:
-            print(self._apresentar_dados(dados_cliente=dict(cliente)))
-
-    def _apresentar_dados(self, dados_cliente: dict[str, str | int]) -> str:
-        if "cpf" in dados_cliente:
-            return PessoaFisica.converter_objeto_bd(objeto_db=dados_cliente)
-        return PessoaJuridica.converter_objeto_bd(objeto_db=dados_cliente)
+        while pagina is not None:
+            for cliente in pagina:
+                print(cliente)
+            pagina = next(paginas, None)
+            if pagina is not None and input("[Enter] próxima página | [q] encerrar: ").strip().lower() == "q":
+                break
@@ -0,0 +1,14 @@
+from decimal import ROUND_HALF_EVEN, Decimal
+
+
+def to_cents(value: Decimal | float | int) -> int:
+    """Convert a monetary value to integer cents, rounding half to even."""
+    if isinstance(value, Decimal):
+        return int(value.scaleb(2).to_integral_value(ROUND_HALF_EVEN))
+    if isinstance(value, float):
+        return round(value * 100)
+    return value * 100
+
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
@@ -1,9 +1,12 @@
+from decimal import Decimal
+
 from databases.interfaces import Record
 
 from src.database import database
 from src.exceptions import AccountNotFoundError, BusinessError
 from src.models.account import accounts
 from src.models.transaction import TransactionType, transactions
+from src.money import from_cents, to_cents
 from src.schemas.transaction import TransactionIn
 
 
@@ -19,22 +22,24 @@ class TransactionService:
         if not account:
             raise AccountNotFoundError
 
+        # Balance math in integer cents: Numeric(10, 2) values never go through float
+        balance = to_cents(account.balance)
         if transaction.type == TransactionType.WITHDRAWAL:
-            balance = float(account.balance) - transaction.amount
+            balance -= to_cents(transaction.amount)
             if balance < 0:
                 raise BusinessError("Operation not carried out due to lack of balance")
         else:
-            balance = float(account.balance) + transaction.amount
+            balance += to_cents(transaction.amount)
 
         # Create transaction entry
         transaction_id = await self.__register_transaction(transaction)
         # Update account balance
-        await self.__update_account_balance(transaction.account_id, balance)
+        await self.__update_account_balance(transaction.account_id, from_cents(balance))
 
         query = transactions.select().where(transactions.c.id == transaction_id)
         return await database.fetch_one(query)
 
-    async def __update_account_balance(self, account_id: int, balance: float) -> None:
+    async def __update_account_balance(self, account_id: int, balance: Decimal) -> None:
         command = accounts.update().where(accounts.c.id == account_id).values(balance=balance)
         await database.execute(command)
 
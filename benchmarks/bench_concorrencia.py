@@ -0,0 +1,109 @@
+"""Teste de estresse do executor concorrente (concorrencia.py).
+
+N threads aplicam depósitos e saques aleatórios sobre M contas, com e sem
+as travas por conta. Ao final confere as invariantes de cada conta (saldo
+nunca negativo, saldo igual ao inicial mais os lançamentos aceitos, um
+item de histórico por lançamento aceito) e mostra a vazão por número de
+threads. Com o GIL a vazão não escala com as threads; o objetivo é medir
+o custo das travas e garantir que nada se perde com trocas de contexto.
+
+Uso: python benchmarks/bench_concorrencia.py [threads] [contas] [operacoes]
+"""
+
+import random
+import sys
+import threading
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from concorrencia import ExecutorTransacoes  # noqa: E402
+from dinheiro import Dinheiro  # noqa: E402
+from poo_banco import ContaCorrente, Deposito, PessoaFisica, Saque  # noqa: E402
+
+THREADS = 8
+CONTAS = 100
+OPERACOES = 400_000
+SALDO_INICIAL = Dinheiro(1_000_00)
+
+
+def gerar_operacoes(contas, quantidade, semente=42):
+    aleatorio = random.Random(semente)
+    operacoes = []
+    for _ in range(quantidade):
+        valor = Dinheiro(aleatorio.randrange(1_00, 300_00))
+        transacao = Deposito(valor) if aleatorio.random() < 0.45 else Saque(valor)
+        operacoes.append((aleatorio.randrange(contas), transacao))
+    return operacoes
+
+
+def criar_contas(quantidade):
+    cliente = PessoaFisica("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+    contas = []
+    for numero in range(1, quantidade + 1):
+        conta = ContaCorrente(numero, "0001", cliente, limite=500.0, limite_saques=10**9)
+        conta.saldo = SALDO_INICIAL
+        contas.append(conta)
+    return contas
+
+
+def executar(threads, contas, operacoes, com_travas):
+    executor = ExecutorTransacoes()
+    aplicar = executor.executar if com_travas else (lambda conta, transacao: transacao.registrar(conta))
+    resultados = [None] * len(operacoes)
+
+    def trabalhar(inicio):
+        for indice in range(inicio, len(operacoes), threads):
+            numero, transacao = operacoes[indice]
+            resultados[indice] = aplicar(contas[numero], transacao)
+
+    trabalhadores = [threading.Thread(target=trabalhar, args=(i,)) for i in range(threads)]
+    comeco = perf_counter()
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    for trabalhador in trabalhadores:
+        trabalhador.join()
+    segundos = perf_counter() - comeco
+    executor.fechar()
+    return resultados, segundos
+
+
+def violacoes(contas, operacoes, resultados):
+    esperado = [SALDO_INICIAL.centavos] * len(contas)
+    aceitas = [0] * len(contas)
+    for (numero, transacao), aceita in zip(operacoes, resultados):
+        if aceita:
+            sinal = -1 if isinstance(transacao, Saque) else 1
+            esperado[numero] += sinal * transacao.valor.centavos
+            aceitas[numero] += 1
+    return sum(
+        conta.saldo < 0 or conta.saldo.centavos != esperado[i] or len(conta.historico.transacoes) != aceitas[i]
+        for i, conta in enumerate(contas)
+    )
+
+
+def main():
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else THREADS
+    quantidade_contas = int(sys.argv[2]) if len(sys.argv) > 2 else CONTAS
+    quantidade = int(sys.argv[3]) if len(sys.argv) > 3 else OPERACOES
+    operacoes = gerar_operacoes(quantidade_contas, quantidade)
+    sys.setswitchinterval(1e-5)  # trocas de contexto frequentes expõem as corridas
+
+    print(f"{quantidade} operações em {quantidade_contas} contas")
+    print(f"{'threads':>7} | {'travas':>6} | {'op/s':>12} | {'contas com violação':>19}")
+    threads = 1
+    while threads <= max_threads:
+        for com_travas in (False, True):
+            contas = criar_contas(quantidade_contas)
+            resultados, segundos = executar(threads, contas, operacoes, com_travas)
+            print(
+                f"{threads:>7} | {'sim' if com_travas else 'não':>6} | {quantidade / segundos:12,.0f} | "
+                f"{violacoes(contas, operacoes, resultados):>19}"
+            )
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Microbenchmark de somas monetárias: float, Decimal, Dinheiro e centavos int.
+
+Uso: python benchmarks/bench_dinheiro.py [somas]
+"""
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from dinheiro import Dinheiro  # noqa: E402
+
+SOMAS = 10_000_000
+
+
+def somar(total, parcela, quantidade):
+    for _ in range(quantidade):
+        total += parcela
+    return total
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else SOMAS
+    casos = (
+        ("float", 0.0, 0.1),
+        ("Decimal", Decimal("0.00"), Decimal("0.10")),
+        ("Dinheiro", Dinheiro(0), Dinheiro(10)),
+        ("centavos int", 0, 10),
+    )
+    print(f"{quantidade} somas de 0,10")
+    print(f"{'tipo':>14} | {'tempo (s)':>10} | {'ns/soma':>8} | resultado")
+    for nome, inicial, parcela in casos:
+        inicio = perf_counter()
+        total = somar(inicial, parcela, quantidade)
+        tempo = perf_counter() - inicio
+        print(f"{nome:>14} | {tempo:10.2f} | {tempo / quantidade * 1e9:8.1f} | {total!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark da reconstrução de estado no modo event-sourced (eventos.py).
+
+Monta um fluxo com N eventos de depósito/saque e compara:
+- replay evento a evento em Python (a dobra ingênua);
+- replay completo com a dobra em C, refazendo os snapshots;
+- reconstrução a partir do último snapshot;
+- ``saldo_em`` em instantes aleatórios, com e sem snapshots.
+
+Uso: python benchmarks/bench_eventos.py [eventos] [intervalo_snapshot]
+"""
+
+import random
+import sys
+from array import array
+from itertools import repeat
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from eventos import EFEITOS, INTERVALO_SNAPSHOT, FluxoEventos  # noqa: E402
+from poo_banco import Historico  # noqa: E402
+
+EVENTOS = 10_000_000
+CONSULTAS = 1_000
+INICIO_NS = 1_700_000_000 * 10**9
+
+
+def gerar_colunas(quantidade):
+    aleatorio = random.Random(0)
+    deposito = Historico.codigo_do_tipo("Deposito")
+    saque = Historico.codigo_do_tipo("Saque")
+    valores = array("q", array("H", aleatorio.randbytes(quantidade * 2)))
+    tipos = array("B", repeat(deposito, quantidade))
+    tipos[::3] = array("B", repeat(saque, len(range(0, quantidade, 3))))
+    datas = array("q", range(INICIO_NS, INICIO_NS + quantidade * 1_000, 1_000))
+    return valores, datas, tipos
+
+
+def replay_ingenuo(fluxo):
+    sinais = {Historico.codigo_do_tipo(nome): efeito for nome, efeito in EFEITOS.items()}
+    saldo = saques = 0
+    for codigo, valor in zip(fluxo._tipos, fluxo._valores):
+        sinal, saque = sinais[codigo]
+        saldo += sinal * valor
+        saques += saque
+    return saldo, saques
+
+
+def medir(funcao, *argumentos):
+    inicio = perf_counter()
+    resultado = funcao(*argumentos)
+    return resultado, perf_counter() - inicio
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else EVENTOS
+    intervalo = int(sys.argv[2]) if len(sys.argv) > 2 else INTERVALO_SNAPSHOT
+
+    colunas, segundos = medir(gerar_colunas, quantidade)
+    print(f"{quantidade:,} eventos gerados em {segundos:.2f}s (snapshot a cada {intervalo:,})")
+    fluxo, segundos = medir(FluxoEventos.de_eventos, *colunas, intervalo)
+    print(f"{'operação':<40}{'tempo':>12}{'eventos/s':>16}")
+    print(f"{'montagem (replay + snapshots)':<40}{segundos:>11.3f}s{quantidade / segundos:>16,.0f}")
+
+    esperado, segundos = medir(replay_ingenuo, fluxo)
+    print(f"{'replay evento a evento (Python)':<40}{segundos:>11.3f}s{quantidade / segundos:>16,.0f}")
+
+    resultado, segundos = medir(fluxo.reconstruir, False)
+    assert resultado == esperado
+    print(f"{'replay completo (dobra em C)':<40}{segundos:>11.3f}s{quantidade / segundos:>16,.0f}")
+
+    resultado, segundos = medir(fluxo.reconstruir)
+    assert resultado == esperado
+    print(f"{'a partir do último snapshot':<40}{segundos * 1000:>10.3f}ms{'':>16}")
+
+    aleatorio = random.Random(1)
+    instantes = [aleatorio.randrange(INICIO_NS, INICIO_NS + quantidade * 1_000) for _ in range(CONSULTAS)]
+    _, com_snapshot = medir(lambda: [fluxo.saldo_em(instante) for instante in instantes])
+    sem_snapshot = FluxoEventos.de_eventos(*colunas, intervalo_snapshot=quantidade + 1)
+    amostra = instantes[:10]
+    _, sem = medir(lambda: [sem_snapshot.saldo_em(instante) for instante in amostra])
+    assert [fluxo.saldo_em(i) for i in amostra] == [sem_snapshot.saldo_em(i) for i in amostra]
+    print(f"{'saldo_em com snapshots (por consulta)':<40}{com_snapshot / CONSULTAS * 1e6:>10.1f}µs")
+    print(f"{'saldo_em sem snapshots (por consulta)':<40}{sem / len(amostra) * 1e6:>10.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
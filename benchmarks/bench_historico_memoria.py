@@ -0,0 +1,61 @@
+"""Benchmark de memória do Historico (tracemalloc).
+
+Compara o layout antigo (lista de dicts com a data já formatada) com o
+Historico em colunas do poo_banco para 1 milhão de transações.
+
+Uso: python benchmarks/bench_historico_memoria.py [quantidade]
+"""
+
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from poo_banco import Deposito, Historico, Saque  # noqa: E402
+
+QUANTIDADE = 1_000_000
+
+
+def historico_lista(transacoes):
+    historico = []
+    for transacao in transacoes:
+        historico.append({
+            'tipo': transacao.__class__.__name__,
+            'valor': transacao.valor,
+            'data': datetime.now().strftime('%d/%m/%Y %H:%M:%S'),
+        })
+    return historico
+
+
+def historico_colunas(transacoes):
+    historico = Historico()
+    for transacao in transacoes:
+        historico.adicionar_transacao(transacao)
+    return historico
+
+
+def medir(construtor, transacoes):
+    tracemalloc.start()
+    historico = construtor(transacoes)
+    atual, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del historico
+    return atual, pico
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else QUANTIDADE
+    transacoes = [Deposito(100.0 + i % 7) if i % 3 else Saque(50.0) for i in range(quantidade)]
+
+    print(f"{quantidade} transações")
+    print(f"{'layout':>10} | {'atual (MiB)':>12} | {'pico (MiB)':>12} | {'bytes/transação':>16}")
+    for nome, construtor in (("dicts", historico_lista), ("colunas", historico_colunas)):
+        atual, pico = medir(construtor, transacoes)
+        print(f"{nome:>10} | {atual / 2**20:12.1f} | {pico / 2**20:12.1f} | {atual / quantidade:16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark do reprocessamento de fim de dia com o LedgerEngine.
+
+Aplica um lote de operações aleatórias sobre muitas contas com o motor
+vetorizado e, para uma fração do lote, com o modelo de objetos do
+poo_banco (Deposito/Saque.registrar), comparando operações por segundo.
+Mede também uma conta "quente" (folha de pagamento, conta de lojista):
+``DEPOSITOS_CONTA_QUENTE`` depósitos numa só conta, com alguns saques.
+
+Uso: python benchmarks/bench_ledger.py [operacoes] [contas]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from dinheiro import Dinheiro  # noqa: E402
+from ledger import DEPOSITO, SAQUE, LedgerEngine  # noqa: E402
+from poo_banco import ContaCorrente, Deposito, PessoaFisica, Saque  # noqa: E402
+
+OPERACOES = 10_000_000
+CONTAS = 1_000_000
+AMOSTRA_OBJETOS = 1_000_000
+DEPOSITOS_CONTA_QUENTE = 200_000
+SAQUES_CONTA_QUENTE = 100
+
+
+def gerar_lote(operacoes, contas, semente=42):
+    gerador = np.random.default_rng(semente)
+    numeros = gerador.integers(1, contas + 1, size=operacoes)
+    tipos = gerador.integers(0, 2, size=operacoes).astype(np.int8)
+    valores = gerador.integers(1_00, 700_00, size=operacoes)
+    return numeros, tipos, valores
+
+
+def main():
+    operacoes = int(sys.argv[1]) if len(sys.argv) > 1 else OPERACOES
+    contas = int(sys.argv[2]) if len(sys.argv) > 2 else CONTAS
+    numeros, tipos, valores = gerar_lote(operacoes, contas)
+    cliente = PessoaFisica("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+
+    motor = LedgerEngine(capacidade=contas + 1)
+    for numero in range(1, contas + 1):
+        motor.vincular(ContaCorrente(numero, "0001", cliente, limite_saques=50))
+
+    inicio = perf_counter()
+    resultados = motor.aplicar_lote(numeros, tipos, valores)
+    tempo_motor = perf_counter() - inicio
+    print(f"LedgerEngine: {operacoes} operações em {tempo_motor:.2f}s "
+          f"({operacoes / tempo_motor:,.0f} op/s, {resultados.mean():.1%} aceitas)")
+
+    amostra = min(operacoes, AMOSTRA_OBJETOS)
+    objetos = [None] + [ContaCorrente(n, "0001", cliente, limite_saques=50) for n in range(1, contas + 1)]
+    inicio = perf_counter()
+    for numero, tipo, valor in zip(numeros[:amostra].tolist(), tipos[:amostra].tolist(), valores[:amostra].tolist()):
+        valor = Dinheiro(valor)
+        transacao = Deposito(valor) if tipo == DEPOSITO else Saque(valor)
+        transacao.registrar(objetos[numero])
+    tempo_objetos = perf_counter() - inicio
+    print(f"Modelo de objetos: {amostra} operações em {tempo_objetos:.2f}s ({amostra / tempo_objetos:,.0f} op/s)")
+
+    quente = LedgerEngine(capacidade=2)
+    quente.vincular(ContaCorrente(1, "0001", cliente, limite_saques=SAQUES_CONTA_QUENTE))
+    tipos_quente = np.full(DEPOSITOS_CONTA_QUENTE + SAQUES_CONTA_QUENTE, DEPOSITO, dtype=np.int8)
+    tipos_quente[:: len(tipos_quente) // SAQUES_CONTA_QUENTE][:SAQUES_CONTA_QUENTE] = SAQUE
+    inicio = perf_counter()
+    quente.aplicar_lote(np.ones(len(tipos_quente), dtype=np.int64), tipos_quente, np.full(len(tipos_quente), 1_00))
+    tempo_quente = perf_counter() - inicio
+    print(f"Conta quente: {len(tipos_quente)} operações ({SAQUES_CONTA_QUENTE} saques) em {tempo_quente:.2f}s "
+          f"({len(tipos_quente) / tempo_quente:,.0f} op/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark da persistência (snapshot + diário) do sistema bancário.
+
+Mede a gravação e a carga do snapshot de N contas com algumas transações
+cada, e a vazão do diário com fsync em grupo.
+
+Uso: python benchmarks/bench_persistencia.py [contas]
+"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from persistencia import Persistencia  # noqa: E402
+from poo_banco import ContaCorrente, Deposito, PessoaFisica, RegistroClientes, Saque  # noqa: E402
+
+CONTAS = 1_000_000
+TRANSACOES_POR_CONTA = 3
+MOVIMENTOS_DIARIO = 100_000
+
+
+def montar_registro(quantidade):
+    registro = RegistroClientes()
+    for numero in range(1, quantidade + 1):
+        cliente = PessoaFisica(f"{numero:011d}", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+        conta = ContaCorrente(numero, "0001", cliente, limite=500.0, limite_saques=3)
+        for indice in range(TRANSACOES_POR_CONTA):
+            transacao = Deposito(100.0) if indice % 3 == 0 else Saque(10.0)
+            cliente.realizar_transacao(conta, transacao)
+        cliente.adicionar_conta(conta)
+        registro.adicionar_cliente(cliente)
+        registro.adicionar_conta(conta)
+    return registro
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else CONTAS
+    diretorio = Path(tempfile.mkdtemp())
+    try:
+        registro = montar_registro(quantidade)
+
+        persistencia = Persistencia(diretorio)
+        persistencia.carregar(RegistroClientes())
+        inicio = perf_counter()
+        persistencia.salvar_snapshot(registro)
+        gravacao = perf_counter() - inicio
+
+        conta = registro.buscar_conta(1)
+        inicio = perf_counter()
+        for _ in range(MOVIMENTOS_DIARIO):
+            deposito = Deposito(1.0)
+            conta.historico.adicionar_transacao(deposito)
+            persistencia.registrar_transacao(conta, deposito)
+        persistencia.fechar()
+        diario = perf_counter() - inicio
+
+        inicio = perf_counter()
+        carregado = RegistroClientes()
+        persistencia = Persistencia(diretorio)
+        persistencia.carregar(carregado)
+        carga = perf_counter() - inicio
+        persistencia.fechar()
+
+        tamanho = persistencia.caminho_snapshot.stat().st_size
+        print(f"{quantidade} contas, {quantidade * TRANSACOES_POR_CONTA} transações, snapshot {tamanho / 2**20:.1f} MiB")
+        print(f"{'etapa':>24} | {'segundos':>9} | {'por segundo':>12}")
+        print(f"{'gravar snapshot':>24} | {gravacao:9.2f} | {quantidade / gravacao:12,.0f}")
+        print(f"{'diário (fsync em grupo)':>24} | {diario:9.2f} | {MOVIMENTOS_DIARIO / diario:12,.0f}")
+        print(f"{'carregar tudo':>24} | {carga:9.2f} | {quantidade / carga:12,.0f}")
+    finally:
+        shutil.rmtree(diretorio)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark da busca de clientes por CPF no RegistroClientes.
+
+Compara o tempo médio de uma busca com 1 mil até 1 milhão de clientes
+cadastrados. Com o índice por CPF o tempo deve se manter estável; a busca
+linear antiga (``next`` sobre a lista) é medida até 100 mil para referência.
+
+Uso: python benchmarks/bench_registro_clientes.py
+"""
+
+import random
+import sys
+from pathlib import Path
+from timeit import timeit
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from poo_banco import ContaCorrente, PessoaFisica, RegistroClientes  # noqa: E402
+
+TAMANHOS = (1_000, 10_000, 100_000, 1_000_000)
+LIMITE_LINEAR = 100_000
+BUSCAS = 10_000
+
+
+def montar_registro(quantidade):
+    registro = RegistroClientes()
+    for numero in range(1, quantidade + 1):
+        cliente = PessoaFisica(f"{numero:011d}", "Cliente Teste", "01/01/1990", "Rua A, 1 - Centro - Cidade/UF")
+        conta = ContaCorrente(numero, "0001", cliente)
+        cliente.adicionar_conta(conta)
+        registro.adicionar_cliente(cliente)
+        registro.adicionar_conta(conta)
+    return registro
+
+
+def busca_linear(clientes, cpf):
+    return next((c for c in clientes if c.cpf == cpf), None)
+
+
+def main():
+    print(f"{'clientes':>10} | {'indice (us)':>12} | {'linear (us)':>12}")
+    for quantidade in TAMANHOS:
+        registro = montar_registro(quantidade)
+        cpfs = [f"{random.randint(1, quantidade):011d}" for _ in range(BUSCAS)]
+        formatados = [f"{c[:3]}.{c[3:6]}.{c[6:9]}-{c[9:]}" for c in cpfs]
+
+        tempo = timeit(lambda: [registro.buscar_cliente(c) for c in formatados], number=1)
+        indice_us = tempo / BUSCAS * 1e6
+
+        if quantidade <= LIMITE_LINEAR:
+            lista = list(registro.clientes)
+            amostra = cpfs[:100]
+            tempo = timeit(lambda: [busca_linear(lista, c) for c in amostra], number=1)
+            linear = f"{tempo / len(amostra) * 1e6:12.2f}"
+        else:
+            linear = f"{'-':>12}"
+
+        print(f"{quantidade:>10} | {indice_us:12.3f} | {linear}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark dos backends de armazenamento do sistema_bancario.
+
+Para cada backend (memória, arquivos, SQLite) roda as mesmas funções do
+menu: cadastra N clientes, faz M depósitos/saques, consolida e recarrega
+o estado. Mostra operações por segundo de cada etapa.
+
+Uso: python benchmarks/bench_repositorio.py [clientes] [operacoes]
+"""
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+import sistema_bancario  # noqa: E402
+from dinheiro import Dinheiro  # noqa: E402
+from poo_banco import Deposito, RegistroClientes, Saque  # noqa: E402
+
+CLIENTES = 10_000
+OPERACOES = 50_000
+
+
+def executar(backend, diretorio, cpfs, operacoes):
+    sistema_bancario.registro = RegistroClientes()
+    sistema_bancario.iniciar_persistencia(diretorio, backend=backend)
+    tempos = {}
+
+    inicio = perf_counter()
+    contas = [
+        sistema_bancario.cadastrar_cliente(cpf, "Cliente Bench", "01/01/1990", "Rua A, 1 - Centro - Cidade/SP")
+        for cpf in cpfs
+    ]
+    tempos["cadastro"] = (len(contas), perf_counter() - inicio)
+
+    aleatorio = random.Random(0)
+    inicio = perf_counter()
+    for _ in range(operacoes):
+        conta = aleatorio.choice(contas)
+        if aleatorio.random() < 0.6:
+            transacao = Deposito(Dinheiro(aleatorio.randint(100, 50_000)))
+        else:
+            transacao = Saque(Dinheiro(aleatorio.randint(100, 10_000)))
+        sistema_bancario.executar_transacao(conta.cliente, conta, transacao)
+    tempos["depósito/saque"] = (operacoes, perf_counter() - inicio)
+
+    inicio = perf_counter()
+    sistema_bancario.encerrar_persistencia()
+    tempos["encerrar"] = (1, perf_counter() - inicio)
+
+    sistema_bancario.registro = RegistroClientes()
+    inicio = perf_counter()
+    sistema_bancario.iniciar_persistencia(diretorio, backend=backend)
+    tempos["recarga"] = (len(sistema_bancario.registro.contas), perf_counter() - inicio)
+    sistema_bancario.encerrar_persistencia()
+    return tempos
+
+
+def main():
+    clientes = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTES
+    operacoes = int(sys.argv[2]) if len(sys.argv) > 2 else OPERACOES
+    cpfs = [f"{indice:011d}" for indice in range(1, clientes + 1)]
+
+    print(f"{len(cpfs):,} clientes, {operacoes:,} depósitos/saques")
+    print(f"{'backend':<10}{'etapa':<16}{'itens':>10}{'tempo':>10}{'ops/s':>14}")
+    for backend in sistema_bancario.BACKENDS:
+        with tempfile.TemporaryDirectory() as diretorio:
+            for etapa, (itens, segundos) in executar(backend, diretorio, cpfs, operacoes).items():
+                print(f"{backend:<10}{etapa:<16}{itens:>10,}{segundos:>9.3f}s{itens / segundos if segundos else 0:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
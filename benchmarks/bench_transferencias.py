@@ -0,0 +1,97 @@
+"""Benchmark de transferências concorrentes com contas "quentes".
+
+Boa parte das transferências vai e volta entre poucas contas quentes (o
+pior caso para travas e para deadlock); o restante se espalha pelas
+demais contas. Para cada quantidade de threads mostra a vazão e confere
+que o dinheiro total se conservou e que nenhuma thread ficou presa.
+
+Uso: python benchmarks/bench_transferencias.py [threads] [contas] [operacoes]
+"""
+
+import random
+import sys
+import threading
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from concorrencia import ExecutorTransacoes  # noqa: E402
+from dinheiro import Dinheiro  # noqa: E402
+from poo_banco import ContaCorrente, PessoaFisica, Transferencia  # noqa: E402
+
+THREADS = 8
+CONTAS = 1_000
+OPERACOES = 200_000
+CONTAS_QUENTES = 4
+FRACAO_QUENTE = 0.8
+SALDO_INICIAL = Dinheiro(10_000_00)
+TEMPO_LIMITE = 120
+
+
+def criar_contas(quantidade):
+    cliente = PessoaFisica("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+    contas = []
+    for numero in range(1, quantidade + 1):
+        conta = ContaCorrente(numero, "0001", cliente, limite=500.0, limite_saques=10**9)
+        conta.saldo = SALDO_INICIAL
+        contas.append(conta)
+    return contas
+
+
+def gerar_pares(contas, quantidade, semente=42):
+    aleatorio = random.Random(semente)
+    pares = []
+    for _ in range(quantidade):
+        universo = CONTAS_QUENTES if aleatorio.random() < FRACAO_QUENTE else contas
+        origem, destino = aleatorio.sample(range(universo), 2)
+        pares.append((origem, destino, Dinheiro(aleatorio.randrange(1_00, 200_00))))
+    return pares
+
+
+def executar(threads, quantidade_contas, pares):
+    contas = criar_contas(quantidade_contas)
+    executor = ExecutorTransacoes()
+
+    def trabalhar(inicio):
+        for indice in range(inicio, len(pares), threads):
+            origem, destino, valor = pares[indice]
+            executor.executar(contas[origem], Transferencia(contas[destino], valor))
+
+    trabalhadores = [threading.Thread(target=trabalhar, args=(i,), daemon=True) for i in range(threads)]
+    comeco = perf_counter()
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    for trabalhador in trabalhadores:
+        trabalhador.join(TEMPO_LIMITE)
+    segundos = perf_counter() - comeco
+    presas = sum(trabalhador.is_alive() for trabalhador in trabalhadores)
+    executor.fechar()
+
+    total = sum(conta.saldo.centavos for conta in contas)
+    conservado = total == SALDO_INICIAL.centavos * quantidade_contas
+    negativas = sum(conta.saldo < 0 for conta in contas)
+    return segundos, presas, conservado, negativas
+
+
+def main():
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else THREADS
+    quantidade_contas = int(sys.argv[2]) if len(sys.argv) > 2 else CONTAS
+    quantidade = int(sys.argv[3]) if len(sys.argv) > 3 else OPERACOES
+    pares = gerar_pares(quantidade_contas, quantidade)
+    sys.setswitchinterval(1e-5)
+
+    print(f"{quantidade} transferências, {quantidade_contas} contas, "
+          f"{FRACAO_QUENTE:.0%} entre {CONTAS_QUENTES} contas quentes")
+    print(f"{'threads':>7} | {'op/s':>12} | {'presas':>6} | {'total conservado':>16} | {'saldos negativos':>16}")
+    threads = 1
+    while threads <= max_threads:
+        segundos, presas, conservado, negativas = executar(threads, quantidade_contas, pares)
+        print(f"{threads:>7} | {quantidade / segundos:12,.0f} | {presas:>6} | "
+              f"{'sim' if conservado else 'NÃO':>16} | {negativas:>16}")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
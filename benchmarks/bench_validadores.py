@@ -0,0 +1,83 @@
+"""Benchmark da validação de CPF: implementação anterior x módulo validadores.
+
+Gera CPFs válidos e inválidos (metade formatados) e mede a validação
+individual antiga (regex por chamada e closure ``calc``), ``validar_cpf``
+e a versão em lote ``validar_cpfs``.
+
+Uso: python benchmarks/bench_validadores.py [quantidade]
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from validadores import formatar_cpf, validar_cpf, validar_cpfs  # noqa: E402
+
+QUANTIDADE = 1_000_000
+
+
+def validar_cpf_anterior(cpf):
+    if re.fullmatch(r"\d{11}", cpf):
+        numeros = cpf
+    elif re.fullmatch(r"\d{3}\.\d{3}\.\d{3}-\d{2}", cpf):
+        numeros = re.sub(r"\D", "", cpf)
+    else:
+        return None
+    if numeros == numeros[0] * 11:
+        return None
+
+    def calc(seq, start):
+        soma = 0
+        fator = start
+        for d in seq:
+            soma += int(d) * fator
+            fator -= 1
+        resto = (soma * 10) % 11
+        return 0 if resto == 10 else resto
+
+    d1 = calc(numeros[:9], 10)
+    d2 = calc(numeros[:9] + str(d1), 11)
+    if numeros[-2:] != f"{d1}{d2}":
+        return None
+    return numeros
+
+
+def gerar_cpf(aleatorio):
+    base = [aleatorio.randint(0, 9) for _ in range(9)]
+    for pesos in (range(10, 1, -1), range(11, 1, -1)):
+        resto = sum(d * p for d, p in zip(base, pesos)) * 10 % 11
+        base.append(0 if resto == 10 else resto)
+    cpf = "".join(map(str, base))
+    if aleatorio.random() < 0.1:
+        cpf = cpf[:-1] + str((int(cpf[-1]) + 1) % 10)
+    return formatar_cpf(cpf) if aleatorio.random() < 0.5 else cpf
+
+
+def medir(nome, funcao, quantidade):
+    inicio = perf_counter()
+    resultado = funcao()
+    tempo = perf_counter() - inicio
+    print(f"{nome:>22} | {tempo:8.2f} | {quantidade / tempo:>12,.0f}")
+    return resultado
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else QUANTIDADE
+    aleatorio = random.Random(42)
+    cpfs = [gerar_cpf(aleatorio) for _ in range(quantidade)]
+
+    print(f"{quantidade} CPFs")
+    print(f"{'implementação':>22} | {'tempo (s)':>8} | {'CPFs/s':>12}")
+    anterior = medir("anterior", lambda: [validar_cpf_anterior(c) for c in cpfs], quantidade)
+    individual = medir("validar_cpf", lambda: [validar_cpf(c)[0] for c in cpfs], quantidade)
+    lote = medir("validar_cpfs", lambda: validar_cpfs(cpfs), quantidade)
+    assert anterior == individual == [numeros for numeros, _ in lote]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Gerador de carga para o servidor asyncio (servidor.py).
+
+Abre N terminais simultâneos; cada um cadastra (ou seleciona) um cliente e
+envia uma sequência de depósitos, saques e extratos, esperando a resposta
+de cada comando antes do próximo, como um operador faria. Ao final mostra
+a vazão total e a latência por comando.
+
+Uso: python servidor.py  (em outro terminal)
+     python benchmarks/carga_servidor.py [terminais] [comandos_por_terminal] [porta]
+"""
+
+import asyncio
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+from servidor import HOST, PORTA  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TERMINAIS = 1_000
+COMANDOS = 50
+COMANDOS_MULTILINHA = ("c", "e")
+
+
+def cpf_do_terminal(indice):
+    base = [int(d) for d in f"{indice + 100_000_000:09d}"]
+    for pesos in (range(10, 1, -1), range(11, 1, -1)):
+        resto = sum(d * p for d, p in zip(base, pesos)) * 10 % 11
+        base.append(0 if resto == 10 else resto)
+    return "".join(map(str, base))
+
+
+async def terminal(indice, porta, comandos, latencias, erros):
+    leitor, escritor = await asyncio.open_connection(HOST, porta)
+    aleatorio = random.Random(indice)
+
+    async def pedir(*campos):
+        inicio = perf_counter()
+        escritor.write(("\t".join(campos) + "\n").encode("utf-8"))
+        await escritor.drain()
+        status = (await leitor.readline()).decode("utf-8").rstrip("\n").split("\t")
+        if status[0] == "OK" and campos[0] in COMANDOS_MULTILINHA:
+            for _ in range(int(status[1])):
+                await leitor.readline()
+        latencias.append(perf_counter() - inicio)
+        if status[0] != "OK":
+            erros[status[-1]] = erros.get(status[-1], 0) + 1
+        return status
+
+    try:
+        cpf = cpf_do_terminal(indice)
+        status = await pedir("u", "Cliente Carga", "01/01/1990", cpf, "Rua A, 1 - Centro - Cidade/SP")
+        if status[0] != "OK":
+            await pedir("l", cpf)
+        for _ in range(comandos):
+            sorteio = aleatorio.random()
+            if sorteio < 0.5:
+                await pedir("d", f"{aleatorio.randint(1, 500)},{aleatorio.randint(0, 99):02d}")
+            elif sorteio < 0.8:
+                await pedir("s", str(aleatorio.randint(1, 100)))
+            else:
+                await pedir("e")
+        await pedir("q")
+    finally:
+        escritor.close()
+
+
+async def executar(terminais, comandos, porta):
+    latencias, erros = [], {}
+    inicio = perf_counter()
+    resultados = await asyncio.gather(
+        *(terminal(i, porta, comandos, latencias, erros) for i in range(terminais)), return_exceptions=True
+    )
+    segundos = perf_counter() - inicio
+    falhas = [r for r in resultados if isinstance(r, Exception)]
+    return latencias, erros, falhas, segundos
+
+
+def percentil(valores, fracao):
+    return valores[min(len(valores) - 1, int(len(valores) * fracao))]
+
+
+def main():
+    terminais = int(sys.argv[1]) if len(sys.argv) > 1 else TERMINAIS
+    comandos = int(sys.argv[2]) if len(sys.argv) > 2 else COMANDOS
+    porta = int(sys.argv[3]) if len(sys.argv) > 3 else PORTA
+
+    # Cada terminal é um socket aberto durante todo o teste
+    if resource is not None:
+        flexivel, rigido = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if flexivel < terminais + 64:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (min(rigido, terminais + 64), rigido))
+
+    latencias, erros, falhas, segundos = asyncio.run(executar(terminais, comandos, porta))
+    latencias.sort()
+    print(f"{terminais} terminais x {comandos} comandos: {len(latencias)} respostas em {segundos:.2f}s "
+          f"({len(latencias) / segundos:,.0f} comandos/s)")
+    if latencias:
+        print(f"latência p50 {percentil(latencias, 0.50) * 1000:.2f} ms | "
+              f"p99 {percentil(latencias, 0.99) * 1000:.2f} ms | máx {latencias[-1] * 1000:.2f} ms")
+    for mensagem, quantidade in sorted(erros.items(), key=lambda item: -item[1]):
+        print(f"  {quantidade:>8} x ERRO {mensagem}")
+    if falhas:
+        print(f"{len(falhas)} terminais falharam; primeiro erro: {falhas[0]!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compara dois resultados da suíte (benchmarks/suite.py) e acusa regressões.
+
+Para cada caso presente nos dois arquivos compara o melhor tempo; um caso
+que ficou mais de ``limite`` por cento mais lento é regressão e o script
+termina com código 1 (para uso em CI ou antes de um commit).
+
+Uso: python benchmarks/comparar.py base.json atual.json [limite_percentual]
+"""
+
+import json
+import sys
+from pathlib import Path
+
+LIMITE_PERCENTUAL = 10.0
+
+
+def carregar(caminho):
+    return json.loads(Path(caminho).read_text(encoding="utf-8"))
+
+
+def comparar(base, atual, limite=LIMITE_PERCENTUAL):
+    """Retorna [(caso, segundos_base, segundos_atual, variação %)] e a lista de regressões."""
+    linhas, regressoes = [], []
+    for caso, medida in atual["resultados"].items():
+        anterior = base["resultados"].get(caso)
+        if anterior is None:
+            continue
+        variacao = (medida["segundos"] / anterior["segundos"] - 1) * 100
+        linha = (caso, anterior["segundos"], medida["segundos"], variacao)
+        linhas.append(linha)
+        if variacao > limite:
+            regressoes.append(linha)
+    return linhas, regressoes
+
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(2)
+    base, atual = carregar(sys.argv[1]), carregar(sys.argv[2])
+    limite = float(sys.argv[3]) if len(sys.argv) > 3 else LIMITE_PERCENTUAL
+
+    print(f"base {base.get('commit')} x atual {atual.get('commit')} (limite +{limite:g}%)")
+    print(f"{'caso':<28}{'base':>12}{'atual':>12}{'variação':>12}")
+    linhas, regressoes = comparar(base, atual, limite)
+    for caso, anterior, medida, variacao in linhas:
+        marca = "  <- regressão" if variacao > limite else ""
+        print(f"{caso:<28}{anterior:>11.4f}s{medida:>11.4f}s{variacao:>+11.1f}%{marca}")
+
+    if regressoes:
+        print(f"{len(regressoes)} caso(s) acima do limite de +{limite:g}%.")
+        sys.exit(1)
+    print("Nenhuma regressão acima do limite.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""Suíte de benchmarks do modelo bancário (poo_banco + validadores).
+
+Mede os caminhos quentes em várias escalas e grava um JSON que pode ser
+comparado entre commits com ``benchmarks/comparar.py``:
+
+- ``criacao_conta``: PessoaFisica + ContaCorrente ligadas;
+- ``deposito_saque``: registro de Deposito/Saque já construídos;
+- ``busca_cpf``: RegistroClientes.buscar_cliente (CPF limpo e formatado);
+- ``extrato``: páginas de ``gerar_relatorio`` formatadas como no menu;
+- ``validadores``: nome, data, CPF e endereço de um cadastro.
+
+Cada caso roda ``REPETICOES`` vezes com o GC desligado (como o
+``timeit``) e guarda o menor tempo; escalas pequenas repetem a execução
+até somar ``TEMPO_MINIMO`` por medição. A preparação fica fora da medição.
+
+Uso: python benchmarks/suite.py [saida.json] [escalas separadas por vírgula]
+"""
+
+import gc
+import json
+import math
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_PATH))
+
+import validadores  # noqa: E402
+from dinheiro import Dinheiro  # noqa: E402
+from poo_banco import ContaCorrente, Deposito, PessoaFisica, RegistroClientes, Saque  # noqa: E402
+from sistema_bancario import FORMATO_DATA_HORA, TAMANHO_PAGINA_EXTRATO  # noqa: E402
+
+ESCALAS = (1_000, 100_000, 1_000_000)
+REPETICOES = 5
+TEMPO_MINIMO = 0.2
+VERSAO_FORMATO = 1
+DIRETORIO_RESULTADOS = ROOT_PATH / "benchmarks" / "resultados"
+ENDERECO = "Rua A, 1 - Centro - Cidade/SP"
+INICIO_NS = 1_700_000_000 * 10**9
+CONTAS_MOVIMENTADAS = 1_000
+
+
+def cpf_valido(indice):
+    base = [int(d) for d in f"{indice % 1_000_000_000:09d}"]
+    for pesos in (range(10, 1, -1), range(11, 1, -1)):
+        resto = sum(d * p for d, p in zip(base, pesos)) * 10 % 11
+        base.append(0 if resto == 10 else resto)
+    return "".join(map(str, base))
+
+
+def caso_criacao_conta(escala):
+    cpfs = [f"{indice:011d}" for indice in range(escala)]
+
+    def executar():
+        for numero, cpf in enumerate(cpfs, 1):
+            cliente = PessoaFisica(cpf, "Maria Souza", "10/04/1988", ENDERECO)
+            cliente.adicionar_conta(ContaCorrente(numero, "0001", cliente, limite=500.0, limite_saques=3))
+
+    return executar
+
+
+def caso_deposito_saque(escala):
+    cliente = PessoaFisica("39053344705", "Maria Souza", "10/04/1988", ENDERECO)
+    contas = [
+        ContaCorrente(numero, "0001", cliente, limite=Dinheiro(10**12), limite_saques=10**12)
+        for numero in range(1, CONTAS_MOVIMENTADAS + 1)
+    ]
+    for conta in contas:
+        conta.saldo = Dinheiro(10**12)
+    operacoes = [
+        (contas[indice % len(contas)], Saque(Dinheiro(100)) if indice % 3 == 0 else Deposito(Dinheiro(250)))
+        for indice in range(escala)
+    ]
+    realizar = cliente.realizar_transacao
+
+    def executar():
+        for conta, transacao in operacoes:
+            realizar(conta, transacao)
+
+    return executar
+
+
+def caso_busca_cpf(escala):
+    registro = RegistroClientes()
+    cpfs = [cpf_valido(indice) for indice in range(escala)]
+    for cpf in cpfs:
+        registro.adicionar_cliente(PessoaFisica(cpf, "Maria Souza", "10/04/1988", ENDERECO))
+    consultas = [validadores.formatar_cpf(cpf) if indice % 2 else cpf for indice, cpf in enumerate(cpfs)]
+    buscar = registro.buscar_cliente
+
+    def executar():
+        for cpf in consultas:
+            buscar(cpf)
+
+    return executar
+
+
+def caso_extrato(escala):
+    conta = ContaCorrente(1, "0001", PessoaFisica("39053344705", "Maria Souza", "10/04/1988", ENDERECO))
+    historico = conta.historico
+    for indice in range(escala):
+        transacao = Saque(Dinheiro(100)) if indice % 3 == 0 else Deposito(Dinheiro(250))
+        historico.adicionar_transacao(transacao, INICIO_NS + indice * 10**9)
+
+    def executar():
+        for pagina in historico.gerar_relatorio(tamanho=TAMANHO_PAGINA_EXTRATO):
+            "\n".join(
+                f"{t['data'].strftime(FORMATO_DATA_HORA)} - {t['tipo']}: R$ {t['valor']:.2f}" for t in pagina
+            )
+
+    return executar
+
+
+def caso_validadores(escala):
+    cadastros = [
+        ("Maria Souza Lima", f"{indice % 28 + 1:02d}/04/1988", cpf_valido(indice), ENDERECO)
+        for indice in range(escala)
+    ]
+
+    def executar():
+        for nome, data_nascimento, cpf, endereco in cadastros:
+            validadores.validar_nome(nome)
+            validadores.validar_data(data_nascimento)
+            validadores.validar_cpf(cpf)
+            validadores.validar_endereco(endereco)
+
+    return executar
+
+
+CASOS = {
+    "criacao_conta": caso_criacao_conta,
+    "deposito_saque": caso_deposito_saque,
+    "busca_cpf": caso_busca_cpf,
+    "extrato": caso_extrato,
+    "validadores": caso_validadores,
+}
+
+
+def medir(executar, repeticoes=REPETICOES):
+    """Tempo de uma execução em cada repetição; escalas pequenas rodam em laço até ``TEMPO_MINIMO``."""
+    gc_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        inicio = perf_counter()
+        executar()
+        primeira = perf_counter() - inicio
+        gc.collect()
+        voltas = max(1, math.ceil(TEMPO_MINIMO / primeira))
+        # Execução longa já serve de primeira repetição
+        tempos = [primeira] if voltas == 1 else []
+        while len(tempos) < repeticoes:
+            inicio = perf_counter()
+            for _ in range(voltas):
+                executar()
+            tempos.append((perf_counter() - inicio) / voltas)
+            gc.collect()  # ciclos cliente <-> conta das voltas anteriores, fora da medição
+    finally:
+        if gc_ativo:
+            gc.enable()
+    return tempos
+
+
+def commit_atual():
+    try:
+        saida = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_PATH, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return saida.stdout.strip()
+
+
+def executar_suite(escalas=ESCALAS, repeticoes=REPETICOES):
+    resultados = {}
+    for nome, preparar in CASOS.items():
+        for escala in escalas:
+            tempos = medir(preparar(escala), repeticoes)
+            melhor = min(tempos)
+            resultados[f"{nome}[{escala}]"] = {
+                "caso": nome,
+                "escala": escala,
+                "segundos": melhor,
+                "ns_por_item": melhor / escala * 1e9,
+                "repeticoes": tempos,
+            }
+            print(f"{nome:<16}{escala:>10,}{melhor:>11.4f}s{melhor / escala * 1e9:>12,.0f} ns/item")
+            gc.collect()
+    return {
+        "versao": VERSAO_FORMATO,
+        "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit_atual(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+
+
+def main():
+    escalas = ESCALAS
+    if len(sys.argv) > 2:
+        escalas = tuple(int(escala) for escala in sys.argv[2].split(","))
+
+    print(f"{'caso':<16}{'escala':>10}{'melhor':>12}{'':>20}")
+    relatorio = executar_suite(escalas)
+
+    if len(sys.argv) > 1:
+        saida = Path(sys.argv[1])
+    else:
+        saida = DIRETORIO_RESULTADOS / f"{relatorio['commit'] or 'sem-commit'}.json"
+    saida.parent.mkdir(parents=True, exist_ok=True)
+    saida.write_text(json.dumps(relatorio, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Resultados em: {saida}")
+
+
+if __name__ == "__main__":
+    main()
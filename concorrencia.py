@@ -0,0 +1,85 @@
+"""Execução concorrente de transações do poo_banco.
+
+``Saque.registrar`` faz verificar-e-alterar sobre ``saldo`` e
+``saques_realizados`` sem sincronização; com várias threads na mesma conta
+dois saques podem passar pela verificação antes de qualquer débito. Aqui
+cada transação roda segurando as travas de todas as contas que ela altera
+(``Transacao.contas_afetadas``).
+
+As travas são listradas: um número fixo de ``Lock`` e cada conta cai em
+uma listra pelo hash de (agência, número), então a memória não cresce com
+a quantidade de contas. Quando uma transação envolve mais de uma conta
+(transferências), as listras são adquiridas sempre em ordem crescente de
+índice, o que elimina deadlock entre transações cruzadas.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+LISTRAS = 1024
+
+
+class TravasContas:
+    def __init__(self, listras=LISTRAS):
+        self._travas = tuple(threading.Lock() for _ in range(listras))
+
+    def indice(self, conta):
+        return hash((conta.agencia, conta.numero)) % len(self._travas)
+
+    def trava(self, conta):
+        return self._travas[self.indice(conta)]
+
+    @contextmanager
+    def travar(self, *contas):
+        """Segura as travas das contas, adquiridas em ordem de listra e sem repetição."""
+        travas = [self._travas[i] for i in sorted({self.indice(conta) for conta in contas})]
+        for trava in travas:
+            trava.acquire()
+        try:
+            yield
+        finally:
+            for trava in reversed(travas):
+                trava.release()
+
+
+class ExecutorTransacoes:
+    """Executa transações em um ``ThreadPoolExecutor`` com travas por conta."""
+
+    def __init__(self, max_workers=None, listras=LISTRAS):
+        self.travas = TravasContas(listras)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="transacoes")
+
+    def executar(self, conta, transacao):
+        """Registra a transação na thread atual, com as contas envolvidas travadas."""
+        contas = transacao.contas_afetadas(conta)
+        if len(contas) == 1:
+            with self.travas.trava(contas[0]):
+                return transacao.registrar(conta)
+        with self.travas.travar(*contas):
+            return transacao.registrar(conta)
+
+    def aplicar_lote(self, conta, transacoes):
+        """``Conta.aplicar_lote`` (tudo ou nada) com as contas de todo o lote travadas."""
+        transacoes = list(transacoes)
+        contas = {id(c): c for t in transacoes for c in t.contas_afetadas(conta)}
+        contas.setdefault(id(conta), conta)
+        with self.travas.travar(*contas.values()):
+            return conta.aplicar_lote(transacoes)
+
+    def submeter(self, conta, transacao):
+        return self._pool.submit(self.executar, conta, transacao)
+
+    def executar_todas(self, operacoes):
+        """Distribui pares (conta, transacao) entre as threads; retorna os resultados na ordem."""
+        futuros = [self.submeter(conta, transacao) for conta, transacao in operacoes]
+        return [futuro.result() for futuro in futuros]
+
+    def fechar(self):
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
@@ -0,0 +1,165 @@
+"""Tipo monetário exato baseado em centavos inteiros.
+
+``Dinheiro`` guarda o valor como um ``int`` de centavos, então somas e
+subtrações são exatas e não dependem de ``float`` nem de ``Decimal``.
+Operações com ``int``/``float`` convertem o outro operando direto para
+centavos, sem criar objetos intermediários. Em laços muito quentes (como
+o ``LedgerEngine``) o ideal é operar direto sobre ``centavos``.
+"""
+
+import operator
+from decimal import ROUND_HALF_EVEN, Decimal
+from fractions import Fraction
+
+_novo = object.__new__
+
+
+def _centavos(valor):
+    if type(valor) is Dinheiro:
+        return valor.centavos
+    if isinstance(valor, int):
+        return valor * 100
+    if isinstance(valor, float):
+        return round(valor * 100)
+    if isinstance(valor, str):
+        return Dinheiro.de_texto(valor).centavos
+    if isinstance(valor, Decimal):
+        return int((valor * 100).to_integral_value(ROUND_HALF_EVEN))
+    raise TypeError(f"não é possível converter {type(valor).__name__} em Dinheiro")
+
+
+class Dinheiro:
+    __slots__ = ('centavos',)
+
+    def __init__(self, centavos=0):
+        self.centavos = centavos
+
+    @classmethod
+    def de(cls, valor):
+        """Converte Dinheiro, int/float (reais), str ou Decimal em Dinheiro."""
+        if type(valor) is cls:
+            return valor
+        return cls(_centavos(valor))
+
+    @classmethod
+    def de_texto(cls, texto):
+        """Lê ``100``, ``100,5``, ``100.50`` ou ``-3,25``; lança ValueError se inválido."""
+        texto = texto.strip()
+        negativo = texto[:1] == '-'
+        if negativo or texto[:1] == '+':
+            texto = texto[1:]
+        reais, separador, fracao = texto.replace(',', '.').partition('.')
+        if not (reais.isascii() and reais.isdigit()):
+            raise ValueError(f"valor monetário inválido: {texto!r}")
+        centavos = int(reais) * 100
+        if separador:
+            if not (1 <= len(fracao) <= 2 and fracao.isascii() and fracao.isdigit()):
+                raise ValueError(f"valor monetário inválido: {texto!r}")
+            centavos += int(fracao) * (10 if len(fracao) == 1 else 1)
+        return cls(-centavos if negativo else centavos)
+
+    def para_decimal(self):
+        return Decimal(self.centavos).scaleb(-2)
+
+    def __add__(self, outro):
+        novo = _novo(Dinheiro)
+        if type(outro) is Dinheiro:
+            novo.centavos = self.centavos + outro.centavos
+            return novo
+        try:
+            novo.centavos = self.centavos + _centavos(outro)
+        except TypeError:
+            return NotImplemented
+        return novo
+
+    __radd__ = __add__
+
+    def __sub__(self, outro):
+        novo = _novo(Dinheiro)
+        if type(outro) is Dinheiro:
+            novo.centavos = self.centavos - outro.centavos
+            return novo
+        try:
+            novo.centavos = self.centavos - _centavos(outro)
+        except TypeError:
+            return NotImplemented
+        return novo
+
+    def __rsub__(self, outro):
+        try:
+            return Dinheiro(_centavos(outro) - self.centavos)
+        except TypeError:
+            return NotImplemented
+
+    def __neg__(self):
+        return Dinheiro(-self.centavos)
+
+    def __abs__(self):
+        return Dinheiro(abs(self.centavos))
+
+    def __eq__(self, outro):
+        # Igualdade numérica exata (como entre int, float e Decimal), coerente com __hash__;
+        # texto não é comparado: Dinheiro(100) == "1" é False
+        if type(outro) is Dinheiro:
+            return self.centavos == outro.centavos
+        if isinstance(outro, int):
+            return self.centavos == outro * 100
+        if isinstance(outro, (float, Decimal, Fraction)):
+            return Fraction(self.centavos, 100) == outro
+        return NotImplemented
+
+    def _comparar(self, outro, operador):
+        # Mesma regra de __eq__: int em centavos, float/Decimal/Fraction pelo valor exato;
+        # texto e outros tipos não são ordenáveis com Dinheiro
+        if isinstance(outro, int):
+            return operador(self.centavos, outro * 100)
+        if isinstance(outro, (float, Decimal, Fraction)):
+            return operador(Fraction(self.centavos, 100), outro)
+        return NotImplemented
+
+    def __lt__(self, outro):
+        if type(outro) is Dinheiro:
+            return self.centavos < outro.centavos
+        return self._comparar(outro, operator.lt)
+
+    def __le__(self, outro):
+        if type(outro) is Dinheiro:
+            return self.centavos <= outro.centavos
+        return self._comparar(outro, operator.le)
+
+    def __gt__(self, outro):
+        if type(outro) is Dinheiro:
+            return self.centavos > outro.centavos
+        return self._comparar(outro, operator.gt)
+
+    def __ge__(self, outro):
+        if type(outro) is Dinheiro:
+            return self.centavos >= outro.centavos
+        return self._comparar(outro, operator.ge)
+
+    def __hash__(self):
+        # Mesmo hash do número que o valor representa: Dinheiro(100) e 1 caem na mesma chave
+        reais, resto = divmod(self.centavos, 100)
+        if resto == 0:
+            return hash(reais)
+        return hash(Fraction(self.centavos, 100))
+
+    def __bool__(self):
+        return self.centavos != 0
+
+    def __float__(self):
+        return self.centavos / 100
+
+    def __str__(self):
+        sinal = '-' if self.centavos < 0 else ''
+        reais, centavos = divmod(abs(self.centavos), 100)
+        return f"{sinal}{reais}.{centavos:02d}"
+
+    def __repr__(self):
+        return f"Dinheiro('{self}')"
+
+    def __format__(self, especificacao):
+        # '.2f' é o formato usado nos extratos; sai exato, sem passar por float
+        if especificacao in ('', '.2f'):
+            return str(self)
+        return format(float(self), especificacao)
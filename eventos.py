@@ -0,0 +1,165 @@
+"""Modo event-sourced para as contas do poo_banco.
+
+Em ``ContaEventos`` o saldo e a contagem de saques não são guardados: são
+derivados do fluxo de eventos imutáveis (``FluxoEventos``), que é o próprio
+histórico da conta, então histórico e saldo não têm como divergir. Cada
+``Deposito``/``Saque``/perna de ``Transferencia`` registrada vira um evento
+(tipo, valor, instante) e o estado é a dobra (fold) desses eventos.
+
+Para limitar o custo de reconstrução, a cada ``intervalo_snapshot`` eventos
+o estado acumulado é anotado: reconstruir parte do último snapshot e
+``saldo_em(data)`` parte do snapshot anterior à data, dobrando no máximo
+``intervalo_snapshot`` eventos. Cada evento guarda também o valor com o
+sinal do seu efeito (``_deltas``), então a dobra do saldo é um ``sum`` sobre
+um trecho do array, sem laço em Python.
+"""
+
+from array import array
+from bisect import bisect_right
+from operator import mul
+
+from dinheiro import Dinheiro
+from poo_banco import ContaCorrente, Historico, Transferencia
+
+INTERVALO_SNAPSHOT = 10_000
+
+# Efeito de cada tipo de evento: (sinal no saldo, conta como saque)
+EFEITOS = {
+    'Deposito': (1, 0),
+    'Saque': (-1, 1),
+    Transferencia.ENVIADA: (-1, 1),
+    Transferencia.RECEBIDA: (1, 0),
+}
+
+
+class FluxoEventos(Historico):
+    """Histórico que também é a fonte do estado da conta, com snapshots a cada K eventos."""
+
+    __slots__ = ('intervalo_snapshot', '_deltas', '_saldos', '_saques', '_saldo', '_saques_total')
+
+    def __init__(self, intervalo_snapshot=INTERVALO_SNAPSHOT):
+        super().__init__()
+        self.intervalo_snapshot = intervalo_snapshot
+        self._deltas = array('q')  # valor com o sinal do efeito no saldo
+        self._saldos = array('q', [0])  # estado após 0, K, 2K, ... eventos
+        self._saques = array('q', [0])
+        self._saldo = 0
+        self._saques_total = 0
+
+    @classmethod
+    def de_eventos(cls, valores, datas, tipos, intervalo_snapshot=INTERVALO_SNAPSHOT):
+        """Monta o fluxo a partir de colunas de eventos já ordenadas por data."""
+        fluxo = cls(intervalo_snapshot)
+        sinais = {codigo: cls._efeito(codigo)[0] for codigo in set(tipos)}
+        fluxo._valores = valores
+        fluxo._datas = datas
+        fluxo._tipos = tipos
+        fluxo._deltas = array('q', map(mul, valores, map(sinais.__getitem__, tipos)))
+        fluxo.reconstruir(usar_snapshots=False)
+        return fluxo
+
+    @staticmethod
+    def _efeito(codigo):
+        return EFEITOS[Historico._nomes_tipos[codigo]]
+
+    def _dobrar(self, inicio, fim):
+        """Variação de (saldo, saques) causada pelos eventos ``inicio:fim``."""
+        tipos = self._tipos[inicio:fim]
+        saques = sum(tipos.count(codigo) for codigo in set(tipos) if self._efeito(codigo)[1])
+        return sum(self._deltas[inicio:fim]), saques
+
+    def _aplicar(self, indice):
+        sinal, saque = self._efeito(self._tipos[indice])
+        delta = sinal * self._valores[indice]
+        self._deltas.append(delta)
+        self._saldo += delta
+        self._saques_total += saque
+        if (indice + 1) % self.intervalo_snapshot == 0:
+            self._saldos.append(self._saldo)
+            self._saques.append(self._saques_total)
+
+    def adicionar_transacao(self, transacao, data_ns=None):
+        super().adicionar_transacao(transacao, data_ns)
+        self._aplicar(len(self._valores) - 1)
+
+    def adicionar_vinculada(self, tipo, valor, data_ns, contraparte):
+        super().adicionar_vinculada(tipo, valor, data_ns, contraparte)
+        self._aplicar(len(self._valores) - 1)
+
+    def adicionar_lote(self, transacoes):
+        inicio = len(self._valores)
+        super().adicionar_lote(transacoes)
+        for indice in range(inicio, len(self._valores)):
+            self._aplicar(indice)
+
+    @property
+    def saldo_centavos(self):
+        return self._saldo
+
+    @property
+    def saques_realizados(self):
+        return self._saques_total
+
+    def reconstruir(self, usar_snapshots=True):
+        """Recalcula o estado pelos eventos; sem snapshots, refaz também os snapshots."""
+        intervalo = self.intervalo_snapshot
+        total = len(self._valores)
+        if usar_snapshots:
+            blocos = len(self._saldos) - 1
+            saldo, saques = self._dobrar(blocos * intervalo, total)
+            self._saldo = self._saldos[blocos] + saldo
+            self._saques_total = self._saques[blocos] + saques
+            return self._saldo, self._saques_total
+
+        saldos, saques_snapshot = array('q', [0]), array('q', [0])
+        saldo = saques = 0
+        for inicio in range(0, total - total % intervalo, intervalo):
+            delta_saldo, delta_saques = self._dobrar(inicio, inicio + intervalo)
+            saldo += delta_saldo
+            saques += delta_saques
+            saldos.append(saldo)
+            saques_snapshot.append(saques)
+        delta_saldo, delta_saques = self._dobrar(total - total % intervalo, total)
+        self._saldos, self._saques = saldos, saques_snapshot
+        self._saldo, self._saques_total = saldo + delta_saldo, saques + delta_saques
+        return self._saldo, self._saques_total
+
+    def saldo_em(self, instante):
+        """Saldo em centavos considerando os eventos com data <= ``instante``."""
+        fim = bisect_right(self._datas, self._para_ns(instante))
+        bloco = min(fim // self.intervalo_snapshot, len(self._saldos) - 1)
+        return self._saldos[bloco] + sum(self._deltas[bloco * self.intervalo_snapshot:fim])
+
+
+class ContaEventos(ContaCorrente):
+    """ContaCorrente cujo saldo e saques são derivados do seu FluxoEventos."""
+
+    __slots__ = ()
+
+    def __init__(self, numero, agencia, cliente, limite=500.0, limite_saques=3,
+                 intervalo_snapshot=INTERVALO_SNAPSHOT):
+        super().__init__(numero, agencia, cliente, limite=limite, limite_saques=limite_saques)
+        self.historico = FluxoEventos(intervalo_snapshot)
+
+    # Deposito/Saque.registrar escrevem saldo e saques além de gravar o
+    # evento; aqui o estado só muda pelo evento, então essas escritas são
+    # descartadas.
+
+    @property
+    def saldo(self):
+        return Dinheiro(self.historico.saldo_centavos)
+
+    @saldo.setter
+    def saldo(self, valor):
+        pass
+
+    @property
+    def saques_realizados(self):
+        return self.historico.saques_realizados
+
+    @saques_realizados.setter
+    def saques_realizados(self, valor):
+        pass
+
+    def saldo_em(self, instante):
+        return Dinheiro(self.historico.saldo_em(instante))
@@ -0,0 +1,148 @@
+"""Importação em massa de clientes a partir de CSV.
+
+O arquivo é lido em streaming com ``csv.DictReader`` (colunas ``nome``,
+``data_nascimento``, ``cpf`` e ``endereco``) e dividido em lotes. Cada lote
+é validado em um ``ProcessPoolExecutor`` com os mesmos validadores do
+cadastro interativo; só alguns lotes ficam em memória ao mesmo tempo.
+Linhas válidas são cadastradas pela função ``cadastrar`` recebida (no
+menu, ``sistema_bancario.cadastrar_cliente``); as demais vão para um CSV
+de rejeitados com o motivo. O módulo não importa o ``sistema_bancario``:
+quando ele roda como script é o ``__main__``, e importá-lo de novo criaria
+uma segunda cópia com outro registro.
+
+Uso: python importacao.py clientes.csv [rejeitados.csv]
+"""
+
+import csv
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+from validadores import MENSAGENS, validar_cpf, validar_data, validar_endereco, validar_nome
+
+COLUNAS = ("nome", "data_nascimento", "cpf", "endereco")
+TAMANHO_LOTE = 5_000
+MOTIVO_DUPLICADO_ARQUIVO = "CPF repetido no arquivo."
+MOTIVO_JA_CADASTRADO = "CPF já cadastrado!"
+
+
+def validar_lote(linhas):
+    """Valida tuplas (nome, data, cpf, endereço); retorna (cpf, erro) por linha."""
+    resultados = []
+    for nome, data_nascimento, cpf, endereco in linhas:
+        erro = validar_nome(nome) or validar_data(data_nascimento)
+        cpf_digitos = None
+        if erro is None:
+            cpf_digitos, erro = validar_cpf(cpf)
+        if erro is None:
+            erro = validar_endereco(endereco)
+        resultados.append((cpf_digitos, erro))
+    return resultados
+
+
+def _ler_lotes(leitor, tamanho_lote):
+    lote = []
+    for linha in leitor:
+        lote.append((leitor.line_num, tuple(linha.get(coluna) or "" for coluna in COLUNAS)))
+        if len(lote) >= tamanho_lote:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def importar_clientes(
+    caminho, registro, cadastrar, salvar=None, caminho_rejeitados=None, tamanho_lote=TAMANHO_LOTE, processos=None
+):
+    """Importa o CSV e retorna um resumo da execução.
+
+    ``registro`` é o RegistroClientes usado para barrar CPFs já cadastrados;
+    ``cadastrar(cpf, nome, data_nascimento, endereco, registrar_diario=False)``
+    cria cada cliente e ``salvar()``, se informado, grava o estado ao final.
+    """
+    caminho = Path(caminho)
+    if caminho_rejeitados is None:
+        caminho_rejeitados = caminho.with_name(f"{caminho.stem}_rejeitados.csv")
+    processos = processos or os.cpu_count() or 1
+
+    lidas = importadas = rejeitadas = 0
+    cpfs_do_arquivo = set()
+    inicio = perf_counter()
+
+    with (
+        open(caminho, newline="", encoding="utf-8") as arquivo,
+        open(caminho_rejeitados, "w", newline="", encoding="utf-8") as arquivo_rejeitados,
+        ProcessPoolExecutor(max_workers=processos) as executor,
+    ):
+        leitor = csv.DictReader(arquivo)
+        escritor = csv.writer(arquivo_rejeitados)
+        escritor.writerow(("linha", *COLUNAS, "motivo"))
+
+        def processar(lote, futuro):
+            nonlocal importadas, rejeitadas
+            for (numero_linha, campos), (cpf_digitos, erro) in zip(lote, futuro.result()):
+                if erro is not None:
+                    motivo = MENSAGENS[erro]
+                elif cpf_digitos in cpfs_do_arquivo:
+                    motivo = MOTIVO_DUPLICADO_ARQUIVO
+                elif registro.possui_cpf(cpf_digitos):
+                    motivo = MOTIVO_JA_CADASTRADO
+                else:
+                    cpfs_do_arquivo.add(cpf_digitos)
+                    nome, data_nascimento, _, endereco = campos
+                    cadastrar(cpf_digitos, nome, data_nascimento, endereco, registrar_diario=False)
+                    importadas += 1
+                    continue
+                escritor.writerow((numero_linha, *campos, motivo))
+                rejeitadas += 1
+
+        # Poucos lotes em voo: a leitura acompanha o ritmo da validação
+        pendentes = deque()
+        for lote in _ler_lotes(leitor, tamanho_lote):
+            lidas += len(lote)
+            pendentes.append((lote, executor.submit(validar_lote, [campos for _, campos in lote])))
+            if len(pendentes) > processos * 2:
+                processar(*pendentes.popleft())
+        while pendentes:
+            processar(*pendentes.popleft())
+
+    # Um snapshot ao final substitui milhares de registros no diário
+    if importadas and salvar is not None:
+        salvar()
+
+    segundos = perf_counter() - inicio
+    resumo = {
+        "lidas": lidas,
+        "importadas": importadas,
+        "rejeitadas": rejeitadas,
+        "segundos": segundos,
+        "linhas_por_segundo": lidas / segundos if segundos else 0.0,
+        "rejeitados": str(caminho_rejeitados),
+    }
+    print(
+        f"Importação concluída: {lidas} linhas lidas, {importadas} importadas, {rejeitadas} rejeitadas "
+        f"em {segundos:.2f}s ({resumo['linhas_por_segundo']:,.0f} linhas/s)."
+    )
+    if rejeitadas:
+        print(f"Rejeitados em: {caminho_rejeitados}")
+    return resumo
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    import sistema_bancario
+
+    sistema_bancario.iniciar_persistencia()
+    importar_clientes(
+        sys.argv[1],
+        sistema_bancario.registro,
+        sistema_bancario.cadastrar_cliente,
+        sistema_bancario.salvar_estado,
+        *sys.argv[2:3],
+    )
+    sistema_bancario.encerrar_persistencia()
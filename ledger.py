@@ -0,0 +1,154 @@
+"""Motor de lançamentos vetorizado (NumPy) para as contas do poo_banco.
+
+Saldos, saques realizados e limites de todas as contas ficam em arrays
+``int64`` (valores em centavos, como em ``Dinheiro``) indexados pelo
+número da conta. Um lote de operações (conta, tipo, valor) é aplicado com
+as mesmas regras de ``Deposito.registrar`` e ``Saque.registrar``/
+``ContaCorrente.pode_sacar``, mas checadas em bloco.
+
+Só os saques dependem da ordem (o saldo que enxergam inclui os depósitos
+anteriores da conta). O lote é dividido em segmentos por conta: o segmento
+de uma operação é quantos saques da mesma conta vieram antes dela. A cada
+rodada, todos os depósitos do segmento entram de uma vez (``np.add.at``)
+e em seguida o saque que fecha o segmento de cada conta é avaliado. O
+número de rodadas é a maior quantidade de saques de uma única conta no
+lote mais um; depósitos nunca abrem rodadas novas.
+"""
+
+import numpy as np
+
+from dinheiro import Dinheiro
+from poo_banco import ContaCorrente
+
+DEPOSITO = 0
+SAQUE = 1
+
+SEM_LIMITE = np.iinfo(np.int64).max
+
+
+class LedgerEngine:
+    def __init__(self, capacidade=1024):
+        self.saldos = np.zeros(capacidade, dtype=np.int64)
+        self.saques_realizados = np.zeros(capacidade, dtype=np.int64)
+        self.limites = np.full(capacidade, SEM_LIMITE, dtype=np.int64)
+        self.limites_saques = np.full(capacidade, SEM_LIMITE, dtype=np.int64)
+
+    def _garantir_capacidade(self, numero):
+        capacidade = len(self.saldos)
+        if numero < capacidade:
+            return
+        nova = max(numero + 1, capacidade * 2)
+        zeros = np.zeros(nova - capacidade, dtype=np.int64)
+        sem_limite = np.full(nova - capacidade, SEM_LIMITE, dtype=np.int64)
+        self.saldos = np.concatenate([self.saldos, zeros])
+        self.saques_realizados = np.concatenate([self.saques_realizados, zeros])
+        self.limites = np.concatenate([self.limites, sem_limite])
+        self.limites_saques = np.concatenate([self.limites_saques, sem_limite])
+
+    def vincular(self, conta):
+        """Copia o estado da conta para os arrays e retorna uma ContaLedger equivalente."""
+        numero = conta.numero
+        self._garantir_capacidade(numero)
+        limite = getattr(conta, 'limite', None)
+        self.saldos[numero] = conta.saldo.centavos
+        self.saques_realizados[numero] = conta.saques_realizados
+        self.limites[numero] = SEM_LIMITE if limite is None else limite.centavos
+        self.limites_saques[numero] = getattr(conta, 'limite_saques', SEM_LIMITE)
+        return ContaLedger(self, numero, conta.agencia, conta.cliente, conta.historico)
+
+    def aplicar_lote(self, contas, tipos, valores):
+        """Aplica o lote (valores em centavos) e retorna o resultado de cada operação."""
+        contas = np.asarray(contas, dtype=np.int64)
+        tipos = np.asarray(tipos, dtype=np.int8)
+        valores = np.asarray(valores, dtype=np.int64)
+        total = len(contas)
+        resultados = np.zeros(total, dtype=bool)
+        if total == 0:
+            return resultados
+
+        # Segmento de cada operação: saques da mesma conta que vieram antes dela
+        ordem = np.argsort(contas, kind='stable')
+        contas_ordenadas = contas[ordem]
+        saques_ordenados = (tipos[ordem] == SAQUE).astype(np.int64)
+        saques_antes = np.cumsum(saques_ordenados) - saques_ordenados
+        inicio_grupo = np.empty(total, dtype=bool)
+        inicio_grupo[0] = True
+        np.not_equal(contas_ordenadas[1:], contas_ordenadas[:-1], out=inicio_grupo[1:])
+        segmento = np.empty(total, dtype=np.int64)
+        segmento[ordem] = saques_antes - np.maximum.accumulate(np.where(inicio_grupo, saques_antes, 0))
+
+        por_segmento = np.argsort(segmento, kind='stable')
+        limites_segmentos = np.cumsum(np.bincount(segmento))
+        inicio = 0
+        for fim in limites_segmentos:
+            selecao = por_segmento[inicio:fim]
+            inicio = fim
+            t = tipos[selecao]
+            v = valores[selecao]
+
+            # Depósitos do segmento: independentes entre si, somados em bloco (a mesma conta pode repetir)
+            deposito_ok = (t == DEPOSITO) & (v > 0)
+            np.add.at(self.saldos, contas[selecao[deposito_ok]], v[deposito_ok])
+            resultados[selecao[deposito_ok]] = True
+
+            # No máximo um saque por conta no segmento: avaliados juntos, depois dos depósitos
+            saques = selecao[t == SAQUE]
+            c = contas[saques]
+            v = valores[saques]
+            saldo = self.saldos[c]
+            saque_ok = (
+                (v > 0)
+                & (v <= saldo)
+                & (self.saques_realizados[c] < self.limites_saques[c])
+                & (v <= self.limites[c])
+            )
+            self.saldos[c] = np.where(saque_ok, saldo - v, saldo)
+            self.saques_realizados[c] += saque_ok
+            resultados[saques] = saque_ok
+
+        return resultados
+
+
+class ContaLedger(ContaCorrente):
+    """ContaCorrente cujo estado numérico vive nos arrays de um LedgerEngine."""
+
+    __slots__ = ('_motor',)
+
+    def __init__(self, motor, numero, agencia, cliente, historico):
+        self._motor = motor
+        self.numero = numero
+        self.agencia = agencia
+        self.cliente = cliente
+        self.historico = historico
+
+    @property
+    def saldo(self):
+        return Dinheiro(int(self._motor.saldos[self.numero]))
+
+    @saldo.setter
+    def saldo(self, valor):
+        self._motor.saldos[self.numero] = Dinheiro.de(valor).centavos
+
+    @property
+    def saques_realizados(self):
+        return int(self._motor.saques_realizados[self.numero])
+
+    @saques_realizados.setter
+    def saques_realizados(self, valor):
+        self._motor.saques_realizados[self.numero] = valor
+
+    @property
+    def limite(self):
+        return Dinheiro(int(self._motor.limites[self.numero]))
+
+    @limite.setter
+    def limite(self, valor):
+        self._motor.limites[self.numero] = Dinheiro.de(valor).centavos
+
+    @property
+    def limite_saques(self):
+        return int(self._motor.limites_saques[self.numero])
+
+    @limite_saques.setter
+    def limite_saques(self, valor):
+        self._motor.limites_saques[self.numero] = valor
@@ -0,0 +1,412 @@
+"""Persistência do banco em memória: snapshot binário + diário append-only.
+
+O snapshot guarda clientes, contas, saldos e históricos em colunas, com a
+outra ponta de cada entrada de transferência: os textos de cada campo são
+unidos por ``\\n`` em um único bloco UTF-8 e os números vão como
+``array('q')``, então a carga é dominada pela criação dos objetos e não
+pelo parsing. Entre um snapshot e outro, cada cadastro, depósito, saque e
+transferência vira um registro curto no diário, gravado em buffer e
+sincronizado com ``fsync`` em grupos; um temporizador garante que nenhum
+registro espere mais que ``intervalo_fsync`` pelo disco, mesmo que não
+chegue outra escrita. Na inicialização o snapshot é lido e o diário
+reaplicado por cima; ``salvar_snapshot`` consolida tudo e zera o diário.
+
+Snapshot e diário carregam um número de geração: o snapshot da geração N
+já contém tudo o que estava no diário N, então um diário só é reaplicado
+se for de geração maior. Assim uma queda entre gravar o snapshot e zerar
+o diário não duplica movimentos.
+"""
+
+import gc
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from functools import partial
+from pathlib import Path
+
+from dinheiro import Dinheiro
+from poo_banco import ContaCorrente, Deposito, Historico, PessoaFisica, Saque, Transferencia
+from repositorio import Repositorio
+
+ROOT_PATH = Path(__file__).parent
+DIRETORIO_DADOS = ROOT_PATH / "dados"
+
+MAGICO = b"SBNK"
+MAGICO_DIARIO = b"SBDI"
+VERSAO = 2  # 2: blocos de contrapartes das transferências; a versão 1 ainda é lida
+GERACAO = struct.Struct("<Q")
+
+REGISTRO_CLIENTE = 1
+REGISTRO_DEPOSITO = 2
+REGISTRO_SAQUE = 3
+REGISTRO_TRANSFERENCIA = 4
+
+CABECALHO = struct.Struct("<BI")  # tipo do registro, tamanho do conteúdo
+CONTA = struct.Struct("<qqq")  # número da conta, limite (centavos), limite de saques
+MOVIMENTO = struct.Struct("<qqq")  # número da conta, valor (centavos), data (epoch ns)
+TRANSFERENCIA = struct.Struct("<qqqq")  # conta de origem, conta de destino, valor (centavos), data (epoch ns)
+TAMANHO_BLOCO = struct.Struct("<Q")
+
+GRUPO_FSYNC = 64
+INTERVALO_FSYNC = 0.05
+
+
+def _bytes_array(valores):
+    if sys.byteorder == "big":
+        valores = array(valores.typecode, valores)
+        valores.byteswap()
+    return valores.tobytes()
+
+
+def _array_bytes(typecode, dados):
+    valores = array(typecode)
+    valores.frombytes(dados)
+    if sys.byteorder == "big":
+        valores.byteswap()
+    return valores
+
+
+def _textos_bytes(textos):
+    textos = tuple(textos)
+    juntos = "\n".join(textos)
+    # Um "\n" dentro de um texto desalinharia todas as colunas na leitura
+    if juntos.count("\n") != max(len(textos) - 1, 0):
+        raise ValueError("texto com quebra de linha não pode ser gravado")
+    return juntos.encode("utf-8")
+
+
+def _bytes_textos(dados):
+    return dados.decode("utf-8").split("\n") if dados else []
+
+
+class Persistencia(Repositorio):
+    def __init__(self, diretorio=DIRETORIO_DADOS, grupo_fsync=GRUPO_FSYNC, intervalo_fsync=INTERVALO_FSYNC):
+        self.diretorio = Path(diretorio)
+        self.caminho_snapshot = self.diretorio / "banco.snapshot"
+        self.caminho_diario = self.diretorio / "banco.diario"
+        self.grupo_fsync = grupo_fsync
+        self.intervalo_fsync = intervalo_fsync
+        self._diario = None
+        self._geracao = 0
+        self._pendentes = 0
+        self._ultimo_fsync = time.monotonic()
+        self._temporizador = None
+        self._trava = threading.RLock()  # diário usado pelas operações e pelo temporizador
+
+    # ---------------------------------------------------------------- carga
+
+    def carregar(self, registro):
+        """Lê o snapshot, reaplica o diário e deixa o diário aberto para novos registros."""
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        geracao_snapshot = 0
+        if self.caminho_snapshot.exists():
+            # Milhões de objetos novos e nenhum ciclo: o GC só atrasaria a carga
+            gc_ativo = gc.isenabled()
+            gc.disable()
+            try:
+                geracao_snapshot = self._ler_snapshot(registro)
+            finally:
+                if gc_ativo:
+                    gc.enable()
+
+        geracao_diario = self._ler_geracao_diario()
+        if geracao_diario > geracao_snapshot:
+            self._reaplicar_diario(registro)
+            self._geracao = geracao_diario
+            self._diario = open(self.caminho_diario, "ab")
+        else:
+            self._abrir_novo_diario(geracao_snapshot + 1)
+
+    def _ler_geracao_diario(self):
+        if not self.caminho_diario.exists():
+            return 0
+        with open(self.caminho_diario, "rb") as arquivo:
+            cabecalho = arquivo.read(len(MAGICO_DIARIO) + GERACAO.size)
+        if len(cabecalho) < len(MAGICO_DIARIO) + GERACAO.size or not cabecalho.startswith(MAGICO_DIARIO):
+            return 0
+        return GERACAO.unpack_from(cabecalho, len(MAGICO_DIARIO))[0]
+
+    def _abrir_novo_diario(self, geracao):
+        with self._trava:
+            if self._diario is not None:
+                self._diario.close()
+            self._geracao = geracao
+            self._diario = open(self.caminho_diario, "wb")
+            self._diario.write(MAGICO_DIARIO + GERACAO.pack(geracao))
+            self._diario.flush()
+            os.fsync(self._diario.fileno())
+            self._pendentes = 0
+
+    def _ler_snapshot(self, registro):
+        """Carrega o snapshot no registro e retorna a sua geração."""
+        with open(self.caminho_snapshot, "rb") as arquivo:
+            dados = memoryview(arquivo.read())
+        if bytes(dados[:4]) != MAGICO or dados[4] not in (1, VERSAO):
+            raise ValueError(f"snapshot inválido: {self.caminho_snapshot}")
+        (geracao,) = GERACAO.unpack_from(dados, 5)
+
+        blocos = []
+        posicao = 5 + GERACAO.size
+        while posicao < len(dados):
+            (tamanho,) = TAMANHO_BLOCO.unpack_from(dados, posicao)
+            posicao += TAMANHO_BLOCO.size
+            blocos.append(dados[posicao:posicao + tamanho])
+            posicao += tamanho
+
+        (nomes_tipos, cpfs, nomes, nascimentos, enderecos, agencias,
+         titulares, numeros, saldos, saques, limites, limites_saques,
+         quantidades, valores, datas, tipos, *contrapartes) = blocos
+        if contrapartes:
+            posicoes, agencias_contra, numeros_contra = contrapartes
+            # Posição global (crescente) no histórico concatenado -> (agencia, numero)
+            contrapartes = list(zip(
+                _array_bytes("q", posicoes),
+                zip(_bytes_textos(bytes(agencias_contra)), _array_bytes("q", numeros_contra)),
+            ))
+        proxima_contraparte = 0
+
+        # Os códigos de tipo do arquivo são remapeados para os desta execução
+        mapa_tipos = bytes(Historico.codigo_do_tipo(nome) for nome in _bytes_textos(bytes(nomes_tipos)))
+        tipos = bytes(tipos).translate(mapa_tipos.ljust(256, b"\0"))
+
+        clientes = [
+            PessoaFisica(cpf, nome, nascimento, endereco)
+            for cpf, nome, nascimento, endereco in zip(
+                _bytes_textos(bytes(cpfs)),
+                _bytes_textos(bytes(nomes)),
+                _bytes_textos(bytes(nascimentos)),
+                _bytes_textos(bytes(enderecos)),
+            )
+        ]
+        for cliente in clientes:
+            registro.adicionar_cliente(cliente)
+
+        valores = _array_bytes("q", valores)
+        datas = _array_bytes("q", datas)
+        tipos = _array_bytes("B", tipos)
+        # Contas montadas sem passar por __init__: evita criar um Historico
+        # vazio e um Dinheiro de limite por conta só para descartá-los
+        nova_conta = ContaCorrente.__new__
+        historico_vazio = Historico
+        de_colunas = Historico.de_colunas
+        inicio = 0
+        for agencia, titular, numero, saldo, saque, limite, limite_saques, quantidade in zip(
+            _bytes_textos(bytes(agencias)),
+            _array_bytes("q", titulares),
+            _array_bytes("q", numeros),
+            _array_bytes("q", saldos),
+            _array_bytes("q", saques),
+            _array_bytes("q", limites),
+            _array_bytes("q", limites_saques),
+            _array_bytes("q", quantidades),
+        ):
+            cliente = clientes[titular]
+            conta = nova_conta(ContaCorrente)
+            conta.numero = numero
+            conta.agencia = agencia
+            conta.cliente = cliente
+            conta.saldo = Dinheiro(saldo)
+            conta.saques_realizados = saque
+            conta.limite = Dinheiro(limite)
+            conta.limite_saques = limite_saques
+            if quantidade:
+                fim = inicio + quantidade
+                vinculadas = None
+                while proxima_contraparte < len(contrapartes) and contrapartes[proxima_contraparte][0] < fim:
+                    posicao, contraparte = contrapartes[proxima_contraparte]
+                    vinculadas = vinculadas or {}
+                    vinculadas[posicao - inicio] = contraparte
+                    proxima_contraparte += 1
+                conta.historico = de_colunas(
+                    valores[inicio:fim], datas[inicio:fim], tipos[inicio:fim], vinculadas
+                )
+                inicio = fim
+            else:
+                conta.historico = historico_vazio()
+            cliente.adicionar_conta(conta)
+            registro.adicionar_conta(conta)
+        return geracao
+
+    def _reaplicar_diario(self, registro):
+        with open(self.caminho_diario, "rb") as arquivo:
+            dados = arquivo.read()
+
+        posicao = len(MAGICO_DIARIO) + GERACAO.size
+        while posicao + CABECALHO.size <= len(dados):
+            tipo, tamanho = CABECALHO.unpack_from(dados, posicao)
+            fim = posicao + CABECALHO.size + tamanho
+            if fim > len(dados):
+                break
+            conteudo = dados[posicao + CABECALHO.size:fim]
+            if tipo == REGISTRO_CLIENTE:
+                self._reaplicar_cliente(registro, conteudo)
+            elif tipo in (REGISTRO_DEPOSITO, REGISTRO_SAQUE):
+                self._reaplicar_movimento(registro, tipo, conteudo)
+            elif tipo == REGISTRO_TRANSFERENCIA:
+                self._reaplicar_transferencia(registro, conteudo)
+            posicao = fim
+
+        if posicao < len(dados):
+            # Registro incompleto no fim (queda no meio da escrita): descarta
+            with open(self.caminho_diario, "r+b") as arquivo:
+                arquivo.truncate(posicao)
+
+    @staticmethod
+    def _reaplicar_cliente(registro, conteudo):
+        numero, limite, limite_saques = CONTA.unpack_from(conteudo)
+        cpf, nome, nascimento, endereco, agencia = _bytes_textos(conteudo[CONTA.size:])
+        cliente = registro.buscar_cliente(cpf)
+        if cliente is None:
+            cliente = PessoaFisica(cpf, nome, nascimento, endereco)
+            registro.adicionar_cliente(cliente)
+        conta = ContaCorrente(numero, agencia, cliente, limite=Dinheiro(limite), limite_saques=limite_saques)
+        cliente.adicionar_conta(conta)
+        registro.adicionar_conta(conta)
+
+    @staticmethod
+    def _reaplicar_movimento(registro, tipo, conteudo):
+        numero, centavos, data_ns = MOVIMENTO.unpack(conteudo)
+        conta = registro.buscar_conta(numero)
+        valor = Dinheiro(centavos)
+        if tipo == REGISTRO_DEPOSITO:
+            conta.saldo += valor
+            conta.historico.adicionar_transacao(Deposito(valor), data_ns)
+        else:
+            conta.saldo -= valor
+            conta.saques_realizados += 1
+            conta.historico.adicionar_transacao(Saque(valor), data_ns)
+
+    @staticmethod
+    def _reaplicar_transferencia(registro, conteudo):
+        numero_origem, numero_destino, centavos, data_ns = TRANSFERENCIA.unpack(conteudo)
+        origem = registro.buscar_conta(numero_origem)
+        destino = registro.buscar_conta(numero_destino)
+        valor = Dinheiro(centavos)
+        origem.saldo -= valor
+        origem.saques_realizados += 1
+        destino.saldo += valor
+        origem.historico.adicionar_vinculada(Transferencia.ENVIADA, valor, data_ns, (destino.agencia, destino.numero))
+        destino.historico.adicionar_vinculada(Transferencia.RECEBIDA, valor, data_ns, (origem.agencia, origem.numero))
+
+    # -------------------------------------------------------------- diário
+
+    def _escrever(self, tipo, conteudo):
+        with self._trava:
+            self._diario.write(CABECALHO.pack(tipo, len(conteudo)) + conteudo)
+            self._pendentes += 1
+            agora = time.monotonic()
+            if self._pendentes >= self.grupo_fsync or agora - self._ultimo_fsync >= self.intervalo_fsync:
+                self.sincronizar()
+            elif self._temporizador is None:
+                # Fim de rajada: sem nova escrita, o temporizador sincroniza o que ficou no buffer
+                self._temporizador = threading.Timer(self.intervalo_fsync, self.sincronizar)
+                self._temporizador.daemon = True
+                self._temporizador.start()
+
+    def sincronizar(self):
+        with self._trava:
+            if self._temporizador is not None:
+                self._temporizador.cancel()
+                self._temporizador = None
+            if self._diario is None or not self._pendentes:
+                return
+            self._diario.flush()
+            os.fsync(self._diario.fileno())
+            self._pendentes = 0
+            self._ultimo_fsync = time.monotonic()
+
+    def registrar_cliente(self, conta):
+        self.preparar_cliente(conta)()
+
+    def registrar_transacao(self, conta, transacao):
+        self.preparar_transacao(conta, transacao)()
+
+    def preparar_cliente(self, conta):
+        cliente = conta.cliente
+        conteudo = CONTA.pack(conta.numero, conta.limite.centavos, conta.limite_saques) + _textos_bytes(
+            (cliente.cpf, cliente.nome, cliente.data_nascimento, cliente.endereco, conta.agencia)
+        )
+        return partial(self._escrever, REGISTRO_CLIENTE, conteudo)
+
+    def preparar_transacao(self, conta, transacao):
+        if isinstance(transacao, Transferencia):
+            conteudo = TRANSFERENCIA.pack(
+                conta.numero, transacao.destino.numero, transacao.valor.centavos, conta.historico.ultima_data_ns()
+            )
+            return partial(self._escrever, REGISTRO_TRANSFERENCIA, conteudo)
+        if isinstance(transacao, Saque):
+            tipo = REGISTRO_SAQUE
+        elif isinstance(transacao, Deposito):
+            tipo = REGISTRO_DEPOSITO
+        else:
+            raise TypeError(f"o diário não registra {type(transacao).__name__}")
+        conteudo = MOVIMENTO.pack(conta.numero, transacao.valor.centavos, conta.historico.ultima_data_ns())
+        return partial(self._escrever, tipo, conteudo)
+
+    # ------------------------------------------------------------ snapshot
+
+    def salvar_snapshot(self, registro):
+        """Grava o estado completo em um novo snapshot e zera o diário."""
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        clientes = list(registro.clientes)
+        indice_cliente = {id(cliente): indice for indice, cliente in enumerate(clientes)}
+        contas = list(registro.contas)
+
+        valores, datas, tipos = array("q"), array("q"), array("B")
+        quantidades = array("q")
+        posicoes_contra, agencias_contra, numeros_contra = array("q"), [], array("q")
+        for conta in contas:
+            valores_conta, datas_conta, tipos_conta = conta.historico.colunas()
+            vinculadas = conta.historico.contrapartes()
+            if vinculadas:
+                for indice, (agencia, numero) in sorted(vinculadas.items()):
+                    posicoes_contra.append(len(valores) + indice)
+                    agencias_contra.append(agencia)
+                    numeros_contra.append(numero)
+            valores.extend(valores_conta)
+            datas.extend(datas_conta)
+            tipos.extend(tipos_conta)
+            quantidades.append(len(valores_conta))
+
+        blocos = (
+            _textos_bytes(Historico.nomes_tipos()),
+            _textos_bytes(c.cpf for c in clientes),
+            _textos_bytes(c.nome for c in clientes),
+            _textos_bytes(c.data_nascimento for c in clientes),
+            _textos_bytes(c.endereco for c in clientes),
+            _textos_bytes(c.agencia for c in contas),
+            _bytes_array(array("q", (indice_cliente[id(c.cliente)] for c in contas))),
+            _bytes_array(array("q", (c.numero for c in contas))),
+            _bytes_array(array("q", (c.saldo.centavos for c in contas))),
+            _bytes_array(array("q", (c.saques_realizados for c in contas))),
+            _bytes_array(array("q", (c.limite.centavos for c in contas))),
+            _bytes_array(array("q", (c.limite_saques for c in contas))),
+            _bytes_array(quantidades),
+            _bytes_array(valores),
+            _bytes_array(datas),
+            _bytes_array(tipos),
+            _bytes_array(posicoes_contra),
+            _textos_bytes(agencias_contra),
+            _bytes_array(numeros_contra),
+        )
+
+        temporario = self.caminho_snapshot.with_suffix(".tmp")
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(MAGICO + bytes((VERSAO,)) + GERACAO.pack(self._geracao))
+            for bloco in blocos:
+                arquivo.write(TAMANHO_BLOCO.pack(len(bloco)))
+                arquivo.write(bloco)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, self.caminho_snapshot)
+        self._abrir_novo_diario(self._geracao + 1)
+
+    def fechar(self):
+        with self._trava:
+            self.sincronizar()
+            if self._diario is not None:
+                self._diario.close()
+                self._diario = None
@@ -1,14 +1,39 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from itertools import islice, repeat
+import threading
+import time
+
+from dinheiro import Dinheiro
+
+AGENCIA_PADRAO = "0001"
 
 class Transacao(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def registrar(self, conta):
         pass
 
+    def simular(self, conta, saldo, saques_realizados):
+        """Retorna ``(saldo, saques_realizados)`` após a transação, ou None se recusada.
+
+        Usado por ``Conta.aplicar_lote`` para validar o lote sem alterar a conta.
+        """
+        return None
+
+    def contas_afetadas(self, conta):
+        """Contas cujo estado a transação altera; o executor concorrente trava todas elas."""
+        return (conta,)
+
 class Deposito(Transacao):
+    __slots__ = ('valor',)
+
     def __init__(self, valor):
-        self.valor = valor
+        self.valor = Dinheiro.de(valor)
 
     def registrar(self, conta):
         if self.valor > 0:
@@ -17,9 +42,16 @@ class Deposito(Transacao):
             return True
         return False
 
+    def simular(self, conta, saldo, saques_realizados):
+        if self.valor > 0:
+            return saldo + self.valor, saques_realizados
+        return None
+
 class Saque(Transacao):
+    __slots__ = ('valor',)
+
     def __init__(self, valor):
-        self.valor = valor
+        self.valor = Dinheiro.de(valor)
 
     def registrar(self, conta):
         if self.valor > 0 and self.valor <= conta.saldo and conta.pode_sacar(self.valor):
@@ -29,20 +61,249 @@ class Saque(Transacao):
             return True
         return False
 
+    def simular(self, conta, saldo, saques_realizados):
+        if self.valor > 0 and self.valor <= saldo and conta.pode_sacar(self.valor, saques_realizados):
+            return saldo - self.valor, saques_realizados + 1
+        return None
+
+class Transferencia(Transacao):
+    """Débito na conta de origem e crédito em ``destino`` como uma só operação.
+
+    Na origem valem as regras do saque (saldo, ``pode_sacar`` e contagem de
+    saques). Cada histórico recebe uma entrada com o mesmo instante e a conta
+    da outra ponta em ``contraparte``. Entre threads, a atomicidade vem do
+    ``ExecutorTransacoes``, que trava as duas contas de ``contas_afetadas`` em
+    ordem global. Não participa de ``Conta.aplicar_lote``.
+    """
+
+    __slots__ = ('destino', 'valor')
+
+    ENVIADA = 'TransferenciaEnviada'
+    RECEBIDA = 'TransferenciaRecebida'
+
+    def __init__(self, destino, valor):
+        self.destino = destino
+        self.valor = Dinheiro.de(valor)
+
+    def contas_afetadas(self, conta):
+        return (conta, self.destino)
+
+    def registrar(self, conta):
+        destino = self.destino
+        if destino is conta:
+            return False
+        if not (self.valor > 0 and self.valor <= conta.saldo and conta.pode_sacar(self.valor)):
+            return False
+        conta.saldo -= self.valor
+        conta.saques_realizados += 1
+        destino.saldo += self.valor
+        data_ns = max(conta.historico._agora_ns(), destino.historico._agora_ns())
+        conta.historico.adicionar_vinculada(self.ENVIADA, self.valor, data_ns, (destino.agencia, destino.numero))
+        destino.historico.adicionar_vinculada(self.RECEBIDA, self.valor, data_ns, (conta.agencia, conta.numero))
+        return True
+
 class Historico:
+    """Histórico em colunas: valores (centavos), datas (epoch UTC em ns) e código do tipo.
+
+    Cada transação ocupa 17 bytes nos arrays em vez de um dict com strings.
+    As datas são mantidas em ordem crescente e servem de índice temporal:
+    consultas por período fazem busca binária em vez de varrer o histórico.
+    A propriedade ``transacoes`` devolve uma visão somente leitura que monta
+    os dicts ``{'tipo', 'valor', 'data'}`` sob demanda, com ``data`` como
+    ``datetime`` local; a formatação fica a cargo de quem exibe o extrato.
+    """
+
+    __slots__ = ('_valores', '_datas', '_tipos', '_contrapartes')
+
+    _nomes_tipos = []
+    _codigos_tipos = {}
+    _trava_tipos = threading.Lock()
+
     def __init__(self):
-        self.transacoes = []
+        self._valores = array('q')
+        self._datas = array('q')
+        self._tipos = array('B')
+        self._contrapartes = None  # índice -> (agencia, numero), só para transferências
+
+    @classmethod
+    def de_colunas(cls, valores, datas, tipos, contrapartes=None):
+        """Recria um histórico a partir das colunas (usado na persistência)."""
+        historico = cls.__new__(cls)
+        historico._valores = valores
+        historico._datas = datas
+        historico._tipos = tipos
+        historico._contrapartes = contrapartes or None
+        return historico
+
+    def colunas(self):
+        return self._valores, self._datas, self._tipos
+
+    @classmethod
+    def nomes_tipos(cls):
+        return tuple(cls._nomes_tipos)
+
+    @classmethod
+    def _codigo_tipo(cls, transacao):
+        return cls.codigo_do_tipo(transacao.__class__.__name__)
+
+    @classmethod
+    def codigo_do_tipo(cls, nome):
+        codigo = cls._codigos_tipos.get(nome)
+        if codigo is None:
+            with cls._trava_tipos:
+                codigo = cls._codigos_tipos.get(nome)
+                if codigo is None:
+                    codigo = len(cls._nomes_tipos)
+                    cls._nomes_tipos.append(nome)
+                    cls._codigos_tipos[nome] = codigo
+        return codigo
+
+    @staticmethod
+    def _para_ns(instante):
+        if isinstance(instante, int):
+            return instante
+        return round(instante.timestamp() * 1_000_000) * 1000
+
+    @property
+    def transacoes(self):
+        return TransacoesView(self)
+
+    def _agora_ns(self):
+        # Relógio ajustado para trás não pode quebrar a ordenação do índice
+        agora = time.time_ns()
+        if self._datas and agora < self._datas[-1]:
+            return self._datas[-1]
+        return agora
+
+    def adicionar_transacao(self, transacao, data_ns=None):
+        self._tipos.append(self._codigo_tipo(transacao))
+        self._valores.append(transacao.valor.centavos)
+        self._datas.append(self._agora_ns() if data_ns is None else data_ns)
+
+    def adicionar_vinculada(self, tipo, valor, data_ns, contraparte):
+        """Registra uma entrada ligada a outra conta (as pontas de uma transferência)."""
+        if self._contrapartes is None:
+            self._contrapartes = {}
+        self._contrapartes[len(self._valores)] = contraparte
+        self._tipos.append(self.codigo_do_tipo(tipo))
+        self._valores.append(valor.centavos)
+        self._datas.append(data_ns)
+
+    def ultima_data_ns(self):
+        return self._datas[-1] if self._datas else None
+
+    def contraparte(self, indice):
+        """(agencia, numero) da outra ponta da entrada ``indice``, ou None."""
+        return self._contrapartes.get(indice) if self._contrapartes else None
 
-    def adicionar_transacao(self, transacao):
-        self.transacoes.append({
-            'tipo': transacao.__class__.__name__,
-            'valor': transacao.valor,
-            'data': datetime.now().strftime('%d/%m/%Y %H:%M:%S')
-        })
+    def contrapartes(self):
+        """Mapa somente leitura índice -> (agencia, numero) das entradas vinculadas."""
+        return self._contrapartes or {}
+
+    def adicionar_lote(self, transacoes):
+        agora = self._agora_ns()
+        self._tipos.extend(self._codigo_tipo(t) for t in transacoes)
+        self._valores.extend(t.valor.centavos for t in transacoes)
+        self._datas.extend(repeat(agora, len(transacoes)))
+
+    def transacoes_entre(self, inicio=None, fim=None):
+        """Transações com ``inicio <= data < fim`` (datetime ou epoch em ns)."""
+        i = 0 if inicio is None else bisect_left(self._datas, self._para_ns(inicio))
+        j = len(self._datas) if fim is None else bisect_left(self._datas, self._para_ns(fim))
+        return TransacoesView(self, i, max(i, j))
+
+    def transacoes_desde(self, instante):
+        return self.transacoes_entre(inicio=instante)
+
+    def gerar_relatorio(self, tipo=None, inicio=None, fim=None, pagina=1, tamanho=10):
+        """Gera o extrato em páginas (listas de até ``tamanho`` dicts), a partir de ``pagina``.
+
+        O período ``[inicio, fim)`` é localizado por busca binária no índice de
+        datas e só os dicts das páginas efetivamente consumidas são montados.
+        ``tipo`` é o nome da transação (``'Deposito'``, ``'Saque'``). ``pagina``
+        e ``tamanho`` menores que 1 lançam ValueError.
+        """
+        if pagina < 1 or tamanho < 1:
+            raise ValueError(f"página e tamanho devem ser positivos: pagina={pagina}, tamanho={tamanho}")
+        i = 0 if inicio is None else bisect_left(self._datas, self._para_ns(inicio))
+        j = len(self._datas) if fim is None else bisect_left(self._datas, self._para_ns(fim))
+        pular = (pagina - 1) * tamanho
+        if tipo is None:
+            indices = iter(range(min(i + pular, j), j))
+        else:
+            codigo = self._codigos_tipos.get(tipo)
+            if codigo is None:
+                return
+            indices = islice(self._indices_do_tipo(codigo, i, j), pular, None)
+
+        montar = TransacoesView(self)._montar
+        while indices_pagina := list(islice(indices, tamanho)):
+            yield [montar(indice) for indice in indices_pagina]
+
+    def _indices_do_tipo(self, codigo, inicio, fim):
+        tipos = self._tipos
+        while True:
+            try:
+                indice = tipos.index(codigo, inicio, fim)
+            except ValueError:
+                return
+            yield indice
+            inicio = indice + 1
+
+    def transacoes_do_dia(self, dia=None):
+        dia = dia or date.today()
+        inicio = datetime.combine(dia, datetime.min.time())
+        return self.transacoes_entre(inicio, inicio + timedelta(days=1))
+
+class TransacoesView(Sequence):
+    """Visão somente leitura sobre um intervalo das colunas de um Historico."""
+
+    __slots__ = ('_historico', '_inicio', '_fim')
+
+    def __init__(self, historico, inicio=0, fim=None):
+        self._historico = historico
+        self._inicio = inicio
+        self._fim = fim
+
+    def _montar(self, indice):
+        h = self._historico
+        transacao = {
+            'tipo': Historico._nomes_tipos[h._tipos[indice]],
+            'valor': Dinheiro(h._valores[indice]),
+            'data': datetime.fromtimestamp(h._datas[indice] / 1e9),
+        }
+        if h._contrapartes and indice in h._contrapartes:
+            transacao['contraparte'] = h._contrapartes[indice]
+        return transacao
+
+    def _limites(self):
+        fim = len(self._historico._valores) if self._fim is None else self._fim
+        return self._inicio, fim
+
+    def __len__(self):
+        inicio, fim = self._limites()
+        return fim - inicio
+
+    def __getitem__(self, indice):
+        inicio, fim = self._limites()
+        if isinstance(indice, slice):
+            return [self._montar(inicio + i) for i in range(*indice.indices(fim - inicio))]
+        if indice < 0:
+            indice += fim - inicio
+        if not 0 <= indice < fim - inicio:
+            raise IndexError('índice de transação fora do intervalo')
+        return self._montar(inicio + indice)
+
+    def __iter__(self):
+        inicio, fim = self._limites()
+        for indice in range(inicio, fim):
+            yield self._montar(indice)
 
 class Conta:
+    __slots__ = ('saldo', 'numero', 'agencia', 'cliente', 'historico', 'saques_realizados')
+
     def __init__(self, numero, agencia, cliente):
-        self.saldo = 0.0
+        self.saldo = Dinheiro(0)
         self.numero = numero
         self.agencia = agencia
         self.cliente = cliente
@@ -53,7 +314,7 @@ class Conta:
         return self.saldo
 
     @classmethod
-    def nova_conta(cls, cliente, numero, agencia="0001"):
+    def nova_conta(cls, cliente, numero, agencia=AGENCIA_PADRAO):
         conta = cls(numero, agencia, cliente)
         cliente.adicionar_conta(conta)
         return conta
@@ -66,17 +327,46 @@ class Conta:
         deposito = Deposito(valor)
         return deposito.registrar(self)
 
-    def pode_sacar(self, valor):
+    def pode_sacar(self, valor, saques_realizados=None):
         return True  # Para ser sobrescrito em ContaCorrente
 
+    def aplicar_lote(self, transacoes):
+        """Aplica um lote de transações em uma única passada, tudo ou nada.
+
+        O lote é validado na ordem contra saldo e limites; se todos os itens
+        forem aceitos, o saldo é gravado uma vez e o histórico recebe as
+        entradas em bloco. Caso contrário nada é alterado. Retorna uma lista
+        com o resultado (True/False) de cada item.
+        """
+        transacoes = list(transacoes)
+        saldo, saques = self.saldo, self.saques_realizados
+        resultados = []
+        for transacao in transacoes:
+            estado = transacao.simular(self, saldo, saques)
+            if estado is None:
+                resultados.append(False)
+            else:
+                saldo, saques = estado
+                resultados.append(True)
+
+        if all(resultados):
+            self.saldo = saldo
+            self.saques_realizados = saques
+            self.historico.adicionar_lote(transacoes)
+        return resultados
+
 class ContaCorrente(Conta):
+    __slots__ = ('limite', 'limite_saques')
+
     def __init__(self, numero, agencia, cliente, limite=500.0, limite_saques=3):
         super().__init__(numero, agencia, cliente)
-        self.limite = limite
+        self.limite = Dinheiro.de(limite)
         self.limite_saques = limite_saques
 
-    def pode_sacar(self, valor):
-        if self.saques_realizados >= self.limite_saques:
+    def pode_sacar(self, valor, saques_realizados=None):
+        if saques_realizados is None:
+            saques_realizados = self.saques_realizados
+        if saques_realizados >= self.limite_saques:
             return False
         if valor > self.limite:
             return False
@@ -86,12 +376,20 @@ class Cliente:
     def __init__(self, endereco):
         self.endereco = endereco
         self.contas = []
+        self._contas_por_chave = {}  # (agencia, numero) -> Conta
 
     def realizar_transacao(self, conta, transacao):
         return transacao.registrar(conta)
 
+    def realizar_transacoes(self, conta, lote):
+        return conta.aplicar_lote(lote)
+
     def adicionar_conta(self, conta):
         self.contas.append(conta)
+        self._contas_por_chave[(conta.agencia, conta.numero)] = conta
+
+    def buscar_conta(self, numero, agencia=AGENCIA_PADRAO):
+        return self._contas_por_chave.get((agencia, numero))
 
 class PessoaFisica(Cliente):
     def __init__(self, cpf, nome, data_nascimento, endereco):
@@ -99,3 +397,67 @@ class PessoaFisica(Cliente):
         self.cpf = cpf
         self.nome = nome
         self.data_nascimento = data_nascimento
+
+class RegistroClientes:
+    """Cadastro em memória com busca O(1).
+
+    Mantém um dicionário de clientes indexado pelos dígitos do CPF e um
+    índice secundário de contas por (agência, número), evitando varrer
+    listas a cada operação do menu. Os números de conta novos vêm de um
+    contador que nunca reaproveita números, mesmo que contas sejam removidas.
+    """
+
+    def __init__(self):
+        self._clientes_por_cpf = {}
+        self._contas_por_chave = {}
+        self._contas_em_ordem = []  # ordem de cadastro, para paginar sem percorrer o início
+        self._ultimo_numero = 0
+
+    @staticmethod
+    def normalizar_cpf(cpf):
+        if cpf.isdigit():
+            return cpf
+        return ''.join(filter(str.isdigit, cpf))
+
+    @property
+    def clientes(self):
+        return self._clientes_por_cpf.values()
+
+    @property
+    def contas(self):
+        return self._contas_por_chave.values()
+
+    def adicionar_cliente(self, cliente):
+        cpf = self.normalizar_cpf(cliente.cpf)
+        if cpf in self._clientes_por_cpf:
+            return False
+        self._clientes_por_cpf[cpf] = cliente
+        return True
+
+    def proximo_numero_conta(self):
+        self._ultimo_numero += 1
+        return self._ultimo_numero
+
+    def adicionar_conta(self, conta):
+        chave = (conta.agencia, conta.numero)
+        if chave in self._contas_por_chave:
+            return False
+        self._contas_por_chave[chave] = conta
+        self._contas_em_ordem.append(conta)
+        if conta.numero > self._ultimo_numero:
+            self._ultimo_numero = conta.numero
+        return True
+
+    def buscar_cliente(self, cpf):
+        return self._clientes_por_cpf.get(self.normalizar_cpf(cpf))
+
+    def buscar_conta(self, numero, agencia=AGENCIA_PADRAO):
+        return self._contas_por_chave.get((agencia, numero))
+
+    def pagina_contas(self, pagina, tamanho):
+        """Contas da ``pagina`` (a partir de 1), na ordem de ``contas``, em O(tamanho)."""
+        inicio = (pagina - 1) * tamanho
+        return self._contas_em_ordem[inicio:inicio + tamanho]
+
+    def possui_cpf(self, cpf):
+        return self.normalizar_cpf(cpf) in self._clientes_por_cpf
@@ -0,0 +1,73 @@
+"""Repositórios de armazenamento para clientes, contas e históricos do poo_banco.
+
+Os objetos do ``poo_banco`` continuam sendo o estado de trabalho (o
+``RegistroClientes`` em memória); o repositório é quem os torna duráveis.
+Cada operação do menu chama um único método de escrita, que é atômico:
+
+- ``carregar(registro)``: preenche o registro com o estado gravado;
+- ``registrar_cliente(conta)``: cliente + conta recém-cadastrados;
+- ``registrar_transacao(conta, transacao)``: estado e histórico das contas
+  afetadas pela transação já aplicada;
+- ``salvar_snapshot(registro)``: consolida o registro inteiro (usado ao
+  sair e depois de importações em massa);
+- ``fechar()``.
+
+``preparar_cliente``/``preparar_transacao`` dividem a escrita em duas
+partes: lêem o estado na hora (na thread que o altera) e devolvem uma
+função sem argumentos que faz só a E/S, para ser chamada em outra thread.
+Chamadas em ordem, numa única thread, equivalem aos ``registrar_*``.
+
+Implementações: ``RepositorioMemoria`` (nada é gravado), ``Persistencia``
+(snapshot + diário em arquivos, ver ``persistencia.py``) e
+``RepositorioSQLite`` (``repositorio_sqlite.py``); o ``sistema_bancario``
+escolhe pelo nome.
+"""
+
+from abc import ABC, abstractmethod
+from functools import partial
+
+
+class Repositorio(ABC):
+    @abstractmethod
+    def carregar(self, registro):
+        pass
+
+    @abstractmethod
+    def registrar_cliente(self, conta):
+        pass
+
+    @abstractmethod
+    def registrar_transacao(self, conta, transacao):
+        pass
+
+    @abstractmethod
+    def salvar_snapshot(self, registro):
+        pass
+
+    def preparar_cliente(self, conta):
+        return partial(self.registrar_cliente, conta)
+
+    def preparar_transacao(self, conta, transacao):
+        return partial(self.registrar_transacao, conta, transacao)
+
+    def fechar(self):
+        pass
+
+
+class RepositorioMemoria(Repositorio):
+    """Mantém tudo só no RegistroClientes: nada é gravado nem recarregado."""
+
+    def __init__(self, diretorio=None):
+        pass
+
+    def carregar(self, registro):
+        pass
+
+    def registrar_cliente(self, conta):
+        pass
+
+    def registrar_transacao(self, conta, transacao):
+        pass
+
+    def salvar_snapshot(self, registro):
+        pass
@@ -0,0 +1,214 @@
+"""Repositório SQLite para o poo_banco (ver ``repositorio.py``).
+
+O banco roda em modo WAL com ``synchronous = NORMAL``: cada operação é uma
+transação curta, confirmada sem esperar ``fsync`` a cada commit (uma queda
+de energia pode perder os últimos commits, nunca corromper o banco). Os
+comandos SQL são textos fixos, então o ``sqlite3`` reaproveita o statement
+preparado de cada um, e as gravações vão em ``executemany``.
+"""
+
+import sqlite3
+from array import array
+from functools import partial
+from pathlib import Path
+
+from dinheiro import Dinheiro
+from poo_banco import ContaCorrente, Historico, PessoaFisica
+from repositorio import Repositorio
+
+SQL_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS clientes (
+    cpf TEXT PRIMARY KEY,
+    nome TEXT NOT NULL,
+    data_nascimento TEXT NOT NULL,
+    endereco TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS contas (
+    agencia TEXT NOT NULL,
+    numero INTEGER NOT NULL,
+    cpf TEXT NOT NULL REFERENCES clientes (cpf),
+    saldo INTEGER NOT NULL,
+    saques_realizados INTEGER NOT NULL,
+    limite INTEGER NOT NULL,
+    limite_saques INTEGER NOT NULL,
+    PRIMARY KEY (agencia, numero)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS movimentos (
+    id INTEGER PRIMARY KEY,
+    agencia TEXT NOT NULL,
+    numero INTEGER NOT NULL,
+    tipo TEXT NOT NULL,
+    valor INTEGER NOT NULL,
+    data_ns INTEGER NOT NULL,
+    contra_agencia TEXT,
+    contra_numero INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_movimentos_conta ON movimentos (agencia, numero, id);
+"""
+
+SQL_INSERIR_CLIENTE = "INSERT OR IGNORE INTO clientes VALUES (?, ?, ?, ?)"
+SQL_INSERIR_CONTA = "INSERT INTO contas VALUES (?, ?, ?, ?, ?, ?, ?)"
+SQL_ATUALIZAR_CONTA = "UPDATE contas SET saldo = ?, saques_realizados = ? WHERE agencia = ? AND numero = ?"
+SQL_INSERIR_MOVIMENTO = (
+    "INSERT INTO movimentos (agencia, numero, tipo, valor, data_ns, contra_agencia, contra_numero) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+SQL_CLIENTES = "SELECT cpf, nome, data_nascimento, endereco FROM clientes"
+SQL_CONTAS = (
+    "SELECT agencia, numero, cpf, saldo, saques_realizados, limite, limite_saques FROM contas "
+    "ORDER BY agencia, numero"
+)
+SQL_MOVIMENTOS = (
+    "SELECT agencia, numero, tipo, valor, data_ns, contra_agencia, contra_numero FROM movimentos "
+    "ORDER BY agencia, numero, id"
+)
+
+TAMANHO_LOTE_LEITURA = 10_000
+
+
+class RepositorioSQLite(Repositorio):
+    """Clientes, contas e movimentos em um banco SQLite (WAL), uma transação por operação.
+
+    O repositório lembra quantas entradas do histórico de cada conta já
+    estão no banco; gravar uma conta é inserir só as entradas novas e
+    atualizar saldo e saques. ``salvar_snapshot`` faz isso para o registro
+    inteiro com ``executemany``, então depois de uma importação em massa
+    só as contas novas são escritas.
+    """
+
+    def __init__(self, diretorio):
+        self.diretorio = Path(diretorio)
+        self.caminho = self.diretorio / "banco.sqlite3"
+        self._conexao = None
+        self._gravados = {}  # (agencia, numero) -> entradas do histórico já no banco
+
+    def _conectar(self):
+        if self._conexao is None:
+            self.diretorio.mkdir(parents=True, exist_ok=True)
+            # Uma thread por vez, mas não necessariamente a que abriu (ver preparar_transacao)
+            self._conexao = sqlite3.connect(self.caminho, check_same_thread=False)
+            self._conexao.execute("PRAGMA journal_mode = WAL")
+            self._conexao.execute("PRAGMA synchronous = NORMAL")
+            self._conexao.execute("PRAGMA foreign_keys = ON")
+            with self._conexao:
+                self._conexao.executescript(SQL_ESQUEMA)
+        return self._conexao
+
+    # ---------------------------------------------------------------- carga
+
+    def carregar(self, registro):
+        conexao = self._conectar()
+        clientes = {}
+        for cpf, nome, nascimento, endereco in conexao.execute(SQL_CLIENTES):
+            cliente = PessoaFisica(cpf, nome, nascimento, endereco)
+            clientes[cpf] = cliente
+            registro.adicionar_cliente(cliente)
+
+        contas = {}
+        for agencia, numero, cpf, saldo, saques, limite, limite_saques in conexao.execute(SQL_CONTAS):
+            cliente = clientes[cpf]
+            conta = ContaCorrente(numero, agencia, cliente, limite=Dinheiro(limite), limite_saques=limite_saques)
+            conta.saldo = Dinheiro(saldo)
+            conta.saques_realizados = saques
+            cliente.adicionar_conta(conta)
+            registro.adicionar_conta(conta)
+            contas[agencia, numero] = conta
+            self._gravados[agencia, numero] = 0
+
+        codigos = {}
+        chave_atual = colunas = None
+        cursor = conexao.execute(SQL_MOVIMENTOS)
+        while linhas := cursor.fetchmany(TAMANHO_LOTE_LEITURA):
+            for agencia, numero, tipo, valor, data_ns, contra_agencia, contra_numero in linhas:
+                if (agencia, numero) != chave_atual:
+                    self._montar_historico(contas, chave_atual, colunas)
+                    chave_atual, colunas = (agencia, numero), (array("q"), array("q"), array("B"), {})
+                valores, datas, tipos, contrapartes = colunas
+                if contra_agencia is not None:
+                    contrapartes[len(valores)] = (contra_agencia, contra_numero)
+                valores.append(valor)
+                datas.append(data_ns)
+                codigo = codigos.get(tipo)
+                if codigo is None:
+                    codigo = codigos[tipo] = Historico.codigo_do_tipo(tipo)
+                tipos.append(codigo)
+        self._montar_historico(contas, chave_atual, colunas)
+
+    def _montar_historico(self, contas, chave, colunas):
+        if chave is None:
+            return
+        valores, datas, tipos, contrapartes = colunas
+        contas[chave].historico = Historico.de_colunas(valores, datas, tipos, contrapartes)
+        self._gravados[chave] = len(valores)
+
+    # ------------------------------------------------------------- escrita
+
+    @staticmethod
+    def _estados(contas):
+        """Conta, saldo, saques e tamanho do histórico de cada conta, lidos agora."""
+        return [
+            (conta, conta.saldo.centavos, conta.saques_realizados, len(conta.historico.colunas()[0]))
+            for conta in contas
+        ]
+
+    def _pendencias(self, estado, clientes, contas, atualizacoes, movimentos, gravados_depois):
+        """Acumula nas listas o que falta gravar da conta e, em ``gravados_depois``, o total após gravar."""
+        conta, saldo, saques, total = estado
+        chave = (conta.agencia, conta.numero)
+        historico = conta.historico
+        valores, datas, tipos = historico.colunas()
+        gravados = self._gravados.get(chave)
+        if gravados is None:
+            cliente = conta.cliente
+            clientes.append((cliente.cpf, cliente.nome, cliente.data_nascimento, cliente.endereco))
+            contas.append((*chave, cliente.cpf, saldo, saques, conta.limite.centavos, conta.limite_saques))
+            gravados = 0
+        elif gravados >= total:
+            return
+        else:
+            atualizacoes.append((saldo, saques, *chave))
+
+        nomes = Historico.nomes_tipos()
+        for indice in range(gravados, total):
+            contra_agencia, contra_numero = historico.contraparte(indice) or (None, None)
+            movimentos.append(
+                (*chave, nomes[tipos[indice]], valores[indice], datas[indice], contra_agencia, contra_numero)
+            )
+        gravados_depois[chave] = total
+
+    def _gravar(self, estados):
+        """Grava o estado capturado por ``_estados``; a conta pode ter mudado depois disso."""
+        conexao = self._conectar()
+        clientes, contas, atualizacoes, movimentos = [], [], [], []
+        gravados_depois = {}
+        for estado in estados:
+            self._pendencias(estado, clientes, contas, atualizacoes, movimentos, gravados_depois)
+        if not gravados_depois:
+            return
+        with conexao:
+            conexao.executemany(SQL_INSERIR_CLIENTE, clientes)
+            conexao.executemany(SQL_INSERIR_CONTA, contas)
+            conexao.executemany(SQL_ATUALIZAR_CONTA, atualizacoes)
+            conexao.executemany(SQL_INSERIR_MOVIMENTO, movimentos)
+        # Só depois do commit: se a transação falhar, a próxima gravação tenta de novo
+        self._gravados.update(gravados_depois)
+
+    def registrar_cliente(self, conta):
+        self._gravar(self._estados((conta,)))
+
+    def registrar_transacao(self, conta, transacao):
+        self._gravar(self._estados(transacao.contas_afetadas(conta)))
+
+    def preparar_cliente(self, conta):
+        return partial(self._gravar, self._estados((conta,)))
+
+    def preparar_transacao(self, conta, transacao):
+        return partial(self._gravar, self._estados(transacao.contas_afetadas(conta)))
+
+    def salvar_snapshot(self, registro):
+        self._gravar(self._estados(registro.contas))
+
+    def fechar(self):
+        if self._conexao is not None:
+            self._conexao.close()
+            self._conexao = None
@@ -0,0 +1,281 @@
+"""Servidor asyncio (TCP, protocolo de linhas) para o sistema bancário.
+
+Expõe as operações do menu do ``sistema_bancario`` sobre o mesmo registro
+em memória, para muitos terminais ao mesmo tempo em um único processo.
+Cada comando é uma linha com campos separados por TAB; cada resposta
+começa com ``OK`` ou ``ERRO`` e, quando tem várias linhas, o status traz
+a quantidade de linhas que vêm em seguida::
+
+    u <nome> <nascimento> <cpf> <endereco>  cadastra cliente + conta e o seleciona
+    l <cpf>                                 seleciona um cliente já cadastrado
+    c [pagina]                              lista as contas           -> OK <n> + n linhas
+    d <valor> [conta]                       depósito do cliente selecionado
+    s <valor> [conta]                       saque do cliente selecionado
+    e [conta] [pagina]                      extrato                   -> OK <n> + n linhas
+    q                                       encerra a sessão
+
+Os comandos alteram o registro no laço de eventos, sem ``await`` no meio,
+então cada alteração é atômica em relação às demais. A gravação durável
+(diário com ``fsync``, commit do SQLite) não roda no laço: o repositório
+lê o estado na hora (``preparar_*``) e a E/S vai para uma única thread de
+gravação, na mesma ordem das alterações; a sessão só responde depois que
+a sua gravação terminou, e um disco lento não trava os outros terminais.
+Cada sessão só lê o próximo comando
+depois que a resposta anterior foi escoada (``drain``): um cliente lento
+não acumula respostas na memória do servidor. Linhas acima de
+``TAMANHO_MAXIMO_LINHA`` encerram a sessão e conexões além de
+``MAX_CONEXOES`` são recusadas. Com SIGINT/SIGTERM o servidor para de
+aceitar conexões, deixa cada sessão terminar o comando em andamento,
+fecha as ociosas e grava o snapshot.
+
+Uso: python servidor.py [porta]
+"""
+
+import asyncio
+import signal
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import sistema_bancario
+import validadores
+from poo_banco import Deposito, Saque
+from validadores import MENSAGENS, Erro, parse_valor_positivo
+
+HOST = "127.0.0.1"
+PORTA = 8765
+MAX_CONEXOES = 10_000
+TAMANHO_MAXIMO_LINHA = 4096
+TAMANHO_PAGINA = 50
+TEMPO_ENCERRAMENTO = 5.0
+
+
+class ErroComando(Exception):
+    pass
+
+
+class Sessao:
+    def __init__(self, servidor, leitor, escritor):
+        self.servidor = servidor
+        self.leitor = leitor
+        self.escritor = escritor
+        self.cliente = None
+        self.ociosa = False
+        self.comandos = 0
+
+    async def atender(self):
+        while not self.servidor.encerrando:
+            self.ociosa = True
+            try:
+                linha = await self.leitor.readline()
+            except ValueError:
+                await self._responder("ERRO\tlinha muito longa")
+                return
+            finally:
+                self.ociosa = False
+            if not linha:
+                return
+
+            campos = linha.decode("utf-8", "replace").rstrip("\r\n").split("\t")
+            if campos[0] == "q":
+                await self._responder("OK\tsessão encerrada")
+                return
+            try:
+                resposta = await self.executar(campos[0], campos[1:])
+            except ErroComando as exc:
+                resposta = f"ERRO\t{exc}"
+            except (ValueError, TypeError):
+                # Entrada que escapou das validações não pode derrubar a conexão
+                resposta = "ERRO\tentrada inválida"
+            self.comandos += 1
+            await self._responder(resposta)
+
+    async def _responder(self, texto):
+        self.escritor.write(texto.encode("utf-8") + b"\n")
+        await self.escritor.drain()
+
+    async def executar(self, comando, argumentos):
+        operacao = getattr(self, f"_comando_{comando}", None)
+        if operacao is None:
+            raise ErroComando(f"comando desconhecido: {comando!r}")
+        maximo = operacao.__code__.co_argcount - 1  # sem o self
+        if len(argumentos) > maximo:
+            raise ErroComando(f"argumentos demais para {comando!r}: no máximo {maximo}")
+        return await operacao(*argumentos)
+
+    async def _comando_u(self, nome="", data_nascimento="", cpf="", endereco=""):
+        erro = validadores.validar_nome(nome) or validadores.validar_data(data_nascimento)
+        cpf_digitos = None
+        if erro is None:
+            cpf_digitos, erro = validadores.validar_cpf(cpf)
+        if erro is None:
+            erro = validadores.validar_endereco(endereco)
+        if erro is not None:
+            raise ErroComando(MENSAGENS[erro])
+        if sistema_bancario.registro.possui_cpf(cpf_digitos):
+            raise ErroComando("CPF já cadastrado!")
+        conta = sistema_bancario.cadastrar_cliente(cpf_digitos, nome, data_nascimento, endereco, registrar_diario=False)
+        self.cliente = conta.cliente
+        await self.servidor.gravar("preparar_cliente", conta)
+        return f"OK\tconta {conta.numero}"
+
+    async def _comando_l(self, cpf=""):
+        cliente = sistema_bancario.encontrar_cliente_por_cpf(cpf)
+        if cliente is None:
+            raise ErroComando("Cliente não encontrado!")
+        self.cliente = cliente
+        return f"OK\t{cliente.nome}"
+
+    async def _comando_c(self, pagina="1"):
+        pagina = self._inteiro(pagina, "página")
+        linhas = [
+            f"{conta.agencia}\t{conta.numero}\t{conta.cliente.nome}"
+            for conta in sistema_bancario.registro.pagina_contas(pagina, TAMANHO_PAGINA)
+        ]
+        return "\n".join([f"OK\t{len(linhas)}", *linhas])
+
+    async def _comando_d(self, valor="", numero=""):
+        conta = self._conta(numero)
+        transacao = Deposito(self._valor(valor))
+        if not sistema_bancario.executar_transacao(self.cliente, conta, transacao, registrar_diario=False):
+            raise ErroComando("Depósito não efetuado!")
+        saldo = conta.saldo
+        await self.servidor.gravar("preparar_transacao", conta, transacao)
+        return f"OK\t{saldo:.2f}"
+
+    async def _comando_s(self, valor="", numero=""):
+        conta = self._conta(numero)
+        transacao = Saque(self._valor(valor))
+        if not sistema_bancario.executar_transacao(self.cliente, conta, transacao, registrar_diario=False):
+            raise ErroComando("Saque não realizado! Verifique saldo/limites.")
+        saldo = conta.saldo
+        await self.servidor.gravar("preparar_transacao", conta, transacao)
+        return f"OK\t{saldo:.2f}"
+
+    async def _comando_e(self, numero="", pagina="1"):
+        conta = self._conta(numero)
+        pagina = self._inteiro(pagina, "página")
+        paginas = conta.historico.gerar_relatorio(pagina=pagina, tamanho=TAMANHO_PAGINA)
+        linhas = [
+            f"{t['data'].strftime(sistema_bancario.FORMATO_DATA_HORA)}\t{t['tipo']}\t{t['valor']:.2f}"
+            for t in next(paginas, [])
+        ]
+        linhas.append(f"Saldo\t{conta.saldo:.2f}")
+        return "\n".join([f"OK\t{len(linhas)}", *linhas])
+
+    def _conta(self, numero):
+        if self.cliente is None:
+            raise ErroComando("Nenhum cliente selecionado (use u ou l).")
+        if not numero:
+            if len(self.cliente.contas) != 1:
+                raise ErroComando("Informe o número da conta.")
+            return self.cliente.contas[0]
+        conta = self.cliente.buscar_conta(self._inteiro(numero, "conta"))
+        if conta is None:
+            raise ErroComando("Conta não encontrada!")
+        return conta
+
+    @staticmethod
+    def _valor(texto):
+        valor = parse_valor_positivo(texto)
+        if valor is None:
+            raise ErroComando(MENSAGENS[Erro.VALOR_INVALIDO])
+        return valor
+
+    @staticmethod
+    def _inteiro(texto, campo):
+        if not texto.isdecimal() or int(texto) < 1:
+            raise ErroComando(f"{campo} inválida: {texto!r}")
+        return int(texto)
+
+
+class ServidorBancario:
+    def __init__(self, host=HOST, porta=PORTA, max_conexoes=MAX_CONEXOES):
+        self.host = host
+        self.porta = porta
+        self.max_conexoes = max_conexoes
+        self.encerrando = False
+        self._sessoes = {}  # tarefa -> Sessao
+        self._servidor = None
+        self._gravador = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gravador")
+
+    async def iniciar(self):
+        self._servidor = await asyncio.start_server(
+            self._conectar, self.host, self.porta, limit=TAMANHO_MAXIMO_LINHA
+        )
+        self.porta = self._servidor.sockets[0].getsockname()[1]
+
+    async def gravar(self, preparar, *argumentos):
+        """Grava no repositório ativo, fora do laço, o estado que ``preparar`` lê agora.
+
+        ``preparar`` é o nome do método do repositório; a leitura do estado e o
+        envio para a thread de gravação acontecem antes do primeiro ``await``.
+        """
+        repositorio = sistema_bancario.persistencia
+        if repositorio is None:
+            return
+        gravacao = getattr(repositorio, preparar)(*argumentos)
+        # shield: uma gravação já enviada não é descartada se a sessão for cancelada
+        await asyncio.shield(asyncio.get_running_loop().run_in_executor(self._gravador, gravacao))
+
+    async def _conectar(self, leitor, escritor):
+        if self.encerrando or len(self._sessoes) >= self.max_conexoes:
+            escritor.write("ERRO\tservidor indisponível\n".encode("utf-8"))
+            escritor.close()
+            return
+        sessao = Sessao(self, leitor, escritor)
+        tarefa = asyncio.current_task()
+        self._sessoes[tarefa] = sessao
+        try:
+            await sessao.atender()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            del self._sessoes[tarefa]
+            escritor.close()
+
+    async def encerrar(self):
+        """Para de aceitar conexões e espera as sessões terminarem o comando atual."""
+        self.encerrando = True
+        self._servidor.close()
+        for tarefa, sessao in list(self._sessoes.items()):
+            if sessao.ociosa:
+                tarefa.cancel()
+        if self._sessoes:
+            await asyncio.wait(list(self._sessoes), timeout=TEMPO_ENCERRAMENTO)
+        await self._servidor.wait_closed()
+        # Gravações já enviadas terminam antes do snapshot final
+        await asyncio.get_running_loop().run_in_executor(None, self._gravador.shutdown)
+
+
+async def servir(porta=PORTA):
+    servidor = ServidorBancario(porta=porta)
+    await servidor.iniciar()
+    print(f"Servidor bancário em {servidor.host}:{servidor.porta} (Ctrl+C para encerrar)")
+
+    parar = asyncio.Event()
+    laco = asyncio.get_running_loop()
+    for sinal in (signal.SIGINT, signal.SIGTERM):
+        try:
+            laco.add_signal_handler(sinal, parar.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: Ctrl+C chega como KeyboardInterrupt
+    try:
+        await parar.wait()
+    finally:
+        await servidor.encerrar()
+
+
+def main():
+    porta = int(sys.argv[1]) if len(sys.argv) > 1 else PORTA
+    sistema_bancario.iniciar_persistencia()
+    try:
+        asyncio.run(servir(porta))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sistema_bancario.encerrar_persistencia()
+        print("Servidor encerrado.")
+
+
+if __name__ == "__main__":
+    main()
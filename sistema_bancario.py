@@ -5,92 +5,104 @@ Refatorado para:
  - Opção 'c' apenas lista contas existentes
  - Validações de nome, data, CPF (formato ou 11 dígitos) e endereço
  - Operações: depósito, saque, extrato
+ - Estado salvo em dados/ (snapshot + diário), recarregado ao iniciar
+ - Armazenamento escolhido por BANCO_BACKEND: arquivos (padrão), sqlite ou memoria
 """
 
-from poo_banco import PessoaFisica, ContaCorrente, Deposito, Saque
-from datetime import datetime
-import re
+import atexit
+import os
 
-clientes = []  # PessoaFisica
-contas = []    # ContaCorrente
-AGENCIA_PADRAO = "0001"
-LIMITE_SAQUES = 3
-LIMITE_VALOR_SAQUE = 500.0
-
-def limpar_cpf(cpf: str) -> str:
-    return re.sub(r"\D", "", cpf)
+from poo_banco import AGENCIA_PADRAO, PessoaFisica, ContaCorrente, Deposito, Saque, RegistroClientes
+from dinheiro import Dinheiro
+from validadores import MENSAGENS, Erro, formatar_cpf, limpar_cpf, parse_valor_positivo
+from persistencia import DIRETORIO_DADOS, Persistencia
+from repositorio import RepositorioMemoria
+from repositorio_sqlite import RepositorioSQLite
+import validadores
 
-def formatar_cpf(cpf_digitos: str) -> str:
-    return f"{cpf_digitos[:3]}.{cpf_digitos[3:6]}.{cpf_digitos[6:9]}-{cpf_digitos[9:]}"
+registro = RegistroClientes()  # PessoaFisica por CPF e ContaCorrente por (agência, número)
+persistencia = None  # Repositorio ativo, ver iniciar_persistencia()
+BACKENDS = {"arquivos": Persistencia, "sqlite": RepositorioSQLite, "memoria": RepositorioMemoria}
+BACKEND_PADRAO = "arquivos"
+LIMITE_SAQUES = 3
+LIMITE_VALOR_SAQUE = Dinheiro(500_00)
+FORMATO_DATA_HORA = "%d/%m/%Y %H:%M:%S"
+TAMANHO_PAGINA_EXTRATO = 10
 
 def encontrar_cliente_por_cpf(cpf: str):
-    cpf_num = limpar_cpf(cpf)
-    return next((c for c in clientes if c.cpf == cpf_num), None)
+    return registro.buscar_cliente(cpf)
+
+def _exibir_erro(erro) -> bool:
+    if erro is None:
+        return True
+    print(MENSAGENS[erro])
+    return False
 
 def validar_nome(nome: str) -> bool:
-    nome = nome.strip()
-    if not nome:
-        print("Nome não pode ser vazio.")
-        return False
-    partes = [p for p in nome.split() if p]
-    if len(partes) < 2:
-        print("Informe nome completo (mínimo 2 palavras).")
-        return False
-    if any(not re.fullmatch(r"[A-Za-zÀ-ÖØ-öø-ÿ]+", p) for p in partes):
-        print("Nome contém partes inválidas.")
-        return False
-    return True
+    return _exibir_erro(validadores.validar_nome(nome))
 
 def validar_data(data_str: str) -> bool:
-    if not re.fullmatch(r"\d{2}/\d{2}/\d{4}", data_str):
-        print("Data deve estar no formato dd/mm/aaaa.")
-        return False
-    try:
-        dt = datetime.strptime(data_str, "%d/%m/%Y")
-        ano_atual = datetime.now().year
-        if dt.year < 1900 or dt.year > ano_atual:
-            print("Ano fora do intervalo válido (1900..ano atual).")
-            return False
-        return True
-    except ValueError:
-        print("Data inválida (dia ou mês inexistente).")
-        return False
+    return _exibir_erro(validadores.validar_data(data_str))
 
 def validar_cpf(cpf: str):
-    if re.fullmatch(r"\d{11}", cpf):
-        numeros = cpf
-    elif re.fullmatch(r"\d{3}\.\d{3}\.\d{3}-\d{2}", cpf):
-        numeros = limpar_cpf(cpf)
-    else:
-        print("CPF deve estar no formato xxx.xxx.xxx-xx ou 11 dígitos.")
-        return None
-    if numeros == numeros[0] * 11:
-        print("CPF inválido (todos dígitos iguais).")
-        return None
-    def calc(seq, start):
-        soma = 0
-        fator = start
-        for d in seq:
-            soma += int(d) * fator
-            fator -= 1
-        resto = (soma * 10) % 11
-        return 0 if resto == 10 else resto
-    d1 = calc(numeros[:9], 10)
-    d2 = calc(numeros[:9] + str(d1), 11)
-    if numeros[-2:] != f"{d1}{d2}":
-        print("CPF inválido (dígitos verificadores incorretos).")
-        return None
+    numeros, erro = validadores.validar_cpf(cpf)
+    _exibir_erro(erro)
     return numeros
 
 def validar_endereco(endereco: str) -> bool:
-    end = endereco.strip()
-    if len(end) < 12:
-        print("Endereço muito curto.")
-        return False
-    padrao = r"^.+?,\s*\d+\s*-\s*.+?\s*-\s*.+?/[A-Za-z]{2}$"
-    if not re.fullmatch(padrao, end):
-        print("Use o formato: Rua X, 123 - Bairro - Cidade/UF")
+    return _exibir_erro(validadores.validar_endereco(endereco))
+
+def iniciar_persistencia(diretorio=DIRETORIO_DADOS, backend=None):
+    """Carrega o estado gravado no registro e passa a registrar as operações.
+
+    ``backend`` é uma chave de BACKENDS; sem ele vale a variável de ambiente
+    BANCO_BACKEND ou BACKEND_PADRAO.
+    """
+    global persistencia
+    backend = backend or os.environ.get("BANCO_BACKEND", BACKEND_PADRAO)
+    if backend not in BACKENDS:
+        raise ValueError(f"backend desconhecido: {backend!r} (use {', '.join(BACKENDS)})")
+    persistencia = BACKENDS[backend](diretorio)
+    persistencia.carregar(registro)
+    atexit.register(persistencia.fechar)
+
+def salvar_estado():
+    if persistencia is not None:
+        persistencia.salvar_snapshot(registro)
+
+def encerrar_persistencia():
+    global persistencia
+    if persistencia is not None:
+        persistencia.salvar_snapshot(registro)
+        persistencia.fechar()
+        persistencia = None
+
+def cadastrar_cliente(cpf_digitos: str, nome: str, data_nascimento: str, endereco: str, registrar_diario=True):
+    """Cria o cliente já validado e sua conta corrente no registro. Retorna a conta."""
+    cliente = PessoaFisica(cpf_digitos, nome.strip(), data_nascimento, endereco.strip())
+    registro.adicionar_cliente(cliente)
+    numero_conta = registro.proximo_numero_conta()
+    conta = ContaCorrente(numero_conta, AGENCIA_PADRAO, cliente, limite=LIMITE_VALOR_SAQUE, limite_saques=LIMITE_SAQUES)
+    registro.adicionar_conta(conta)
+    cliente.adicionar_conta(conta)
+    if registrar_diario and persistencia is not None:
+        persistencia.registrar_cliente(conta)
+    return conta
+
+def escolher_conta(cliente):
+    """Conta do cliente pelo número informado; com uma única conta, usa ela direto."""
+    if len(cliente.contas) == 1:
+        return cliente.contas[0]
+    bruto = input("Número da conta: ").strip()
+    if not bruto.isdecimal():
+        return None
+    return cliente.buscar_conta(int(bruto))
+
+def executar_transacao(cliente, conta, transacao, registrar_diario=True) -> bool:
+    if not cliente.realizar_transacao(conta, transacao):
         return False
+    if registrar_diario and persistencia is not None:
+        persistencia.registrar_transacao(conta, transacao)
     return True
 
 def menu_principal():
@@ -100,26 +112,13 @@ def menu_principal():
     [d] Depositar
     [s] Sacar
     [e] Extrato
+    [i] Importar clientes (CSV)
     [q] Sair
     """)
     return input("=> ").lower().strip()
 
-def parse_valor_positivo(texto: str):
-    """Converte string em float positivo validando formato (apenas dígitos e opcional , ou . para centavos).
-    Formatos aceitos: 100 | 100.5 | 100.50 | 100,5 | 100,50
-    Rejeita sinais (+/-), múltiplas vírgulas/pontos ou outros caracteres.
-    Retorna float ou None.
-    """
-    texto = texto.strip()
-    padrao = r'^\d+(?:[.,]\d{1,2})?$'
-    if not re.fullmatch(padrao, texto):
-        return None
-    valor = float(texto.replace(',', '.'))
-    if valor <= 0:
-        return None
-    return valor
-
 def main():
+    iniciar_persistencia()
     while True:
         opcao = menu_principal()
         if opcao == 'u':
@@ -135,73 +134,82 @@ def main():
                 continue
             if not validar_endereco(endereco):
                 continue
-            if encontrar_cliente_por_cpf(cpf_digitos):
+            if registro.possui_cpf(cpf_digitos):
                 print("CPF já cadastrado!")
                 continue
-            cliente = PessoaFisica(cpf_digitos, nome.strip(), data_nascimento, endereco.strip())
-            clientes.append(cliente)
-            numero_conta = len(contas) + 1
-            conta = ContaCorrente(numero_conta, AGENCIA_PADRAO, cliente, limite=LIMITE_VALOR_SAQUE, limite_saques=LIMITE_SAQUES)
-            contas.append(conta)
-            cliente.adicionar_conta(conta)
-            print(f"Usuário e conta #{numero_conta} criados com sucesso!")
+            conta = cadastrar_cliente(cpf_digitos, nome, data_nascimento, endereco)
+            print(f"Usuário e conta #{conta.numero} criados com sucesso!")
         elif opcao == 'c':
             print("\n--- CONTAS CADASTRADAS ---")
-            if not contas:
+            if not registro.contas:
                 print("Nenhuma conta cadastrada.")
             else:
-                for conta in contas:
+                for conta in registro.contas:
                     print(f"Agência: {conta.agencia} | Conta: {conta.numero} | Titular: {conta.cliente.nome} | CPF: {formatar_cpf(conta.cliente.cpf)}")
             print("--------------------------\n")
         elif opcao == 'd':
             cpf_raw = input("CPF do titular (11 dígitos ou formato): ")
             cliente = encontrar_cliente_por_cpf(cpf_raw)
-            if not cliente or not cliente.contas:
+            conta = escolher_conta(cliente) if cliente and cliente.contas else None
+            if not conta:
                 print("Cliente ou conta não encontrada!")
                 continue
-            conta = cliente.contas[-1]
             bruto = input("Valor do depósito: ")
             valor = parse_valor_positivo(bruto)
             if valor is None:
-                print("Valor inválido! Use apenas números (ex: 100 ou 100,50).")
+                print(MENSAGENS[Erro.VALOR_INVALIDO])
                 continue
-            if cliente.realizar_transacao(conta, Deposito(valor)):
+            if executar_transacao(cliente, conta, Deposito(valor)):
                 print("Depósito realizado com sucesso!")
             else:
                 print("Depósito não efetuado!")
         elif opcao == 's':
             cpf_raw = input("CPF do titular (11 dígitos ou formato): ")
             cliente = encontrar_cliente_por_cpf(cpf_raw)
-            if not cliente or not cliente.contas:
+            conta = escolher_conta(cliente) if cliente and cliente.contas else None
+            if not conta:
                 print("Cliente ou conta não encontrada!")
                 continue
-            conta = cliente.contas[-1]
             bruto = input("Valor do saque: ")
             valor = parse_valor_positivo(bruto)
             if valor is None:
-                print("Valor inválido! Use apenas números (ex: 100 ou 100,50).")
+                print(MENSAGENS[Erro.VALOR_INVALIDO])
                 continue
-            if cliente.realizar_transacao(conta, Saque(valor)):
+            if executar_transacao(cliente, conta, Saque(valor)):
                 print("Saque realizado com sucesso!")
             else:
                 print("Saque não realizado! Verifique saldo/limites.")
         elif opcao == 'e':
             cpf_raw = input("CPF do titular (11 dígitos ou formato): ")
             cliente = encontrar_cliente_por_cpf(cpf_raw)
-            if not cliente or not cliente.contas:
+            conta = escolher_conta(cliente) if cliente and cliente.contas else None
+            if not conta:
                 print("Cliente ou conta não encontrada!")
                 continue
-            conta = cliente.contas[-1]
             print("\n===== EXTRATO =====")
-            if not conta.historico.transacoes:
+            paginas = conta.historico.gerar_relatorio(tamanho=TAMANHO_PAGINA_EXTRATO)
+            pagina = next(paginas, None)
+            if pagina is None:
                 print("Não há movimentações.")
-            else:
-                for t in conta.historico.transacoes:
-                    print(f"{t['data']} - {t['tipo']}: R$ {t['valor']:.2f}")
+            while pagina is not None:
+                print("\n".join(
+                    f"{t['data'].strftime(FORMATO_DATA_HORA)} - {t['tipo']}: R$ {t['valor']:.2f}" for t in pagina
+                ))
+                pagina = next(paginas, None)
+                if pagina is not None and input("[Enter] próxima página | [q] encerrar: ").strip().lower() == 'q':
+                    break
             print(f"Saldo: R$ {conta.saldo:.2f}")
             print("===================\n")
+        elif opcao == 'i':
+            from importacao import importar_clientes
+            caminho = input("Caminho do arquivo CSV: ").strip()
+            try:
+                importar_clientes(caminho, registro, cadastrar_cliente, salvar_estado)
+            except OSError as exc:
+                print(f"Erro ao ler o arquivo. {exc}")
         elif opcao == 'q':
             print("Saindo do sistema...")
+            encerrar_persistencia()
             break
         else:
             print("Opção inválida!")
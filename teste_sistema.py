@@ -4,59 +4,60 @@ Teste das funções do sistema bancário
 
 from sistema_bancario import *
 
+CPF = "39053344705"
+
 def testar_criar_usuario():
-    print("=== Teste: Criar Usuário ===")
-    usuario = criar_usuario(
+    print("=== Teste: Criar Usuário e Conta ===")
+    conta = cadastrar_cliente(
+        CPF,
         nome="João Silva",
         data_nascimento="01/01/1990",
-        cpf="12345678901",
         endereco="Rua A, 123 - Centro - São Paulo/SP"
     )
-    print(f"Usuário criado: {usuario}")
+    print(f"Usuário criado: {conta.cliente.nome} (CPF {formatar_cpf(conta.cliente.cpf)})")
+    print(f"Conta criada: agência {conta.agencia}, número {conta.numero}")
     print()
 
-def testar_criar_conta():
-    print("=== Teste: Criar Conta ===")
-    conta = criar_conta(cpf="12345678901")
-    print(f"Conta criada: {conta}")
+def testar_listar_contas():
+    print("=== Teste: Listar Contas ===")
+    for conta in registro.contas:
+        print(f"Agência: {conta.agencia} | Conta: {conta.numero} | Titular: {conta.cliente.nome}")
     print()
 
 def testar_depositar():
     print("=== Teste: Depositar ===")
-    saldo = 100.0
-    extrato = ["Depósito inicial: R$ 100.00"]
-    novo_saldo, novo_extrato = depositar(saldo, 50.0, extrato)
-    print(f"Saldo anterior: {saldo}")
-    print(f"Novo saldo: {novo_saldo}")
-    print(f"Extrato: {novo_extrato}")
+    cliente = encontrar_cliente_por_cpf(CPF)
+    conta = cliente.contas[0]
+    saldo = conta.saldo
+    realizado = executar_transacao(cliente, conta, Deposito(Dinheiro(200_00)))
+    print(f"Depósito realizado: {realizado}")
+    print(f"Saldo anterior: {saldo:.2f}")
+    print(f"Novo saldo: {conta.saldo:.2f}")
     print()
 
 def testar_sacar():
     print("=== Teste: Sacar ===")
-    saldo = 200.0
-    extrato = ["Depósito: R$ 200.00"]
-    novo_saldo, novo_extrato = sacar(
-        saldo=saldo,
-        valor=50.0,
-        extrato=extrato,
-        limite=500.0,
-        numero_saques=0,
-        limite_saques=3
-    )
-    print(f"Saldo anterior: {saldo}")
-    print(f"Novo saldo: {novo_saldo}")
-    print(f"Extrato: {novo_extrato}")
+    cliente = encontrar_cliente_por_cpf(CPF)
+    conta = cliente.contas[0]
+    saldo = conta.saldo
+    realizado = executar_transacao(cliente, conta, Saque(Dinheiro(50_00)))
+    print(f"Saque realizado: {realizado}")
+    print(f"Saldo anterior: {saldo:.2f}")
+    print(f"Novo saldo: {conta.saldo:.2f}")
+    print(f"Saque acima do limite recusado: {not executar_transacao(cliente, conta, Saque(Dinheiro(600_00)))}")
     print()
 
 def testar_exibir_extrato():
     print("=== Teste: Exibir Extrato ===")
-    saldo = 150.0
-    extrato = ["Depósito: R$ 200.00", "Saque: R$ 50.00"]
-    exibir_extrato(saldo, extrato=extrato)
+    conta = encontrar_cliente_por_cpf(CPF).contas[0]
+    for pagina in conta.historico.gerar_relatorio(tamanho=TAMANHO_PAGINA_EXTRATO):
+        for t in pagina:
+            print(f"{t['data'].strftime(FORMATO_DATA_HORA)} - {t['tipo']}: R$ {t['valor']:.2f}")
+    print(f"Saldo: R$ {conta.saldo:.2f}")
 
 if __name__ == "__main__":
     testar_criar_usuario()
-    testar_criar_conta()
+    testar_listar_contas()
     testar_depositar()
     testar_sacar()
     testar_exibir_extrato()
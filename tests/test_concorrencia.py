@@ -0,0 +1,93 @@
+import sys
+import threading
+
+import pytest
+
+from concorrencia import ExecutorTransacoes, TravasContas
+from dinheiro import Dinheiro
+from poo_banco import Conta, ContaCorrente, Deposito, PessoaFisica, Saque, Transferencia
+
+
+@pytest.fixture
+def troca_de_threads_frequente():
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(intervalo)
+
+
+def criar_cliente():
+    return PessoaFisica("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+
+
+def test_saques_concorrentes_nao_estouram_o_saldo(troca_de_threads_frequente):
+    # Given
+    conta = Conta(1, "0001", criar_cliente())
+    conta.saldo = Dinheiro(100_00)
+
+    # When
+    with ExecutorTransacoes(max_workers=8) as executor:
+        resultados = executor.executar_todas((conta, Saque(1.0)) for _ in range(1000))
+
+    # Then
+    assert sum(resultados) == 100
+    assert conta.saldo == 0
+    assert conta.saques_realizados == 100
+    assert len(conta.historico.transacoes) == 100
+
+
+def test_limite_de_saques_respeitado_com_varias_threads(troca_de_threads_frequente):
+    # Given
+    conta = ContaCorrente(1, "0001", criar_cliente(), limite=500.0, limite_saques=3)
+    conta.saldo = Dinheiro(1_000_00)
+
+    # When
+    with ExecutorTransacoes(max_workers=8) as executor:
+        operacoes = [(conta, Saque(10.0)) for _ in range(50)] + [(conta, Deposito(5.0)) for _ in range(50)]
+        resultados = executor.executar_todas(operacoes)
+
+    # Then
+    assert sum(resultados[:50]) == 3
+    assert all(resultados[50:])
+    assert conta.saldo == Dinheiro(1_000_00 - 3 * 10_00 + 50 * 5_00)
+
+
+def test_travas_em_ordem_nao_causam_deadlock():
+    # Given
+    cliente = criar_cliente()
+    a, b = Conta(1, "0001", cliente), Conta(2, "0001", cliente)
+    travas = TravasContas(listras=64)
+
+    def cruzar(primeira, segunda):
+        for _ in range(20_000):
+            with travas.travar(primeira, segunda):
+                pass
+
+    # When
+    threads = [threading.Thread(target=cruzar, args=ordem) for ordem in ((a, b), (b, a))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    # Then
+    assert not any(thread.is_alive() for thread in threads)
+
+
+def test_transferencias_cruzadas_conservam_o_total(troca_de_threads_frequente):
+    # Given
+    cliente = criar_cliente()
+    contas = [ContaCorrente(n, "0001", cliente, limite=500.0, limite_saques=10**6) for n in (1, 2)]
+    for conta in contas:
+        conta.saldo = Dinheiro(1_000_00)
+    a, b = contas
+    operacoes = [(a, Transferencia(b, 3.0)) if i % 2 else (b, Transferencia(a, 7.0)) for i in range(4000)]
+
+    # When
+    with ExecutorTransacoes(max_workers=8) as executor:
+        resultados = executor.executar_todas(operacoes)
+
+    # Then
+    assert a.saldo + b.saldo == Dinheiro(2_000_00)
+    assert a.saldo >= 0 and b.saldo >= 0
+    assert len(a.historico.transacoes) + len(b.historico.transacoes) == 2 * sum(resultados)
@@ -0,0 +1,41 @@
+from decimal import Decimal
+
+from dinheiro import Dinheiro
+
+
+def test_igualdade_numerica_e_coerente_com_hash():
+    # Given
+    valores = [Dinheiro(100), Dinheiro(150), Dinheiro(-250), Dinheiro(0)]
+    numeros = [1, 1.5, Decimal("-2.50"), 0]
+
+    # When / Then
+    for valor, numero in zip(valores, numeros):
+        assert valor == numero
+        assert hash(valor) == hash(numero)
+    assert {Dinheiro(100): "um real"}[1] == "um real"
+    assert Dinheiro(100) != 100
+
+
+def test_igualdade_com_texto_nao_converte():
+    # Given
+    valor = Dinheiro(100)
+
+    # When / Then
+    assert valor != "abc"
+    assert valor != "1"
+    assert valor not in ["1", 2]
+    assert valor in ["1", Dinheiro(100)]
+
+
+def test_ordem_coerente_com_igualdade_para_float():
+    # Given
+    dez_centavos = Dinheiro(10)
+    convertido = Dinheiro.de(0.1)
+
+    # When / Then
+    assert dez_centavos != 0.1
+    assert (dez_centavos < 0.1) != (dez_centavos > 0.1)
+    assert (dez_centavos <= 0.1) == (dez_centavos < 0.1)
+    assert (dez_centavos >= 0.1) == (dez_centavos > 0.1)
+    assert convertido == Dinheiro(10)
+    assert Dinheiro(10) < 1 and Dinheiro(150) > 1.25 and Dinheiro(-250) <= Decimal("-2.50")
@@ -0,0 +1,82 @@
+import random
+from array import array
+
+from dinheiro import Dinheiro
+from eventos import ContaEventos, FluxoEventos
+from poo_banco import ContaCorrente, Deposito, Historico, PessoaFisica, Saque, Transferencia
+
+INICIO_NS = 1_700_000_000 * 10**9
+
+
+def criar_cliente():
+    return PessoaFisica("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+
+
+def test_conta_eventos_acompanha_conta_corrente():
+    # Given
+    cliente = criar_cliente()
+    comum = ContaCorrente(1, "0001", cliente, limite=10_000, limite_saques=50)
+    eventos = ContaEventos(2, "0001", cliente, limite=10_000, limite_saques=50, intervalo_snapshot=7)
+    aleatorio = random.Random(3)
+
+    # When
+    for _ in range(200):
+        valor = Dinheiro(aleatorio.randint(1, 50_000))
+        transacao = Deposito if aleatorio.random() < 0.6 else Saque
+        assert transacao(valor).registrar(comum) == transacao(valor).registrar(eventos)
+
+    # Then
+    assert eventos.saldo == comum.saldo
+    assert eventos.saques_realizados == comum.saques_realizados
+    assert len(eventos.historico.transacoes) == len(comum.historico.transacoes)
+
+
+def test_saldo_em_usa_apenas_eventos_ate_a_data():
+    # Given
+    conta = ContaEventos(1, "0001", criar_cliente(), intervalo_snapshot=4)
+    for indice in range(1, 11):
+        conta.historico.adicionar_transacao(Deposito(Dinheiro(indice * 100)), INICIO_NS + indice * 10**9)
+
+    # When / Then
+    assert conta.saldo_em(INICIO_NS) == Dinheiro(0)
+    assert conta.saldo_em(INICIO_NS + 5 * 10**9) == Dinheiro(1_500)
+    assert conta.saldo_em(INICIO_NS + 9 * 10**9 + 1) == Dinheiro(4_500)
+    assert conta.saldo_em(INICIO_NS + 60 * 10**9) == conta.saldo == Dinheiro(5_500)
+
+
+def test_transferencia_e_lote_viram_eventos():
+    # Given
+    cliente = criar_cliente()
+    origem = ContaEventos(1, "0001", cliente, intervalo_snapshot=3)
+    destino = ContaEventos(2, "0001", cliente, intervalo_snapshot=3)
+    origem.aplicar_lote([Deposito(Dinheiro(10_000)), Deposito(Dinheiro(5_000)), Saque(Dinheiro(2_000))])
+
+    # When
+    Transferencia(destino, Dinheiro(3_000)).registrar(origem)
+
+    # Then
+    assert origem.saldo == Dinheiro(10_000)
+    assert origem.saques_realizados == 2
+    assert destino.saldo == Dinheiro(3_000)
+    assert origem.historico.reconstruir(usar_snapshots=False) == (10_000, 2)
+
+
+def test_reconstrucao_com_e_sem_snapshots_coincidem():
+    # Given
+    aleatorio = random.Random(7)
+    quantidade = 1_000
+    codigos = [Historico.codigo_do_tipo("Deposito"), Historico.codigo_do_tipo("Saque")]
+    tipos = array("B", (aleatorio.choice(codigos) for _ in range(quantidade)))
+    valores = array("q", (aleatorio.randint(1, 10_000) for _ in range(quantidade)))
+    datas = array("q", range(INICIO_NS, INICIO_NS + quantidade))
+
+    # When
+    fluxo = FluxoEventos.de_eventos(valores, datas, tipos, intervalo_snapshot=64)
+    completo = fluxo.reconstruir(usar_snapshots=False)
+    assistido = fluxo.reconstruir()
+
+    # Then
+    sinais = [v if t == codigos[0] else -v for v, t in zip(valores, tipos)]
+    assert completo == assistido == (sum(sinais), tipos.count(codigos[1]))
+    assert len(fluxo._saldos) == quantidade // 64 + 1
+    assert fluxo.saldo_em(INICIO_NS + 499) == sum(sinais[:500])
@@ -0,0 +1,91 @@
+from datetime import datetime
+
+import pytest
+
+from dinheiro import Dinheiro
+from poo_banco import ContaCorrente, Deposito, Historico, PessoaFisica, Saque, Transferencia
+
+
+def criar_historico(quantidade, inicio_ns=1_700_000_000 * 10**9):
+    historico = Historico()
+    for indice in range(quantidade):
+        transacao = Saque(indice) if indice % 2 else Deposito(indice)
+        historico.adicionar_transacao(transacao, inicio_ns + indice * 10**9)
+    return historico
+
+
+def valores(paginas):
+    return [[t["valor"] for t in pagina] for pagina in paginas]
+
+
+def test_relatorio_paginado_sem_filtro():
+    # Given
+    historico = criar_historico(25)
+
+    # When
+    paginas = list(historico.gerar_relatorio(tamanho=10))
+
+    # Then
+    assert [len(pagina) for pagina in paginas] == [10, 10, 5]
+    assert valores(paginas)[2] == list(range(20, 25))
+
+
+def test_relatorio_comeca_na_pagina_pedida():
+    # Given
+    historico = criar_historico(25)
+
+    # When
+    paginas = list(historico.gerar_relatorio(pagina=2, tamanho=10))
+
+    # Then
+    assert valores(paginas) == [list(range(10, 20)), list(range(20, 25))]
+
+
+def test_relatorio_filtra_tipo_e_periodo():
+    # Given
+    inicio_ns = 1_700_000_000 * 10**9
+    historico = criar_historico(25, inicio_ns)
+
+    # When
+    paginas = historico.gerar_relatorio(
+        "Saque", inicio=inicio_ns + 5 * 10**9, fim=datetime.fromtimestamp(1_700_000_020), pagina=2, tamanho=3
+    )
+
+    # Then
+    assert valores(paginas) == [[11, 13, 15], [17, 19]]
+
+
+@pytest.mark.parametrize("tipo", [None, "Saque"])
+@pytest.mark.parametrize("pagina, tamanho", [(0, 10), (-1, 10), (1, 0)])
+def test_relatorio_recusa_pagina_ou_tamanho_menor_que_um(tipo, pagina, tamanho):
+    # Given
+    inicio_ns = 1_700_000_000 * 10**9
+    historico = criar_historico(25, inicio_ns)
+
+    # When / Then
+    with pytest.raises(ValueError):
+        list(historico.gerar_relatorio(tipo, inicio=inicio_ns + 10 * 10**9, pagina=pagina, tamanho=tamanho))
+
+
+def test_relatorio_de_tipo_sem_transacoes_e_vazio():
+    assert list(criar_historico(5).gerar_relatorio("Transferencia")) == []
+
+
+def test_transferencia_registra_entradas_ligadas_nas_duas_contas():
+    # Given
+    cliente = PessoaFisica("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+    origem = ContaCorrente(1, "0001", cliente, limite=100.0, limite_saques=1)
+    destino = ContaCorrente(2, "0001", cliente)
+    Deposito(500.0).registrar(origem)
+
+    # When
+    resultados = [Transferencia(destino, valor).registrar(origem) for valor in (150.0, 80.0, 20.0)]
+
+    # Then: acima do limite por saque, aceita, e recusada pelo limite de saques
+    assert resultados == [False, True, False]
+    assert (origem.saldo, destino.saldo) == (Dinheiro(420_00), Dinheiro(80_00))
+    enviada, recebida = origem.historico.transacoes[-1], destino.historico.transacoes[-1]
+    assert (enviada["tipo"], enviada["contraparte"]) == (Transferencia.ENVIADA, ("0001", 2))
+    assert (recebida["tipo"], recebida["contraparte"]) == (Transferencia.RECEBIDA, ("0001", 1))
+    assert enviada["data"] == recebida["data"]
+    assert Transferencia(origem, 10.0).registrar(origem) is False
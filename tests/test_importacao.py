@@ -0,0 +1,38 @@
+import builtins
+import runpy
+from pathlib import Path
+
+import persistencia
+from persistencia import Persistencia
+from poo_banco import RegistroClientes
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+def test_menu_importa_clientes_no_registro_do_script_e_salva(tmp_path, monkeypatch, capsys):
+    # Given
+    csv = tmp_path / "clientes.csv"
+    csv.write_text(
+        "nome,data_nascimento,cpf,endereco\n"
+        'Maria Souza Lima,10/04/1988,111.444.777-35,"Rua das Flores, 123 - Centro - São Paulo/SP"\n'
+        'Joao Silva,01/01/1990,123,"Rua A, 1 - Centro - Cidade/SP"\n',
+        encoding="utf-8",
+    )
+    respostas = iter(["i", str(csv), "c", "q"])
+    monkeypatch.setattr(builtins, "input", lambda *_: next(respostas))
+    monkeypatch.setattr(persistencia, "DIRETORIO_DADOS", tmp_path / "dados")
+    monkeypatch.delenv("BANCO_BACKEND", raising=False)
+
+    # When: como "python sistema_bancario.py", o módulo roda como __main__
+    runpy.run_path(str(RAIZ / "sistema_bancario.py"), run_name="__main__")
+
+    # Then
+    saida = capsys.readouterr().out
+    assert "1 importadas, 1 rejeitadas" in saida
+    assert "Titular: Maria Souza Lima" in saida
+    registro = RegistroClientes()
+    recarregada = Persistencia(tmp_path / "dados")
+    recarregada.carregar(registro)
+    recarregada.fechar()
+    assert registro.possui_cpf("11144477735")
+    assert [conta.cliente.nome for conta in registro.contas] == ["Maria Souza Lima"]
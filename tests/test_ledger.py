@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dinheiro import Dinheiro  # noqa: E402
+from ledger import DEPOSITO, SAQUE, LedgerEngine  # noqa: E402
+from poo_banco import Conta, ContaCorrente, Deposito, PessoaFisica, Saque  # noqa: E402
+
+
+def criar_contas(quantidade, semente):
+    aleatorio = random.Random(semente)
+    cliente = PessoaFisica("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+    contas = []
+    for numero in range(1, quantidade + 1):
+        if numero % 4 == 0:
+            conta = Conta(numero, "0001", cliente)
+        else:
+            conta = ContaCorrente(
+                numero,
+                "0001",
+                cliente,
+                limite=aleatorio.choice([100.0, 500.0, 1000.0]),
+                limite_saques=aleatorio.randint(0, 5),
+            )
+        contas.append(conta)
+    return contas
+
+
+def gerar_operacoes(quantidade_contas, quantidade, semente):
+    aleatorio = random.Random(semente)
+    operacoes = []
+    for _ in range(quantidade):
+        numero = aleatorio.randint(1, quantidade_contas)
+        tipo = aleatorio.choice([DEPOSITO, SAQUE, SAQUE])
+        valor = aleatorio.choice([-1000, 0, 10, 20, 2550, 9999, 15000, 60000, 120000])
+        operacoes.append((numero, tipo, valor))
+    return operacoes
+
+
+def aplicar_no_modelo(contas, operacoes):
+    resultados = []
+    for numero, tipo, valor in operacoes:
+        valor = Dinheiro(valor)
+        transacao = Deposito(valor) if tipo == DEPOSITO else Saque(valor)
+        resultados.append(transacao.registrar(contas[numero - 1]))
+    return resultados
+
+
+@pytest.mark.parametrize("semente", [1, 2, 3, 4, 5])
+def test_aplicar_lote_equivale_ao_modelo_de_objetos(semente):
+    # Given
+    contas_modelo = criar_contas(50, semente)
+    contas_motor = criar_contas(50, semente)
+    motor = LedgerEngine(capacidade=8)
+    vistas = [motor.vincular(conta) for conta in contas_motor]
+    operacoes = gerar_operacoes(50, 2000, semente)
+    numeros, tipos, valores = zip(*operacoes)
+
+    # When
+    esperado = aplicar_no_modelo(contas_modelo, operacoes)
+    resultados = motor.aplicar_lote(numeros, tipos, valores)
+
+    # Then
+    assert resultados.tolist() == esperado
+    assert [v.saldo for v in vistas] == [c.saldo for c in contas_modelo]
+    assert [v.saques_realizados for v in vistas] == [c.saques_realizados for c in contas_modelo]
+
+
+def test_aplicar_lote_respeita_ordem_das_operacoes_da_conta():
+    # Given
+    cliente = PessoaFisica("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+    motor = LedgerEngine()
+    vista = motor.vincular(ContaCorrente(7, "0001", cliente, limite=500.0, limite_saques=1))
+
+    # When
+    resultados = motor.aplicar_lote([7, 7, 7, 7], [SAQUE, DEPOSITO, SAQUE, SAQUE], [5000, 10000, 5000, 1000])
+
+    # Then
+    assert resultados.tolist() == [False, True, True, False]
+    assert vista.saldo == Dinheiro(5000)
+    assert vista.saques_realizados == 1
+
+
+def test_conta_ledger_registra_transacoes_do_modelo_nos_arrays():
+    # Given
+    cliente = PessoaFisica("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+    motor = LedgerEngine(capacidade=1)
+    vista = motor.vincular(ContaCorrente(3, "0001", cliente, limite=500.0, limite_saques=3))
+
+    # When
+    depositou = cliente.realizar_transacao(vista, Deposito(200.0))
+    sacou = cliente.realizar_transacao(vista, Saque(600.0))
+
+    # Then
+    assert (depositou, sacou) == (True, False)
+    assert motor.saldos[3] == 20000
+    assert len(vista.historico.transacoes) == 1
+
+
+def test_aplicar_lote_soma_depositos_repetidos_da_mesma_conta():
+    # Given
+    cliente = PessoaFisica("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+    motor = LedgerEngine()
+    vista = motor.vincular(ContaCorrente(1, "0001", cliente, limite=Dinheiro(10**9), limite_saques=10))
+    tipos = [DEPOSITO] * 1000 + [SAQUE] + [DEPOSITO] * 1000
+
+    # When
+    resultados = motor.aplicar_lote([1] * len(tipos), tipos, [100] * 1000 + [100_001] + [100] * 1000)
+
+    # Then
+    assert resultados.tolist() == [True] * 1000 + [False] + [True] * 1000
+    assert vista.saldo == Dinheiro(200_000)
+    assert vista.saques_realizados == 0
@@ -0,0 +1,197 @@
+import time
+
+import pytest
+
+from persistencia import CABECALHO, REGISTRO_DEPOSITO, Persistencia
+from poo_banco import ContaCorrente, Deposito, PessoaFisica, RegistroClientes, Saque, Transferencia
+
+
+def abrir_conta(registro, persistencia, numero, cpf, nome="Maria Souza", endereco="Rua A, 1 - Centro - Cidade/UF"):
+    cliente = PessoaFisica(cpf, nome, "10/04/1988", endereco)
+    conta = ContaCorrente(numero, "0001", cliente, limite=500.0, limite_saques=3)
+    cliente.adicionar_conta(conta)
+    registro.adicionar_cliente(cliente)
+    registro.adicionar_conta(conta)
+    persistencia.registrar_cliente(conta)
+    return conta
+
+
+def movimentar(persistencia, conta, transacao):
+    assert conta.cliente.realizar_transacao(conta, transacao)
+    persistencia.registrar_transacao(conta, transacao)
+
+
+def recarregar(diretorio):
+    registro = RegistroClientes()
+    persistencia = Persistencia(diretorio)
+    persistencia.carregar(registro)
+    return registro, persistencia
+
+
+def cadastros(registro):
+    return [(c.cpf, c.nome, c.data_nascimento, c.endereco) for c in registro.clientes]
+
+
+def estado(registro):
+    return [
+        (conta.numero, conta.cliente.cpf, conta.saldo, conta.saques_realizados, list(conta.historico.transacoes))
+        for conta in registro.contas
+    ]
+
+
+def test_diario_reaplicado_sem_snapshot(tmp_path):
+    # Given
+    registro, persistencia = recarregar(tmp_path)
+    conta = abrir_conta(registro, persistencia, 1, "39053344705")
+    movimentar(persistencia, conta, Deposito(150.25))
+    movimentar(persistencia, conta, Saque(50.0))
+    persistencia.fechar()
+
+    # When
+    recarregado, persistencia = recarregar(tmp_path)
+    persistencia.fechar()
+
+    # Then
+    assert estado(recarregado) == estado(registro)
+
+
+def test_snapshot_mais_diario(tmp_path):
+    # Given
+    registro, persistencia = recarregar(tmp_path)
+    primeira = abrir_conta(registro, persistencia, 1, "39053344705")
+    movimentar(persistencia, primeira, Deposito(100.0))
+    persistencia.salvar_snapshot(registro)
+    segunda = abrir_conta(registro, persistencia, 2, "52998224725")
+    movimentar(persistencia, segunda, Deposito(30.0))
+    movimentar(persistencia, primeira, Saque(20.0))
+    persistencia.fechar()
+
+    # When
+    recarregado, persistencia = recarregar(tmp_path)
+    persistencia.fechar()
+
+    # Then
+    assert estado(recarregado) == estado(registro)
+
+
+def test_registro_incompleto_no_fim_e_descartado(tmp_path):
+    # Given
+    registro, persistencia = recarregar(tmp_path)
+    conta = abrir_conta(registro, persistencia, 1, "39053344705")
+    movimentar(persistencia, conta, Deposito(10.0))
+    persistencia.fechar()
+    tamanho = persistencia.caminho_diario.stat().st_size
+    with open(persistencia.caminho_diario, "ab") as arquivo:
+        arquivo.write(CABECALHO.pack(REGISTRO_DEPOSITO, 24) + b"\x01\x00")
+
+    # When
+    recarregado, persistencia = recarregar(tmp_path)
+    persistencia.fechar()
+
+    # Then
+    assert estado(recarregado) == estado(registro)
+    assert persistencia.caminho_diario.stat().st_size == tamanho
+
+
+def test_diario_ja_consolidado_nao_e_reaplicado(tmp_path):
+    # Given: queda depois de gravar o snapshot e antes de zerar o diário
+    registro, persistencia = recarregar(tmp_path)
+    conta = abrir_conta(registro, persistencia, 1, "39053344705")
+    movimentar(persistencia, conta, Deposito(10.0))
+    persistencia.sincronizar()
+    diario_antigo = persistencia.caminho_diario.read_bytes()
+    persistencia.salvar_snapshot(registro)
+    persistencia.fechar()
+    persistencia.caminho_diario.write_bytes(diario_antigo)
+
+    # When
+    recarregado, persistencia = recarregar(tmp_path)
+    persistencia.fechar()
+
+    # Then
+    assert estado(recarregado) == estado(registro)
+
+
+def test_fim_de_rajada_chega_ao_disco_sem_nova_escrita(tmp_path):
+    # Given: grupo grande, então só o temporizador sincroniza o último registro
+    registro = RegistroClientes()
+    persistencia = Persistencia(tmp_path, grupo_fsync=1_000, intervalo_fsync=0.05)
+    persistencia.carregar(registro)
+    conta = abrir_conta(registro, persistencia, 1, "39053344705")
+    movimentar(persistencia, conta, Deposito(10.0))
+
+    # When
+    time.sleep(0.3)
+
+    # Then: outro leitor enxerga o diário completo com o primeiro ainda aberto
+    recarregado = RegistroClientes()
+    Persistencia(tmp_path)._reaplicar_diario(recarregado)
+    persistencia.fechar()
+    assert estado(recarregado) == estado(registro)
+
+
+def vinculadas(registro):
+    return [
+        [(indice, conta.historico.contraparte(indice)) for indice in range(len(conta.historico.transacoes))]
+        for conta in registro.contas
+    ]
+
+
+def test_transferencia_sobrevive_ao_diario_e_ao_snapshot(tmp_path):
+    # Given
+    registro, persistencia = recarregar(tmp_path)
+    origem = abrir_conta(registro, persistencia, 1, "39053344705")
+    destino = abrir_conta(registro, persistencia, 2, "11144477735")
+    movimentar(persistencia, origem, Deposito(300.0))
+    movimentar(persistencia, origem, Transferencia(destino, 120.0))
+    persistencia.fechar()
+
+    # When: primeiro só pelo diário, depois por um snapshot
+    pelo_diario, persistencia = recarregar(tmp_path)
+    persistencia.salvar_snapshot(pelo_diario)
+    persistencia.fechar()
+    pelo_snapshot, persistencia = recarregar(tmp_path)
+    persistencia.fechar()
+
+    # Then
+    for recarregado in (pelo_diario, pelo_snapshot):
+        assert estado(recarregado) == estado(registro)
+        assert vinculadas(recarregado) == vinculadas(registro)
+    assert pelo_snapshot.buscar_conta(1).historico.contraparte(1) == ("0001", 2)
+    assert pelo_snapshot.buscar_conta(2).historico.contraparte(0) == ("0001", 1)
+
+
+def test_textos_dos_clientes_sobrevivem_ao_diario_e_ao_snapshot(tmp_path):
+    # Given
+    registro, persistencia = recarregar(tmp_path)
+    abrir_conta(registro, persistencia, 1, "39053344705", "José D'Ávila Müller", "Rua Ç, 10 - Sé - São Paulo/SP")
+    abrir_conta(registro, persistencia, 2, "11144477735", "Ana Souza", "Av. B, 2 - Centro\u00a0Sul - Rio/RJ")
+    persistencia.fechar()
+
+    # When
+    pelo_diario, persistencia = recarregar(tmp_path)
+    persistencia.salvar_snapshot(pelo_diario)
+    persistencia.fechar()
+    pelo_snapshot, persistencia = recarregar(tmp_path)
+    persistencia.fechar()
+
+    # Then
+    for recarregado in (pelo_diario, pelo_snapshot):
+        assert cadastros(recarregado) == cadastros(registro)
+        assert estado(recarregado) == estado(registro)
+
+
+def test_texto_com_quebra_de_linha_nao_chega_ao_disco(tmp_path):
+    # Given
+    registro, persistencia = recarregar(tmp_path)
+    abrir_conta(registro, persistencia, 1, "39053344705")
+
+    # When / Then
+    with pytest.raises(ValueError):
+        abrir_conta(registro, persistencia, 2, "11144477735", "Ana\nSouza")
+    with pytest.raises(ValueError):
+        persistencia.salvar_snapshot(registro)
+    persistencia.fechar()
+    recarregado, persistencia = recarregar(tmp_path)
+    persistencia.fechar()
+    assert cadastros(recarregado) == cadastros(registro)[:1]
@@ -0,0 +1,49 @@
+import sistema_bancario
+from poo_banco import ContaCorrente, PessoaFisica, RegistroClientes
+
+
+def criar_cliente(cpf="39053344705"):
+    return PessoaFisica(cpf, "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+
+
+def test_busca_conta_por_agencia_e_numero():
+    # Given
+    registro = RegistroClientes()
+    cliente = criar_cliente()
+    registro.adicionar_cliente(cliente)
+    for numero, agencia in ((1, "0001"), (2, "0001"), (1, "0002")):
+        conta = ContaCorrente(numero, agencia, cliente)
+        cliente.adicionar_conta(conta)
+        registro.adicionar_conta(conta)
+
+    # When / Then
+    assert registro.buscar_conta(1).agencia == "0001"
+    assert registro.buscar_conta(1, "0002").agencia == "0002"
+    assert cliente.buscar_conta(2) is registro.buscar_conta(2)
+    assert cliente.buscar_conta(3) is None
+    assert not registro.adicionar_conta(ContaCorrente(2, "0001", cliente))
+
+
+def test_numero_de_conta_continua_apos_o_maior_numero_carregado():
+    # Given
+    registro = RegistroClientes()
+    registro.adicionar_conta(ContaCorrente(41, "0001", criar_cliente()))
+
+    # When
+    numeros = [registro.proximo_numero_conta() for _ in range(3)]
+
+    # Then
+    assert numeros == [42, 43, 44]
+
+
+def test_escolher_conta_recusa_numero_que_nao_e_decimal(monkeypatch):
+    # Given
+    cliente = criar_cliente()
+    for numero in (1, 2):
+        cliente.adicionar_conta(ContaCorrente(numero, "0001", cliente))
+    respostas = iter(["²", "2"])
+    monkeypatch.setattr("builtins.input", lambda *_: next(respostas))
+
+    # When / Then
+    assert sistema_bancario.escolher_conta(cliente) is None
+    assert sistema_bancario.escolher_conta(cliente).numero == 2
@@ -0,0 +1,128 @@
+import sqlite3
+
+import pytest
+
+import sistema_bancario
+from poo_banco import ContaCorrente, Deposito, PessoaFisica, RegistroClientes, Saque, Transferencia
+from repositorio import RepositorioMemoria
+from repositorio_sqlite import RepositorioSQLite
+
+
+def abrir_conta(registro, repositorio, numero, cpf):
+    cliente = PessoaFisica(cpf, "Maria Souza", "10/04/1988", "Rua A, 1 - Centro - Cidade/UF")
+    conta = ContaCorrente(numero, "0001", cliente, limite=500.0, limite_saques=3)
+    cliente.adicionar_conta(conta)
+    registro.adicionar_cliente(cliente)
+    registro.adicionar_conta(conta)
+    repositorio.registrar_cliente(conta)
+    return conta
+
+
+def movimentar(repositorio, conta, transacao):
+    assert conta.cliente.realizar_transacao(conta, transacao)
+    repositorio.registrar_transacao(conta, transacao)
+
+
+def recarregar(diretorio):
+    registro = RegistroClientes()
+    repositorio = RepositorioSQLite(diretorio)
+    repositorio.carregar(registro)
+    return registro, repositorio
+
+
+def estado(registro):
+    return [
+        (conta.numero, conta.cliente.cpf, conta.saldo, conta.saques_realizados, list(conta.historico.transacoes))
+        for conta in registro.contas
+    ]
+
+
+def test_sqlite_recarrega_operacoes_gravadas(tmp_path):
+    # Given
+    registro, repositorio = recarregar(tmp_path)
+    primeira = abrir_conta(registro, repositorio, 1, "39053344705")
+    segunda = abrir_conta(registro, repositorio, 2, "52998224725")
+    movimentar(repositorio, primeira, Deposito(150.25))
+    movimentar(repositorio, primeira, Saque(50.0))
+    movimentar(repositorio, primeira, Transferencia(segunda, 30.0))
+    repositorio.fechar()
+
+    # When
+    recarregado, repositorio = recarregar(tmp_path)
+    repositorio.fechar()
+
+    # Then
+    assert estado(recarregado) == estado(registro)
+    assert recarregado.buscar_conta(2).historico.transacoes[0]["contraparte"] == ("0001", 1)
+
+
+def test_sqlite_snapshot_grava_so_o_que_falta(tmp_path):
+    # Given
+    registro, repositorio = recarregar(tmp_path)
+    conta = abrir_conta(registro, repositorio, 1, "39053344705")
+    movimentar(repositorio, conta, Deposito(100.0))
+    importada = ContaCorrente(2, "0001", PessoaFisica("52998224725", "João", "01/01/1990", "Rua B, 2 - Centro - X/SP"))
+    importada.cliente.adicionar_conta(importada)
+    registro.adicionar_cliente(importada.cliente)
+    registro.adicionar_conta(importada)
+    conta.cliente.realizar_transacao(conta, Saque(10.0))
+
+    # When
+    repositorio.salvar_snapshot(registro)
+    repositorio.salvar_snapshot(registro)
+    repositorio.fechar()
+
+    # Then
+    with sqlite3.connect(tmp_path / "banco.sqlite3") as conexao:
+        assert conexao.execute("SELECT COUNT(*) FROM movimentos").fetchone() == (2,)
+        assert conexao.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    recarregado, repositorio = recarregar(tmp_path)
+    repositorio.fechar()
+    assert estado(recarregado) == estado(registro)
+
+
+def test_sqlite_gravacao_que_falha_e_refeita_na_proxima(tmp_path):
+    # Given: outra conexão segura o banco e a gravação do depósito falha
+    registro, repositorio = recarregar(tmp_path)
+    conta = abrir_conta(registro, repositorio, 1, "39053344705")
+    repositorio._conectar().execute("PRAGMA busy_timeout = 0")
+    bloqueio = sqlite3.connect(tmp_path / "banco.sqlite3", isolation_level=None)
+    bloqueio.execute("BEGIN EXCLUSIVE")
+    assert conta.cliente.realizar_transacao(conta, Deposito(100.0))
+    with pytest.raises(sqlite3.OperationalError):
+        repositorio.registrar_transacao(conta, Deposito(100.0))
+    bloqueio.execute("ROLLBACK")
+    bloqueio.close()
+
+    # When
+    repositorio.salvar_snapshot(registro)
+    repositorio.fechar()
+
+    # Then
+    recarregado, repositorio = recarregar(tmp_path)
+    repositorio.fechar()
+    assert estado(recarregado) == estado(registro)
+    assert recarregado.buscar_conta(1).saldo == 100
+
+
+def test_sistema_bancario_roda_sobre_qualquer_backend(tmp_path, monkeypatch):
+    for backend in sistema_bancario.BACKENDS:
+        # Given
+        diretorio = tmp_path / backend
+        monkeypatch.setattr(sistema_bancario, "registro", RegistroClientes())
+        sistema_bancario.iniciar_persistencia(diretorio, backend=backend)
+        conta = sistema_bancario.cadastrar_cliente("39053344705", "Maria Souza", "10/04/1988", "Rua A, 1 - X/SP")
+        assert sistema_bancario.executar_transacao(conta.cliente, conta, Deposito(80.0))
+        sistema_bancario.encerrar_persistencia()
+
+        # When
+        monkeypatch.setattr(sistema_bancario, "registro", RegistroClientes())
+        sistema_bancario.iniciar_persistencia(diretorio, backend=backend)
+        recarregada = sistema_bancario.registro.buscar_conta(conta.numero)
+        sistema_bancario.encerrar_persistencia()
+
+        # Then
+        if sistema_bancario.BACKENDS[backend] is RepositorioMemoria:
+            assert recarregada is None
+        else:
+            assert recarregada.saldo == conta.saldo
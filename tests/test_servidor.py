@@ -0,0 +1,143 @@
+import asyncio
+import threading
+
+import sistema_bancario
+from repositorio import RepositorioMemoria
+from servidor import ServidorBancario
+
+
+class RepositorioLento(RepositorioMemoria):
+    """Cada gravação espera ``liberar``, como um disco travado no fsync."""
+
+    def __init__(self):
+        self.liberar = threading.Event()
+        self.gravacoes = []
+
+    def registrar_cliente(self, conta):
+        self.liberar.wait(timeout=5)
+        self.gravacoes.append(("cliente", conta.numero))
+
+    def registrar_transacao(self, conta, transacao):
+        self.liberar.wait(timeout=5)
+        self.gravacoes.append((type(transacao).__name__, conta.numero))
+
+
+async def conversar(porta, *comandos):
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+    respostas = []
+    for campos in comandos:
+        escritor.write(("\t".join(campos) + "\n").encode("utf-8"))
+        await escritor.drain()
+        status = (await leitor.readline()).decode("utf-8").rstrip("\n").split("\t")
+        if status[0] == "OK" and campos[0] in ("c", "e"):
+            status += [(await leitor.readline()).decode("utf-8").rstrip("\n") for _ in range(int(status[1]))]
+        respostas.append(status)
+    escritor.close()
+    return respostas
+
+
+def test_sessao_cadastra_movimenta_e_emite_extrato():
+    async def cenario():
+        servidor = ServidorBancario(porta=0)
+        await servidor.iniciar()
+        try:
+            return await conversar(
+                servidor.porta,
+                ("d", "10"),
+                ("u", "Maria Souza Lima", "10/04/1988", "111.444.777-35", "Rua das Flores, 123 - Centro - São Paulo/SP"),
+                ("d", "150,50"),
+                ("s", "1000"),
+                ("s", "50"),
+                ("e",),
+                ("x",),
+                ("q",),
+            )
+        finally:
+            await servidor.encerrar()
+
+    # When
+    respostas = asyncio.run(cenario())
+
+    # Then
+    assert respostas[0][0] == "ERRO"
+    assert respostas[1][0] == "OK"
+    assert respostas[2] == ["OK", "150.50"]
+    assert respostas[3][0] == "ERRO"
+    assert respostas[4] == ["OK", "100.50"]
+    assert respostas[5][:2] == ["OK", "3"]
+    assert respostas[5][-1] == "Saldo\t100.50"
+    assert respostas[6][0] == "ERRO"
+    assert respostas[7][0] == "OK"
+
+
+def test_encerramento_fecha_sessoes_ociosas():
+    async def cenario():
+        servidor = ServidorBancario(porta=0)
+        await servidor.iniciar()
+        leitor, escritor = await asyncio.open_connection("127.0.0.1", servidor.porta)
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(servidor.encerrar(), timeout=2)
+        fim = await asyncio.wait_for(leitor.read(), timeout=2)
+        escritor.close()
+        return fim
+
+    # Then: a conexão ociosa é fechada sem esperar pelo tempo limite
+    assert asyncio.run(cenario()) == b""
+
+
+def test_entrada_malformada_responde_erro_sem_derrubar_a_sessao():
+    async def cenario():
+        servidor = ServidorBancario(porta=0)
+        await servidor.iniciar()
+        try:
+            return await conversar(
+                servidor.porta,
+                ("c", "1", "2"),
+                ("c", "²"),
+                ("u", "Maria Souza Lima", "10/04/1988", "390.533.447-05", "Rua das Flores, 123 - Centro - São Paulo/SP"),
+                ("d", "١٠٠"),
+                ("d", "10", "²"),
+                ("d", "10"),
+            )
+        finally:
+            await servidor.encerrar()
+
+    # When
+    respostas = asyncio.run(cenario())
+
+    # Then
+    assert [resposta[0] for resposta in respostas] == ["ERRO", "ERRO", "OK", "ERRO", "ERRO", "OK"]
+
+
+def test_gravacao_lenta_nao_trava_as_outras_sessoes(monkeypatch):
+    repositorio = RepositorioLento()
+    monkeypatch.setattr(sistema_bancario, "persistencia", repositorio)
+
+    async def cenario():
+        servidor = ServidorBancario(porta=0)
+        await servidor.iniciar()
+        try:
+            cadastro = asyncio.create_task(
+                conversar(
+                    servidor.porta,
+                    ("u", "Ana Souza Lima", "10/04/1988", "529.982.247-25", "Rua das Flores, 123 - Centro - São Paulo/SP"),
+                    ("d", "10"),
+                )
+            )
+            await asyncio.sleep(0.1)
+            # When: a primeira sessão espera o disco e a segunda é atendida mesmo assim
+            listagem = await asyncio.wait_for(conversar(servidor.porta, ("c",)), timeout=2)
+            pendente = not cadastro.done()
+            repositorio.liberar.set()
+            return listagem, pendente, await cadastro
+        finally:
+            await servidor.encerrar()
+
+    listagem, pendente, cadastro = asyncio.run(cenario())
+
+    # Then: a sessão só recebe o OK depois da gravação, na ordem das alterações
+    numero = sistema_bancario.registro.buscar_cliente("52998224725").contas[0].numero
+    assert listagem[0][0] == "OK"
+    assert pendente
+    assert [resposta[0] for resposta in cadastro] == ["OK", "OK"]
+    assert repositorio.gravacoes == [("cliente", numero), ("Deposito", numero)]
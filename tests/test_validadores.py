@@ -0,0 +1,40 @@
+import pytest
+
+from dinheiro import Dinheiro
+from validadores import Erro, limpar_cpf, parse_valor_positivo, validar_cpf, validar_data, validar_endereco, validar_nome
+
+
+@pytest.mark.parametrize("cpf", ["١٢٣.٤٥٦.٧٨٩-٠٠", "١٢٣٤٥٦٧٨٩٠٠", "123.456.789-0²"])
+def test_validar_cpf_com_digitos_nao_ascii_retorna_erro_de_formato(cpf):
+    # When
+    resultado = validar_cpf(cpf)
+
+    # Then
+    assert resultado == (None, Erro.CPF_FORMATO)
+
+
+@pytest.mark.parametrize("texto", ["١٠٠", "10,٥", "²"])
+def test_parse_valor_positivo_com_digitos_nao_ascii_retorna_none(texto):
+    # When / Then
+    assert parse_valor_positivo(texto) is None
+
+
+def test_validadores_aceitam_digitos_ascii():
+    # When / Then
+    assert validar_cpf("390.533.447-05") == ("39053344705", None)
+    assert parse_valor_positivo("100,50") == Dinheiro(100_50)
+    assert validar_data("١٠/٠٤/١٩٨٨") == Erro.DATA_FORMATO
+    assert limpar_cpf("390.533.447-05") == "39053344705"
+
+
+@pytest.mark.parametrize("nome", ["Maria\nSouza", "Maria Souza\r\nJoão", "Maria\x00 Souza"])
+def test_validar_nome_com_caractere_de_controle_retorna_erro(nome):
+    # When / Then
+    assert validar_nome(nome) == Erro.NOME_INVALIDO
+
+
+def test_validar_endereco_com_caractere_de_controle_retorna_erro():
+    # When / Then
+    assert validar_endereco("Rua A, 1 - Centro\n - Cidade/UF") == Erro.ENDERECO_FORMATO
+    assert validar_endereco("Rua A, 1 - Centro\t - Cidade/UF") == Erro.ENDERECO_FORMATO
+    assert validar_endereco(" Rua A, 1 - Centro - Cidade/UF\n") is None
@@ -0,0 +1,139 @@
+"""Validadores de cadastro e valores do sistema bancário.
+
+Padrões compilados uma única vez e cálculo de CPF por tabela. As funções
+não imprimem nada: devolvem um código de ``Erro`` (ou None quando o dado
+é válido) e quem chama decide como exibir, usando ``MENSAGENS``.
+"""
+
+import re
+from datetime import date
+from enum import Enum
+from operator import mul
+
+from dinheiro import Dinheiro
+
+
+class Erro(Enum):
+    NOME_VAZIO = "nome_vazio"
+    NOME_INCOMPLETO = "nome_incompleto"
+    NOME_INVALIDO = "nome_invalido"
+    DATA_FORMATO = "data_formato"
+    DATA_FORA_DO_INTERVALO = "data_fora_do_intervalo"
+    DATA_INEXISTENTE = "data_inexistente"
+    CPF_FORMATO = "cpf_formato"
+    CPF_REPETIDO = "cpf_repetido"
+    CPF_DIGITOS = "cpf_digitos"
+    ENDERECO_CURTO = "endereco_curto"
+    ENDERECO_FORMATO = "endereco_formato"
+    VALOR_INVALIDO = "valor_invalido"
+
+
+MENSAGENS = {
+    Erro.NOME_VAZIO: "Nome não pode ser vazio.",
+    Erro.NOME_INCOMPLETO: "Informe nome completo (mínimo 2 palavras).",
+    Erro.NOME_INVALIDO: "Nome contém partes inválidas.",
+    Erro.DATA_FORMATO: "Data deve estar no formato dd/mm/aaaa.",
+    Erro.DATA_FORA_DO_INTERVALO: "Ano fora do intervalo válido (1900..ano atual).",
+    Erro.DATA_INEXISTENTE: "Data inválida (dia ou mês inexistente).",
+    Erro.CPF_FORMATO: "CPF deve estar no formato xxx.xxx.xxx-xx ou 11 dígitos.",
+    Erro.CPF_REPETIDO: "CPF inválido (todos dígitos iguais).",
+    Erro.CPF_DIGITOS: "CPF inválido (dígitos verificadores incorretos).",
+    Erro.ENDERECO_CURTO: "Endereço muito curto.",
+    Erro.ENDERECO_FORMATO: "Use o formato: Rua X, 123 - Bairro - Cidade/UF",
+    Erro.VALOR_INVALIDO: "Valor inválido! Use apenas números (ex: 100 ou 100,50).",
+}
+
+# re.ASCII: \d só casa 0-9; dígitos de outros alfabetos ("١٢٣") são formato inválido, não exceção
+_NAO_DIGITO = re.compile(r"\D", re.ASCII)
+_PARTE_NOME = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ]+")
+_DATA = re.compile(r"\d{2}/\d{2}/\d{4}", re.ASCII)
+_CPF_FORMATADO = re.compile(r"\d{3}\.\d{3}\.\d{3}-\d{2}", re.ASCII)
+_ENDERECO = re.compile(r"^.+?,\s*\d+\s*-\s*.+?\s*-\s*.+?/[A-Za-z]{2}$")
+_VALOR = re.compile(r"\d+(?:[.,]\d{1,2})?", re.ASCII)
+
+# Tabelas do CPF: '0'..'9' -> 0..9 e dígito verificador pelo resto da soma por 11
+_VALOR_DIGITO = bytes.maketrans(b"0123456789", bytes(range(10)))
+_PESOS_DV1 = tuple(range(10, 1, -1))
+_PESOS_DV2 = tuple(range(11, 1, -1))
+_DV_POR_RESTO = tuple((resto * 10) % 11 % 10 for resto in range(11))
+_REPETIDOS = frozenset(str(d) * 11 for d in range(10))
+
+
+def limpar_cpf(cpf: str) -> str:
+    return _NAO_DIGITO.sub("", cpf)
+
+
+def formatar_cpf(cpf_digitos: str) -> str:
+    return f"{cpf_digitos[:3]}.{cpf_digitos[3:6]}.{cpf_digitos[6:9]}-{cpf_digitos[9:]}"
+
+
+def validar_nome(nome: str) -> Erro | None:
+    partes = nome.split()
+    if not partes:
+        return Erro.NOME_VAZIO
+    if len(partes) < 2:
+        return Erro.NOME_INCOMPLETO
+    # Quebras de linha e outros caracteres de controle não podem ir para o cadastro
+    if not nome.strip().isprintable() or not all(_PARTE_NOME.fullmatch(p) for p in partes):
+        return Erro.NOME_INVALIDO
+    return None
+
+
+def validar_data(data_str: str) -> Erro | None:
+    if not _DATA.fullmatch(data_str):
+        return Erro.DATA_FORMATO
+    try:
+        data = date(int(data_str[6:]), int(data_str[3:5]), int(data_str[:2]))
+    except ValueError:
+        return Erro.DATA_INEXISTENTE
+    if data.year < 1900 or data.year > date.today().year:
+        return Erro.DATA_FORA_DO_INTERVALO
+    return None
+
+
+def _digitos_cpf_validos(numeros: str) -> bool:
+    valores = numeros.encode("ascii").translate(_VALOR_DIGITO)
+    dv1 = _DV_POR_RESTO[sum(map(mul, valores, _PESOS_DV1)) % 11]
+    if dv1 != valores[9]:
+        return False
+    return _DV_POR_RESTO[sum(map(mul, valores, _PESOS_DV2)) % 11] == valores[10]
+
+
+def validar_cpf(cpf: str) -> tuple[str | None, Erro | None]:
+    """Retorna ``(digitos, None)`` se válido ou ``(None, erro)``."""
+    if len(cpf) == 11 and cpf.isascii() and cpf.isdigit():
+        numeros = cpf
+    elif _CPF_FORMATADO.fullmatch(cpf):
+        numeros = cpf[:3] + cpf[4:7] + cpf[8:11] + cpf[12:]
+    else:
+        return None, Erro.CPF_FORMATO
+    if numeros in _REPETIDOS:
+        return None, Erro.CPF_REPETIDO
+    if not _digitos_cpf_validos(numeros):
+        return None, Erro.CPF_DIGITOS
+    return numeros, None
+
+
+def validar_cpfs(cpfs) -> list[tuple[str | None, Erro | None]]:
+    """Versão em lote de ``validar_cpf`` para importações em massa."""
+    return list(map(validar_cpf, cpfs))
+
+
+def validar_endereco(endereco: str) -> Erro | None:
+    endereco = endereco.strip()
+    if len(endereco) < 12:
+        return Erro.ENDERECO_CURTO
+    if not endereco.isprintable() or not _ENDERECO.fullmatch(endereco):
+        return Erro.ENDERECO_FORMATO
+    return None
+
+
+def parse_valor_positivo(texto: str) -> Dinheiro | None:
+    """Converte texto (``100``, ``100.5``, ``100,50``) em Dinheiro positivo, ou None."""
+    texto = texto.strip()
+    if not _VALOR.fullmatch(texto):
+        return None
+    valor = Dinheiro.de_texto(texto)
+    if valor <= 0:
+        return None
+    return valor